@@ -0,0 +1,453 @@
+#!/usr/bin/env python3
+"""Benchmark suite for the django-docutils render pipeline.
+
+Times each hot path — parsing, writing, the TOC, sanitizing, inline code
+highlighting, the ``code-block`` directive, the ``{% rst %}`` tag and the
+template backend — against generated small, medium and large documents, and
+records the peak memory of one traced run of each. ``startup`` times a fresh
+interpreter setting Django up and importing the rendering modules, which does
+not depend on the corpus. Results are written as JSON
+so a baseline from one commit can be compared against another::
+
+    python scripts/benchmark.py --output baseline.json
+    # ... change things ...
+    python scripts/benchmark.py --compare baseline.json
+
+``--compare`` exits non-zero when a benchmark's median time or peak memory
+grows past ``--threshold`` of the baseline.
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import pathlib
+import platform
+import statistics
+import subprocess
+import sys
+import time
+import tracemalloc
+import typing as t
+
+if t.TYPE_CHECKING:
+    from collections.abc import Callable
+
+    Prepare = Callable[[str], Callable[[], object]]
+
+FORMAT_VERSION = 1
+
+DEFAULT_REPEAT = 5
+
+DEFAULT_THRESHOLD = 0.25
+
+SIZES: dict[str, int] = {
+    "small": 1,
+    "medium": 20,
+    "large": 200,
+}
+"""Corpus sizes, in sections per generated document."""
+
+STARTUP_CODE = """\
+import benchmark
+benchmark.configure_django()
+import django_docutils.template
+import django_docutils.lib.directives.code
+import django_docutils.lib.transforms.code
+"""
+"""Run in a fresh interpreter by the ``startup`` benchmark."""
+
+SECTION_RST = """\
+Section {index}
+{underline}
+
+Paragraph with **strong**, *emphasis*, a `link <https://example.com/{index}>`_,
+inline code like ``$ ls -la``, ``{{% url "home" %}}`` and ``value = {index}``,
+and a role: :pypi:`django-docutils`.
+
+- First item
+- Second item with ``len(items)``
+
+.. code-block:: python
+
+   def function_{index}(value):
+       return value * {index}
+
+Closing paragraph for section {index}.
+"""
+
+
+class BenchmarkResult(t.NamedTuple):
+    """Timing and memory of one benchmark on one corpus size."""
+
+    name: str
+    size: str
+    median_ms: float
+    min_ms: float
+    peak_kib: float
+
+    @property
+    def key(self) -> str:
+        """Return the identifier results are compared by."""
+        return f"{self.name}/{self.size}"
+
+
+def make_document(sections: int) -> str:
+    """Return a reStructuredText document with ``sections`` sections.
+
+    Examples
+    --------
+    >>> document = make_document(2)
+    >>> document.count("code-block")
+    2
+    """
+    parts = ["Benchmark\n=========\n\nSubtitle\n--------\n"]
+    parts.extend(
+        SECTION_RST.format(index=index, underline="~" * len(f"Section {index}"))
+        for index in range(sections)
+    )
+    return "\n".join(parts)
+
+
+def make_code_document(sections: int) -> str:
+    """Return a document made only of ``code-block`` directives.
+
+    Examples
+    --------
+    >>> make_code_document(3).count(".. code-block:: python")
+    3
+    """
+    return "\n".join(
+        f".. code-block:: python\n\n   def function_{index}(value):\n"
+        f"       return value * {index}\n"
+        for index in range(sections)
+    )
+
+
+def configure_django() -> None:
+    """Bootstrap Django with the roles, directives and transforms benchmarked.
+
+    Examples
+    --------
+    >>> configure_django()
+    >>> from django.conf import settings
+    >>> settings.configured
+    True
+    """
+    import django
+    from django.conf import settings
+
+    if settings.configured:
+        return
+
+    settings.configure(
+        INSTALLED_APPS=["django_docutils"],
+        TEMPLATES=[
+            {
+                "BACKEND": "django.template.backends.django.DjangoTemplates",
+                "APP_DIRS": True,
+            },
+        ],
+        DJANGO_DOCUTILS_LIB_RST={
+            "transforms": ["django_docutils.lib.transforms.code.CodeTransform"],
+            "directives": {
+                "code-block": "django_docutils.lib.directives.code.CodeBlock",
+            },
+            "roles": {
+                "local": {"pypi": "django_docutils.lib.roles.pypi.pypi_role"},
+            },
+        },
+    )
+    django.setup()
+
+
+def get_benchmarks() -> dict[str, Prepare]:
+    """Return every benchmark, by name.
+
+    Examples
+    --------
+    >>> configure_django()
+    >>> "publish_doctree" in get_benchmarks()
+    True
+    """
+    from django.template import Context, Template
+
+    from django_docutils.lib.publisher import (
+        publish_doctree,
+        publish_parts_from_doctree,
+        publish_toc_from_doctree,
+    )
+    from django_docutils.lib.sanitize import sanitize_doctree
+    from django_docutils.lib.settings import get_docutils_settings
+    from django_docutils.lib.transforms.code import CodeTransform
+    from django_docutils.lib.writers import DjangoDocutilsWriter
+    from django_docutils.template import DocutilsTemplate
+
+    def parse(source: str) -> Callable[[], object]:
+        return lambda: publish_doctree(source)
+
+    def write(source: str) -> Callable[[], object]:
+        doctree = publish_doctree(source)
+        return lambda: publish_parts_from_doctree(
+            doctree,
+            writer=DjangoDocutilsWriter(),
+        )
+
+    def toc(source: str) -> Callable[[], object]:
+        doctree = publish_doctree(source)
+        return lambda: publish_toc_from_doctree(doctree)
+
+    def sanitize(source: str) -> Callable[[], object]:
+        doctree = publish_doctree(source)
+        docutils_settings = get_docutils_settings()
+        return lambda: sanitize_doctree(doctree, docutils_settings)
+
+    def code_transform(source: str) -> Callable[[], object]:
+        doctree = publish_doctree(source)
+        return CodeTransform(doctree).apply
+
+    def code_block(source: str) -> Callable[[], object]:
+        code_source = make_code_document(source.count(".. code-block::"))
+        return lambda: publish_doctree(code_source)
+
+    def rst_tag(source: str) -> Callable[[], object]:
+        template = Template("{% load django_docutils %}{% rst content %}")
+        return lambda: template.render(Context({"content": source}))
+
+    def docutils_template(source: str) -> Callable[[], object]:
+        return DocutilsTemplate(source, {}).render
+
+    def startup(source: str) -> Callable[[], object]:
+        command = [sys.executable, "-c", STARTUP_CODE]
+        return lambda: subprocess.run(
+            command,
+            check=True,
+            cwd=pathlib.Path(__file__).parent,
+        )
+
+    return {
+        "publish_doctree": parse,
+        "publish_parts_from_doctree": write,
+        "publish_toc_from_doctree": toc,
+        "sanitize_doctree": sanitize,
+        "CodeTransform": code_transform,
+        "CodeBlock": code_block,
+        "rst_tag": rst_tag,
+        "DocutilsTemplate.render": docutils_template,
+        "startup": startup,
+    }
+
+
+def run_benchmark(
+    name: str,
+    prepare: Prepare,
+    size: str,
+    source: str,
+    repeat: int = DEFAULT_REPEAT,
+) -> BenchmarkResult:
+    """Time ``repeat`` runs of one benchmark, then trace one for peak memory.
+
+    Setup happens outside the timed region, and afresh for every run, since
+    several benchmarks mutate the doctree they are handed.
+
+    Examples
+    --------
+    >>> result = run_benchmark("noop", lambda source: lambda: None, "small", "")
+    >>> result.key, result.min_ms <= result.median_ms
+    ('noop/small', True)
+    """
+    prepare(source)()  # warm up imports and memoized settings
+
+    timings = []
+    for _ in range(repeat):
+        run = prepare(source)
+        started = time.perf_counter()
+        run()
+        timings.append((time.perf_counter() - started) * 1000)
+
+    run = prepare(source)
+    tracemalloc.start()
+    try:
+        run()
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+
+    return BenchmarkResult(
+        name=name,
+        size=size,
+        median_ms=statistics.median(timings),
+        min_ms=min(timings),
+        peak_kib=peak / 1024,
+    )
+
+
+def results_to_json(results: list[BenchmarkResult]) -> dict[str, t.Any]:
+    """Return results in the baseline file format.
+
+    Examples
+    --------
+    >>> data = results_to_json([BenchmarkResult("parse", "small", 2.0, 1.0, 8.0)])
+    >>> data["results"]["parse/small"]["median_ms"]
+    2.0
+    """
+    import django
+    import docutils
+
+    return {
+        "format": FORMAT_VERSION,
+        "meta": {
+            "python": platform.python_version(),
+            "django": django.get_version(),
+            "docutils": docutils.__version__,
+        },
+        "results": {
+            result.key: {
+                "median_ms": round(result.median_ms, 4),
+                "min_ms": round(result.min_ms, 4),
+                "peak_kib": round(result.peak_kib, 2),
+            }
+            for result in results
+        },
+    }
+
+
+def compare(
+    baseline: dict[str, t.Any],
+    current: dict[str, t.Any],
+    threshold: float = DEFAULT_THRESHOLD,
+) -> list[str]:
+    """Return a message for each benchmark that regressed past ``threshold``.
+
+    Benchmarks missing from either side are not compared.
+
+    Examples
+    --------
+    >>> baseline = {"results": {"parse/small": {"median_ms": 10, "peak_kib": 100}}}
+    >>> current = {"results": {"parse/small": {"median_ms": 14, "peak_kib": 100}}}
+    >>> compare(baseline, current, threshold=0.25)
+    ['parse/small: median_ms 10 -> 14 (+40%)']
+    >>> compare(baseline, baseline)
+    []
+    """
+    regressions = []
+    for key, result in current["results"].items():
+        previous = baseline["results"].get(key)
+        if previous is None:
+            continue
+        for metric in ("median_ms", "peak_kib"):
+            before, after = previous[metric], result[metric]
+            if before > 0 and after > before * (1 + threshold):
+                change = (after - before) / before
+                regressions.append(
+                    f"{key}: {metric} {before} -> {after} ({change:+.0%})",
+                )
+    return regressions
+
+
+def parse_args(argv: t.Sequence[str] | None = None) -> argparse.Namespace:
+    """Return parsed CLI arguments for the benchmark runner.
+
+    Examples
+    --------
+    >>> parse_args(["--size", "small"]).sizes
+    ['small']
+    >>> parse_args([]).repeat
+    5
+    """
+    parser = argparse.ArgumentParser(
+        description="Benchmark the django-docutils render pipeline.",
+    )
+    parser.add_argument(
+        "--size",
+        dest="sizes",
+        action="append",
+        choices=sorted(SIZES),
+        help="Corpus size to run, repeatable (defaults to all).",
+    )
+    parser.add_argument(
+        "--benchmark",
+        dest="benchmarks",
+        action="append",
+        help="Benchmark to run, repeatable (defaults to all).",
+    )
+    parser.add_argument(
+        "--repeat",
+        type=int,
+        default=DEFAULT_REPEAT,
+        help=f"Timed runs per benchmark (defaults to {DEFAULT_REPEAT}).",
+    )
+    parser.add_argument(
+        "--output",
+        type=pathlib.Path,
+        help="Write results as JSON to this file.",
+    )
+    parser.add_argument(
+        "--compare",
+        type=pathlib.Path,
+        help="Baseline JSON file to compare results against.",
+    )
+    parser.add_argument(
+        "--threshold",
+        type=float,
+        default=DEFAULT_THRESHOLD,
+        help=(
+            "Fractional slowdown or memory growth counted as a regression "
+            f"(defaults to {DEFAULT_THRESHOLD})."
+        ),
+    )
+    return parser.parse_args(argv)
+
+
+def main(argv: t.Sequence[str] | None = None) -> int:
+    """Entry point for the benchmark suite.
+
+    Returns
+    -------
+    int
+        ``0``, or ``1`` when ``--compare`` found regressions.
+
+    Examples
+    --------
+    >>> main(["--size", "small", "--benchmark", "publish_doctree", "--repeat", "1"])
+    publish_doctree/small ...
+    0
+    """
+    args = parse_args(argv)
+    configure_django()
+
+    benchmarks = get_benchmarks()
+    names = args.benchmarks or list(benchmarks)
+    unknown = sorted(set(names) - set(benchmarks))
+    if unknown:
+        sys.stderr.write(f"unknown benchmarks: {', '.join(unknown)}\n")
+        return 2
+
+    results = []
+    for size in args.sizes or list(SIZES):
+        source = make_document(SIZES[size])
+        for name in names:
+            result = run_benchmark(name, benchmarks[name], size, source, args.repeat)
+            results.append(result)
+            sys.stdout.write(
+                f"{result.key:<40} {result.median_ms:10.3f} ms "
+                f"(min {result.min_ms:.3f}) {result.peak_kib:10.1f} KiB peak\n",
+            )
+
+    data = results_to_json(results)
+    if args.output is not None:
+        args.output.write_text(json.dumps(data, indent=2) + "\n", encoding="utf-8")
+
+    if args.compare is not None:
+        baseline = json.loads(args.compare.read_text(encoding="utf-8"))
+        regressions = compare(baseline, data, args.threshold)
+        for regression in regressions:
+            sys.stderr.write(f"regression: {regression}\n")
+        if regressions:
+            return 1
+
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,56 @@
+"""Tests for the render pipeline benchmark script."""
+
+from __future__ import annotations
+
+import json
+import typing as t
+
+import benchmark
+import pytest
+
+if t.TYPE_CHECKING:
+    import pathlib
+
+
+@pytest.mark.parametrize("name", list(benchmark.get_benchmarks()))
+def test_benchmark_runs(name: str) -> None:
+    """Every benchmark runs on the small corpus and reports sane numbers."""
+    result = benchmark.run_benchmark(
+        name,
+        benchmark.get_benchmarks()[name],
+        "small",
+        benchmark.make_document(benchmark.SIZES["small"]),
+        repeat=1,
+    )
+
+    assert result.median_ms >= 0
+    assert result.peak_kib > 0
+
+
+def test_baseline_round_trip(tmp_path: pathlib.Path) -> None:
+    """A written baseline compares clean against a run with a loose threshold."""
+    baseline = tmp_path / "baseline.json"
+    argv = ["--size", "small", "--benchmark", "sanitize_doctree", "--repeat", "1"]
+
+    assert benchmark.main([*argv, "--output", str(baseline)]) == 0
+    data = json.loads(baseline.read_text(encoding="utf-8"))
+    assert set(data["results"]) == {"sanitize_doctree/small"}
+
+    assert (
+        benchmark.main([*argv, "--compare", str(baseline), "--threshold", "1e9"]) == 0
+    )
+
+
+def test_compare_flags_memory_regressions() -> None:
+    """Peak memory growth counts as a regression too."""
+    baseline = {"results": {"parse/small": {"median_ms": 1.0, "peak_kib": 10.0}}}
+    current = {"results": {"parse/small": {"median_ms": 1.0, "peak_kib": 20.0}}}
+
+    assert benchmark.compare(baseline, current) == [
+        "parse/small: peak_kib 10.0 -> 20.0 (+100%)",
+    ]
+
+
+def test_unknown_benchmark_is_rejected() -> None:
+    """Misspelled benchmark names fail instead of running nothing."""
+    assert benchmark.main(["--benchmark", "nope"]) == 2
@@ -0,0 +1,137 @@
+"""Run renders off the event loop, for ASGI deployments.
+
+Publishing is CPU-bound, synchronous work. Called from an async view it blocks
+the event loop, and wrapped in :func:`asgiref.sync.sync_to_async` it queues on
+the one thread Django runs thread-sensitive code in, so a burst of heavy
+renders stalls every other request on the worker.
+:func:`run_in_render_executor` hands renders to a dedicated, bounded thread
+pool instead::
+
+    DJANGO_DOCUTILS_LIB_RST = {
+        "async_render": {
+            "max_workers": 4,  #: renders running at once, the rest queue
+        },
+    }
+
+The pool is rebuilt when settings change; renders already submitted finish on
+the old one. Work on the pool closes stale database connections before and
+after it runs, as Django does around each request, so roles querying the
+database don't leave connections open on the pool's threads. The
+``apublish_*`` coroutines in :mod:`django_docutils.lib.publisher` and the
+``Async*View`` classes are built on it.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import contextvars
+import functools
+import threading
+import typing as t
+from concurrent.futures import ThreadPoolExecutor
+
+from django.db import close_old_connections
+
+from .settings import DJANGO_DOCUTILS_LIB_RST, get_settings_generation
+
+if t.TYPE_CHECKING:
+    from collections.abc import AsyncIterator, Callable, Iterator
+
+P = t.ParamSpec("P")
+R = t.TypeVar("R")
+
+DEFAULT_MAX_WORKERS: t.Final = 4
+"""Renders run at once when ``async_render`` settings don't name a limit."""
+
+_executor: tuple[int, ThreadPoolExecutor] | None = None
+_executor_lock = threading.Lock()
+
+
+def get_render_executor() -> ThreadPoolExecutor:
+    """Return the thread pool renders are offloaded to.
+
+    Built once per settings generation, with
+    ``DJANGO_DOCUTILS_LIB_RST["async_render"]["max_workers"]`` threads.
+
+    Examples
+    --------
+    >>> get_render_executor() is get_render_executor()
+    True
+    >>> get_render_executor()._max_workers
+    4
+    """
+    global _executor
+    generation = get_settings_generation()
+    with _executor_lock:
+        if _executor is not None and _executor[0] == generation:
+            return _executor[1]
+
+        if _executor is not None:
+            _executor[1].shutdown(wait=False)
+        async_settings = DJANGO_DOCUTILS_LIB_RST.get("async_render", {})
+        executor = ThreadPoolExecutor(
+            max_workers=async_settings.get("max_workers", DEFAULT_MAX_WORKERS),
+            thread_name_prefix="django-docutils-render",
+        )
+        _executor = (generation, executor)
+        return executor
+
+
+def _run_closing_connections(func: Callable[[], R]) -> R:
+    close_old_connections()
+    try:
+        return func()
+    finally:
+        close_old_connections()
+
+
+async def run_in_render_executor(
+    func: Callable[P, R],
+    *args: P.args,
+    **kwargs: P.kwargs,
+) -> R:
+    """Return ``func(*args, **kwargs)``, run on the render executor.
+
+    The caller's context variables are carried over, so stage timings
+    collected around the call include the render. Stale database connections
+    of the executor thread are closed before and after ``func`` runs.
+
+    Examples
+    --------
+    >>> import asyncio
+    >>> asyncio.run(run_in_render_executor(sum, [1, 2, 3]))
+    6
+    """
+    loop = asyncio.get_running_loop()
+    context = contextvars.copy_context()
+    return await loop.run_in_executor(
+        get_render_executor(),
+        functools.partial(
+            context.run,
+            _run_closing_connections,
+            functools.partial(func, *args, **kwargs),
+        ),
+    )
+
+
+async def aiter_in_render_executor(iterator: Iterator[R]) -> AsyncIterator[R]:
+    """Yield the items of ``iterator``, each produced on the render executor.
+
+    Lets lazily translated HTML, e.g.
+    :attr:`~django_docutils.lib.publisher.StreamedDocument.chunks`, stream from
+    async views without producing it on the event loop.
+
+    Examples
+    --------
+    >>> import asyncio
+    >>> async def collect():
+    ...     return [item async for item in aiter_in_render_executor(iter("ab"))]
+    >>> asyncio.run(collect())
+    ['a', 'b']
+    """
+    done = object()
+    while True:
+        item = await run_in_render_executor(next, iterator, done)
+        if item is done:
+            return
+        yield t.cast("R", item)
@@ -0,0 +1,241 @@
+"""Rendered-output cache for Django Docutils.
+
+Rendering reStructuredText is a pure function of the source, the rendering
+flags, and the project's docutils configuration. When
+``DJANGO_DOCUTILS_LIB_RST["cache"]`` is set, rendered output is stored in
+Django's cache framework, keyed on a digest of all three, so a hit skips
+docutils entirely::
+
+    DJANGO_DOCUTILS_LIB_RST = {
+        "cache": {
+            "alias": "default",  #: django.core.cache.caches alias
+            "timeout": 60 * 60,  #: seconds, None caches forever
+            "key_prefix": "django_docutils",
+        },
+    }
+
+Any settings change moves the configuration fingerprint on, so entries
+rendered under old settings are never served again.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import typing as t
+
+from django.conf import settings
+from django.core.cache import caches
+from django.utils.encoding import force_bytes
+
+from django_docutils.__about__ import __version__
+
+from .settings import (
+    DJANGO_DOCUTILS_LIB_RST,
+    get_allowed_uri_schemes,
+    get_docutils_settings,
+    get_settings_generation,
+    settings_fingerprint,
+    unsafe_docutils_settings_allowed,
+)
+
+if t.TYPE_CHECKING:
+    from collections.abc import Callable
+
+    from django.core.cache.backends.base import BaseCache
+
+T = t.TypeVar("T")
+
+DEFAULT_KEY_PREFIX: t.Final = "django_docutils"
+"""Cache key prefix used when the cache settings don't name one."""
+
+_render_fingerprint: tuple[int, str] | None = None
+
+
+def get_render_fingerprint() -> str:
+    """Return a digest of every setting that can change rendered output.
+
+    Covers the resolved docutils settings, the registered roles, directives
+    and writer transforms, the URI scheme policy, ``ALLOWED_HOSTS`` (used to
+    classify links), and the package version. The digest is memoized until
+    :func:`~django_docutils.lib.settings.reload_settings` fires.
+
+    Returns
+    -------
+    str
+        Hex digest identifying the current rendering configuration.
+
+    Examples
+    --------
+    >>> get_render_fingerprint() == get_render_fingerprint()
+    True
+    """
+    global _render_fingerprint
+    generation = get_settings_generation()
+    if _render_fingerprint is not None and _render_fingerprint[0] == generation:
+        return _render_fingerprint[1]
+
+    fingerprint = settings_fingerprint(
+        {
+            "version": __version__,
+            "docutils": get_docutils_settings(),
+            "roles": DJANGO_DOCUTILS_LIB_RST.get("roles", {}),
+            "directives": DJANGO_DOCUTILS_LIB_RST.get("directives", {}),
+            "transforms": DJANGO_DOCUTILS_LIB_RST.get("transforms", []),
+            "allowed_uri_schemes": sorted(get_allowed_uri_schemes()),
+            "unsafe": unsafe_docutils_settings_allowed(),
+            "allowed_hosts": list(settings.ALLOWED_HOSTS),
+        },
+    )
+    _render_fingerprint = (generation, fingerprint)
+    return fingerprint
+
+
+def get_render_cache() -> BaseCache | None:
+    """Return the Django cache rendered output is stored in, if enabled.
+
+    Returns
+    -------
+    django.core.cache.backends.base.BaseCache or None
+        Cache named by ``DJANGO_DOCUTILS_LIB_RST["cache"]["alias"]``, or
+        ``None`` when rendered-output caching is not configured.
+
+    Examples
+    --------
+    >>> get_render_cache() is None
+    True
+    """
+    cache_settings = DJANGO_DOCUTILS_LIB_RST.get("cache")
+    if cache_settings is None:
+        return None
+    return caches[cache_settings.get("alias", "default")]
+
+
+def make_render_cache_key(
+    kind: str,
+    source: str | bytes,
+    **flags: object,
+) -> str:
+    """Return the cache key for one rendering of ``source``.
+
+    Parameters
+    ----------
+    kind : str
+        Name of the rendering, so different outputs of one source never
+        collide.
+    source : str or bytes
+        reStructuredText content.
+    **flags : object
+        Rendering flags that change the output, e.g. ``show_title``.
+
+    Returns
+    -------
+    str
+        Cache key; sources and flags are digested so keys stay short.
+
+    Examples
+    --------
+    >>> key = make_render_cache_key("html", "Hello", show_title=True)
+    >>> key.startswith("django_docutils:html:")
+    True
+    >>> key == make_render_cache_key("html", "Hello", show_title=False)
+    False
+    """
+    cache_settings = DJANGO_DOCUTILS_LIB_RST.get("cache", {})
+    key_prefix = cache_settings.get("key_prefix", DEFAULT_KEY_PREFIX)
+    source_digest = hashlib.sha256(force_bytes(source)).hexdigest()
+    flags_digest = settings_fingerprint(flags)[:16]
+    fingerprint = get_render_fingerprint()[:32]
+    return f"{key_prefix}:{kind}:{fingerprint}:{flags_digest}:{source_digest}"
+
+
+def cached_render(
+    kind: str,
+    source: str | bytes,
+    render: Callable[[], T],
+    **flags: object,
+) -> T:
+    """Return ``render()``, served from the rendered-output cache when enabled.
+
+    Parameters
+    ----------
+    kind : str
+        Name of the rendering, see :func:`make_render_cache_key`.
+    source : str or bytes
+        reStructuredText content ``render`` renders.
+    render : callable
+        Zero-argument callable producing the output on a cache miss.
+    **flags : object
+        Rendering flags that change the output.
+
+    Returns
+    -------
+    object
+        Cached or freshly rendered output. ``None`` results are cached too.
+
+    Examples
+    --------
+    >>> cached_render("html", "Hello", lambda: "<p>Hello</p>")
+    '<p>Hello</p>'
+    """
+    cache = get_render_cache()
+    if cache is None:
+        return render()
+
+    key = make_render_cache_key(kind, source, **flags)
+    # Wrapped in a 1-tuple so a cached ``None`` is told apart from a miss.
+    hit = cache.get(key)
+    if hit is not None:
+        return t.cast("T", hit[0])
+
+    result = render()
+    _store(cache, key, result)
+    return result
+
+
+def store_rendered(
+    kind: str,
+    source: str | bytes,
+    result: object,
+    **flags: object,
+) -> bool:
+    """Store output rendered elsewhere, e.g. ahead of time, in the cache.
+
+    Later :func:`cached_render` calls with the same ``kind``, ``source`` and
+    ``flags`` are served ``result`` without rendering.
+
+    Parameters
+    ----------
+    kind : str
+        Name of the rendering, see :func:`make_render_cache_key`.
+    source : str or bytes
+        reStructuredText content ``result`` was rendered from.
+    result : object
+        Rendered output.
+    **flags : object
+        Rendering flags ``result`` was rendered with.
+
+    Returns
+    -------
+    bool
+        ``False`` when rendered-output caching is not configured.
+
+    Examples
+    --------
+    >>> store_rendered("html", "Hello", "<p>Hello</p>")
+    False
+    """
+    cache = get_render_cache()
+    if cache is None:
+        return False
+
+    _store(cache, make_render_cache_key(kind, source, **flags), result)
+    return True
+
+
+def _store(cache: BaseCache, key: str, result: object) -> None:
+    """Store ``result`` under ``key`` with the configured timeout."""
+    cache_settings = DJANGO_DOCUTILS_LIB_RST.get("cache", {})
+    if "timeout" in cache_settings:
+        cache.set(key, (result,), cache_settings["timeout"])
+    else:
+        cache.set(key, (result,))
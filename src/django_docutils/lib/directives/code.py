@@ -38,15 +38,14 @@ to get all the gory details.
 
 from __future__ import annotations
 
+import functools
 import re
 import typing as t
 
 from docutils import nodes
 from docutils.parsers.rst import Directive, directives
-from pygments import highlight
-from pygments.formatters.html import HtmlFormatter
-from pygments.lexers import get_lexer_by_name
-from pygments.lexers.special import TextLexer
+
+from django_docutils.lib.highlight import get_lexer, highlight_code
 
 if t.TYPE_CHECKING:
     from collections.abc import Callable
@@ -71,8 +70,29 @@ def patch_bash_session_lexer() -> None:
 INLINESTYLES = False
 
 
-#: The default formatter
-DEFAULT = HtmlFormatter(cssclass="highlight code-block", noclasses=INLINESTYLES)
+@functools.cache
+def get_default_formatter() -> Formatter[str]:
+    """Return the default formatter, importing Pygments on first use.
+
+    Also available as the module attribute ``DEFAULT``.
+
+    Examples
+    --------
+    >>> get_default_formatter().cssclass
+    'highlight code-block'
+    """
+    from pygments.formatters.html import HtmlFormatter
+
+    return HtmlFormatter(cssclass="highlight code-block", noclasses=INLINESTYLES)
+
+
+def __getattr__(name: str) -> t.Any:
+    """Resolve ``DEFAULT``, the default formatter, on first access."""
+    if name == "DEFAULT":
+        return get_default_formatter()
+    msg = f"module {__name__!r} has no attribute {name!r}"
+    raise AttributeError(msg)
+
 
 #: Add name -> formatter pairs for every variant you want to use
 VARIANTS: dict[str, Formatter[str]] = {
@@ -100,13 +120,15 @@ class CodeBlock(Directive):
         try:
             lexer_name = self.arguments[0]
 
-            lexer = get_lexer_by_name(lexer_name)
+            lexer = get_lexer(lexer_name)
         except ValueError:
             # no lexer found - use the text one instead of an exception
-            lexer = TextLexer()
+            lexer = get_lexer("text")
         # take an arbitrary option if more than one is given
-        formatter = (self.options and VARIANTS[next(iter(self.options))]) or DEFAULT
-        parsed = highlight("\n".join(self.content), lexer, formatter)
+        formatter = (
+            self.options and VARIANTS[next(iter(self.options))]
+        ) or get_default_formatter()
+        parsed = highlight_code("\n".join(self.content), lexer, formatter)
         raw_node = nodes.raw("", parsed, format="html")
         raw_node["django_docutils_trusted_raw"] = True
         return [raw_node]
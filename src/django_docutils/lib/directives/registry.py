@@ -2,10 +2,24 @@
 
 from __future__ import annotations
 
+import types
+import typing as t
+
 from django.utils.module_loading import import_string
 from docutils.parsers.rst import directives
 
-from django_docutils.lib.settings import DJANGO_DOCUTILS_LIB_RST
+from django_docutils.lib.settings import (
+    DJANGO_DOCUTILS_LIB_RST,
+    get_settings_generation,
+)
+
+if t.TYPE_CHECKING:
+    from collections.abc import Mapping
+
+    from docutils.parsers.rst import Directive
+
+_directive_table: tuple[int, Mapping[str, type[Directive]]] | None = None
+_registered_generation: int | None = None
 
 
 def register_django_docutils_directives() -> None:
@@ -20,11 +34,42 @@ def register_django_docutils_directives() -> None:
     ...        'code-block': 'django_docutils.lib.directives.code.CodeBlock'
     ...    }
     ... }
+
+    Directives come from the table :func:`get_django_docutils_directives`
+    resolves once per settings generation, and are written back into docutils'
+    process-wide registry on every call, undoing replacements made since.
     """
-    if not DJANGO_DOCUTILS_LIB_RST:
+    global _registered_generation
+    generation = get_settings_generation()
+    directive_table = get_django_docutils_directives()
+    if _registered_generation == generation:
+        directives._directives.update(directive_table)  # type:ignore[attr-defined]
         return
 
-    if "directives" in DJANGO_DOCUTILS_LIB_RST:
+    for dir_name, class_ in directive_table.items():
+        directives.register_directive(dir_name, class_)
+    _registered_generation = generation
+
+
+def get_django_docutils_directives() -> Mapping[str, type[Directive]]:
+    """Return the configured directive classes, imported once per settings generation.
+
+    Examples
+    --------
+    >>> get_django_docutils_directives() is get_django_docutils_directives()
+    True
+    >>> get_django_docutils_directives()["code-block"]
+    <class 'django_docutils.lib.directives.code.CodeBlock'>
+    """
+    global _directive_table
+    generation = get_settings_generation()
+    if _directive_table is not None and _directive_table[0] == generation:
+        return _directive_table[1]
+
+    directive_classes: dict[str, type[Directive]] = {}
+    if DJANGO_DOCUTILS_LIB_RST and "directives" in DJANGO_DOCUTILS_LIB_RST:
         for dir_name, dir_cls_str in DJANGO_DOCUTILS_LIB_RST["directives"].items():
-            class_ = import_string(dir_cls_str)
-            directives.register_directive(dir_name, class_)
+            directive_classes[dir_name] = import_string(dir_cls_str)
+    directive_table = types.MappingProxyType(directive_classes)
+    _directive_table = (generation, directive_table)
+    return directive_table
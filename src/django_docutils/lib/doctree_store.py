@@ -0,0 +1,194 @@
+"""Persistent on-disk store of parsed doctrees.
+
+Parsing is the most expensive stage of rendering. When
+``DJANGO_DOCUTILS_LIB_RST["doctree_store"]`` is set,
+:func:`~django_docutils.lib.publisher.publish_doctree` keeps every document it
+parses in a directory, one pickle per source and configuration, and loads it
+from there instead of parsing again, across processes and restarts::
+
+    DJANGO_DOCUTILS_LIB_RST = {
+        "doctree_store": {
+            "path": BASE_DIR / "var" / "doctrees",
+        },
+    }
+
+Files are written to a temporary name and moved into place, so processes
+sharing the directory never read a partial file. Doctrees are unpickled, so the
+directory must only be writable by the application.
+
+Doctrees are stored after every transform has run, including
+:class:`~django_docutils.lib.transforms.remote_url.RemoteUrlTransform`: titles
+and URLs looked up by a
+:class:`~django_docutils.lib.roles.remote.RemoteUrlResolver` are kept with the
+document, without expiry, and the resolver's ``ttl`` has no effect on stored
+documents. Clear the directory when remote data changes.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import os
+import pathlib
+import pickle
+import tempfile
+import typing as t
+
+import docutils
+from django.utils.encoding import force_bytes
+from docutils import nodes, utils
+from docutils.transforms import Transformer
+
+from .cache import get_render_fingerprint
+from .settings import (
+    DJANGO_DOCUTILS_LIB_RST,
+    get_docutils_settings,
+    get_settings_generation,
+    settings_fingerprint,
+)
+
+if t.TYPE_CHECKING:
+    from docutils import frontend
+
+    from django_docutils._internal.types import StrPath
+
+FORMAT_VERSION: t.Final = 1
+"""Bumped when the stored layout changes, so old files are never loaded."""
+
+_doctree_store: tuple[int, DoctreeStore | None] | None = None
+
+
+class DoctreeStore:
+    """Directory of pickled doctrees, keyed by source and configuration.
+
+    Parameters
+    ----------
+    path : str or os.PathLike
+        Directory holding the store; created on first write.
+
+    Examples
+    --------
+    >>> import tempfile
+    >>> from django_docutils.lib.publisher import publish_doctree
+    >>> store = DoctreeStore(tempfile.mkdtemp())
+    >>> doctree = publish_doctree("Hello **world**")
+    >>> key = store.make_key("Hello **world**")
+    >>> store.save(key, doctree)
+    >>> store.load(key, doctree.settings).astext()
+    'Hello world'
+    """
+
+    def __init__(self, path: StrPath) -> None:
+        self.path = pathlib.Path(path)
+
+    def make_key(
+        self,
+        source: str | bytes,
+        settings_overrides: t.Mapping[str, object] | None = None,
+    ) -> str:
+        """Return the key ``source`` parses under with the current settings.
+
+        The key covers the source, the resolved docutils settings, the
+        registered roles and directives, and the package and docutils
+        versions, so any change that could alter the parse misses.
+        """
+        configuration = settings_fingerprint(
+            {
+                "format": FORMAT_VERSION,
+                "render": get_render_fingerprint(),
+                "docutils_version": docutils.__version__,
+                "docutils": get_docutils_settings(settings_overrides),
+            },
+        )
+        source_digest = hashlib.sha256(force_bytes(source)).hexdigest()
+        return hashlib.sha256(
+            f"{configuration}:{source_digest}".encode(),
+        ).hexdigest()
+
+    def get_file(self, key: str) -> pathlib.Path:
+        """Return the file a key is stored in, fanned out by key prefix."""
+        return self.path / key[:2] / f"{key}.pickle"
+
+    def load(
+        self,
+        key: str,
+        settings: frontend.Values,
+    ) -> nodes.document | None:
+        """Return the doctree stored under ``key``, or ``None`` on a miss.
+
+        Unreadable, corrupt, or foreign files count as misses. The loaded
+        document gets ``settings`` and a fresh reporter and transformer, as a
+        newly parsed document would have.
+        """
+        try:
+            with self.get_file(key).open("rb") as fp:
+                document = pickle.load(fp)
+        except Exception:  # noqa: BLE001 - corrupt pickles raise nearly anything
+            return None
+        if not isinstance(document, nodes.document):
+            return None
+
+        document.settings = settings
+        document.reporter = utils.new_reporter(document.get("source", ""), settings)
+        document.transformer = Transformer(document)
+        return document
+
+    def save(self, key: str, document: nodes.document) -> None:
+        """Store ``document`` under ``key`` atomically.
+
+        The reporter, transformer, and settings are left out: they hold
+        streams and component references, and :meth:`load` rebuilds them.
+        Documents that cannot be pickled, and directories that cannot be
+        written to, are not stored: the next :meth:`load` misses.
+        """
+        detached = (document.settings, document.reporter, document.transformer)
+        document.settings = document.reporter = document.transformer = None  # type:ignore[assignment]
+        try:
+            data = pickle.dumps(document, pickle.HIGHEST_PROTOCOL)
+        except (pickle.PicklingError, TypeError, AttributeError):
+            return
+        finally:
+            document.settings, document.reporter, document.transformer = detached
+
+        file = self.get_file(key)
+        temp_name = None
+        try:
+            file.parent.mkdir(parents=True, exist_ok=True)
+            with tempfile.NamedTemporaryFile(
+                dir=file.parent,
+                prefix=f".{key}.",
+                delete=False,
+            ) as fp:
+                temp_name = fp.name
+                fp.write(data)
+            os.replace(temp_name, file)
+            temp_name = None
+        except OSError:
+            return
+        finally:
+            if temp_name is not None:
+                pathlib.Path(temp_name).unlink(missing_ok=True)
+
+
+def get_doctree_store() -> DoctreeStore | None:
+    """Return the configured doctree store, if any.
+
+    Returns
+    -------
+    DoctreeStore or None
+        Store at ``DJANGO_DOCUTILS_LIB_RST["doctree_store"]["path"]``, or
+        ``None`` when no store is configured.
+
+    Examples
+    --------
+    >>> get_doctree_store() is None
+    True
+    """
+    global _doctree_store
+    generation = get_settings_generation()
+    if _doctree_store is not None and _doctree_store[0] == generation:
+        return _doctree_store[1]
+
+    store_settings = DJANGO_DOCUTILS_LIB_RST.get("doctree_store")
+    store = None if store_settings is None else DoctreeStore(store_settings["path"])
+    _doctree_store = (generation, store)
+    return store
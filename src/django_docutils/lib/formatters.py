@@ -0,0 +1,79 @@
+"""Pygments formatters for rendering highlighted code into docutils output.
+
+Importing this module imports Pygments' HTML formatter, so the code directive
+and transform only import it when they first highlight something.
+"""
+
+from __future__ import annotations
+
+import typing as t
+from collections.abc import Iterable, Iterator
+
+from pygments.formatters.html import HtmlFormatter
+from pygments.token import Token, _TokenType
+
+TokenStream = Iterable[tuple[_TokenType, str]]
+TokenGenerator = Iterator[tuple[str | int, str]]
+
+
+class InlineHtmlFormatter(HtmlFormatter):  # type:ignore
+    """HTMLFormatter for inline codeblocks."""
+
+    def format_unencoded(self, tokensource: TokenStream, outfile: t.Any) -> None:
+        r"""Trim inline element of space and newlines.
+
+        1. Trailing newline: Final token generated returns ``(Token.Other, '\n')``
+           results in a blank space ``<span class="x"></span>``.
+
+           This would be unnoticeable for a code block, but as this is inline, it looks
+           strange. Let's filter out any trailing newlines from token source, then
+           fallback to the normal process by passing it back into parent class method.
+        2. Trailing space:
+
+           *After* this method ``_format_lines`` still adds a ``\n`` (which renders as a
+           space again in the browser). To suppress that pass ``lineseparator=''`` to
+           the ``InlineHtmlFormatter`` class.
+        """
+
+        def filter_trailing_newline(source: TokenStream) -> TokenStream:
+            tokens = list(source)
+
+            # filter out the trailing newline token
+            if tokens[-1] == (Token.Text, "\n"):
+                del tokens[-1]
+
+            return ((t, v) for t, v in tokens)
+
+        source = filter_trailing_newline(tokensource)
+
+        return super().format_unencoded(source, outfile)
+
+    def _wrap_div(
+        self,
+        inner: TokenStream,
+    ) -> TokenGenerator | TokenStream:
+        styles = []
+        if (
+            self.noclasses
+            and not self.nobackground
+            and self.style.background_color is not None
+        ):
+            styles.append(f"background: {self.style.background_color}")
+        if self.cssstyles:
+            styles.append(self.cssstyles)
+        style = "; ".join(styles)
+
+        yield (
+            0,
+            (
+                "<span"
+                + (f' class="{self.cssclass}"' if self.cssclass else "")
+                + (f' style="{style}"' if style else "")
+                + ">"
+            ),
+        )
+        yield from inner
+        yield 0, "</span>\n"
+
+    def _wrap_pre(self, inner: TokenStream) -> TokenStream:
+        yield from inner
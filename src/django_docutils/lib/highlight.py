@@ -0,0 +1,241 @@
+"""Shared cache of Pygments highlighting results.
+
+Highlighting is a pure function of the code, the lexer, and the formatter
+options, and pages with many code samples spend most of their render time in
+Pygments. :func:`highlight_code` serves both the ``code-block`` directive
+(:mod:`django_docutils.lib.directives.code`) and inline literals
+(:mod:`django_docutils.lib.transforms.code`) from a bounded in-process LRU,
+backed by Django's cache framework when
+``DJANGO_DOCUTILS_LIB_RST["highlight_cache"]`` is set::
+
+    DJANGO_DOCUTILS_LIB_RST = {
+        "highlight_cache": {
+            "alias": "default",  #: django.core.cache.caches alias
+            "timeout": 60 * 60 * 24,  #: seconds, None caches forever
+            "key_prefix": "django_docutils",
+        },
+    }
+
+The shared tier lets every worker process reuse highlighting done by any of
+them. :func:`highlight_cache_info` reports hits and misses of both tiers.
+"""
+
+from __future__ import annotations
+
+import functools
+import hashlib
+import threading
+import typing as t
+
+from django.core.cache import caches
+
+from .settings import DJANGO_DOCUTILS_LIB_RST, settings_fingerprint
+
+if t.TYPE_CHECKING:
+    from django.core.cache.backends.base import BaseCache
+    from pygments.formatter import Formatter
+    from pygments.lexer import Lexer
+
+HIGHLIGHT_CACHE_MAXSIZE: t.Final = 1024
+"""Highlighted snippets the in-process tier keeps."""
+
+LEXER_CACHE_MAXSIZE: t.Final = 128
+"""Lexer names :func:`get_lexer` keeps an instance for."""
+
+DEFAULT_KEY_PREFIX: t.Final = "django_docutils"
+"""Cache key prefix used when the highlight cache settings don't name one."""
+
+_highlights: dict[str, str] = {}
+_highlights_lock = threading.Lock()
+_counters = {"hits": 0, "shared_hits": 0, "misses": 0}
+
+
+class HighlightCacheInfo(t.NamedTuple):
+    """Counters of the highlight cache, see :func:`highlight_cache_info`."""
+
+    hits: int
+    shared_hits: int
+    misses: int
+    currsize: int
+    maxsize: int
+
+
+def get_lexer(name: str) -> Lexer:
+    """Return a shared lexer instance for a Pygments lexer name or alias.
+
+    Pygments and its lexer are imported on first use. Lexers hold no state
+    between highlights, so one instance per name serves every caller. Names
+    come from document content; Pygments ignores their case, and so does the
+    bounded cache of instances.
+
+    Raises
+    ------
+    pygments.util.ClassNotFound
+        No lexer is registered under ``name``.
+
+    Examples
+    --------
+    >>> get_lexer("python") is get_lexer("python")
+    True
+    >>> type(get_lexer("py3")).__name__
+    'PythonLexer'
+    >>> get_lexer(" Python") is get_lexer("python")
+    True
+    """
+    return _get_lexer(name.strip().lower())
+
+
+@functools.lru_cache(maxsize=LEXER_CACHE_MAXSIZE)
+def _get_lexer(name: str) -> Lexer:
+    from pygments.lexers import get_lexer_by_name
+
+    return get_lexer_by_name(name)
+
+
+def get_highlight_cache() -> BaseCache | None:
+    """Return the Django cache shared highlighting is stored in, if enabled.
+
+    Returns
+    -------
+    django.core.cache.backends.base.BaseCache or None
+        Cache named by ``DJANGO_DOCUTILS_LIB_RST["highlight_cache"]["alias"]``,
+        or ``None`` when only the in-process tier is used.
+
+    Examples
+    --------
+    >>> get_highlight_cache() is None
+    True
+    """
+    cache_settings = DJANGO_DOCUTILS_LIB_RST.get("highlight_cache")
+    if cache_settings is None:
+        return None
+    return caches[cache_settings.get("alias", "default")]
+
+
+def make_highlight_key(code: str, lexer: Lexer, formatter: Formatter[str]) -> str:
+    """Return the digest ``code`` highlighted by ``lexer`` and ``formatter`` has.
+
+    Covers the lexer and formatter classes and options and the Pygments
+    version. Shell session lexers also contribute their prompt pattern, which
+    :func:`~django_docutils.lib.directives.code.patch_bash_session_lexer`
+    changes process-wide.
+
+    Examples
+    --------
+    >>> from pygments.formatters.html import HtmlFormatter
+    >>> from pygments.lexers.python import PythonLexer
+    >>> key = make_highlight_key("pass", PythonLexer(), HtmlFormatter())
+    >>> key == make_highlight_key("pass", PythonLexer(), HtmlFormatter())
+    True
+    >>> key == make_highlight_key("pass", PythonLexer(), HtmlFormatter(linenos=True))
+    False
+    """
+    import pygments
+
+    prompt = getattr(lexer, "_ps1rgx", None)
+    options = settings_fingerprint(
+        {
+            "pygments": pygments.__version__,
+            "lexer": [
+                f"{type(lexer).__module__}.{type(lexer).__qualname__}",
+                lexer.options,
+                None if prompt is None else prompt.pattern,
+            ],
+            "formatter": [
+                f"{type(formatter).__module__}.{type(formatter).__qualname__}",
+                formatter.options,
+            ],
+        },
+    )
+    return hashlib.sha256(f"{options}:{code}".encode()).hexdigest()
+
+
+def highlight_code(code: str, lexer: Lexer, formatter: Formatter[str]) -> str:
+    """Return :func:`pygments.highlight` output, from the cache when possible.
+
+    Examples
+    --------
+    >>> from pygments.formatters.html import HtmlFormatter
+    >>> from pygments.lexers.python import PythonLexer
+    >>> clear_highlight_cache()
+    >>> html = highlight_code("pass", PythonLexer(), HtmlFormatter())
+    >>> html == highlight_code("pass", PythonLexer(), HtmlFormatter())
+    True
+    >>> info = highlight_cache_info()
+    >>> info.hits, info.misses
+    (1, 1)
+    """
+    key = make_highlight_key(code, lexer, formatter)
+    with _highlights_lock:
+        html = _highlights.pop(key, None)
+        if html is not None:
+            _highlights[key] = html  # most recently used goes last
+            _counters["hits"] += 1
+            return html
+
+    cache = get_highlight_cache()
+    shared_key = ""
+    if cache is not None:
+        cache_settings = DJANGO_DOCUTILS_LIB_RST.get("highlight_cache", {})
+        key_prefix = cache_settings.get("key_prefix", DEFAULT_KEY_PREFIX)
+        shared_key = f"{key_prefix}:highlight:{key}"
+        html = cache.get(shared_key)
+
+    if html is not None:
+        counter = "shared_hits"
+    else:
+        import pygments
+
+        counter = "misses"
+        html = pygments.highlight(code, lexer, formatter)
+        if cache is not None:
+            _store(cache, shared_key, html)
+
+    with _highlights_lock:
+        _counters[counter] += 1
+        _highlights[key] = html
+        while len(_highlights) > HIGHLIGHT_CACHE_MAXSIZE:
+            del _highlights[next(iter(_highlights))]
+    return html
+
+
+def highlight_cache_info() -> HighlightCacheInfo:
+    """Return hit and miss counts of the highlight cache in this process.
+
+    ``hits`` were served in-process, ``shared_hits`` from the Django cache
+    tier, and ``misses`` ran Pygments.
+
+    Examples
+    --------
+    >>> clear_highlight_cache()
+    >>> highlight_cache_info()
+    HighlightCacheInfo(hits=0, shared_hits=0, misses=0, currsize=0, maxsize=1024)
+    """
+    with _highlights_lock:
+        return HighlightCacheInfo(
+            hits=_counters["hits"],
+            shared_hits=_counters["shared_hits"],
+            misses=_counters["misses"],
+            currsize=len(_highlights),
+            maxsize=HIGHLIGHT_CACHE_MAXSIZE,
+        )
+
+
+def clear_highlight_cache() -> None:
+    """Empty the in-process tier and reset the counters.
+
+    The Django cache tier is left alone; its entries expire on their own.
+    """
+    with _highlights_lock:
+        _highlights.clear()
+        for counter in _counters:
+            _counters[counter] = 0
+
+
+def _store(cache: BaseCache, key: str, html: str) -> None:
+    """Store ``html`` under ``key`` with the configured timeout."""
+    cache_settings = DJANGO_DOCUTILS_LIB_RST.get("highlight_cache", {})
+    if "timeout" in cache_settings:
+        cache.set(key, html, cache_settings["timeout"])
+    else:
+        cache.set(key, html)
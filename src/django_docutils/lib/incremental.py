@@ -0,0 +1,706 @@
+r"""Incremental re-rendering of documents edited a section at a time.
+
+:func:`publish_document_incremental` splits reStructuredText source at its
+top-level section titles, the boundaries
+:func:`~django_docutils.lib.utils.find_root_sections` walks in a doctree, and
+publishes each chunk on its own. Rendered chunks are kept in a bounded
+in-process LRU keyed by their source, so after an edit only the sections that
+changed are parsed and written again; the others are reused and stitched back
+together, the table of contents rebuilt from every chunk.
+
+References between chunks are resolved by handing each chunk the targets the
+others define. A document that cannot be split faithfully is published whole,
+exactly as :func:`~django_docutils.lib.publisher.publish_document_from_source`
+would: e.g. one using ``.. contents::`` or ``.. sectnum::``, whose chunks
+report problems, or whose chunks would generate the same ids.
+"""
+
+from __future__ import annotations
+
+import collections
+import hashlib
+import re
+import string
+import threading
+import typing as t
+
+from django.utils.safestring import mark_safe
+from docutils import nodes, utils
+from docutils.parsers import rst
+from docutils.readers import standalone
+from docutils.transforms import parts, references
+from docutils.writers import null
+
+from .cache import make_render_cache_key
+from .metadata.extract import extract_metadata, extract_subtitle, extract_title
+from .publisher import (
+    PublishedDocument,
+    publish_doctree,
+    publish_document_from_source,
+    publish_parts_from_doctree,
+    publish_toc_from_doctree,
+)
+from .settings import get_docutils_settings, get_docutils_settings_values
+from .writers import DjangoDocutilsWriter
+
+if t.TYPE_CHECKING:
+    from collections.abc import Iterable, Mapping, Sequence
+
+INCREMENTAL_CACHE_MAXSIZE: t.Final = 512
+"""Rendered chunks the in-process cache keeps."""
+
+XREF_SCHEME: t.Final = "django-docutils-xref:"
+"""URI scheme of targets injected for sections defined in another chunk."""
+
+DOCUMENT_TRANSFORMS: t.Final = (parts.Contents, parts.SectNum, references.TargetNotes)
+"""Transforms whose output depends on the whole document.
+
+A chunk they ran on is never stitched; the document is published whole.
+"""
+
+_DIRECTIVE_RE = re.compile(r"\.\.\s+[\w:.+-]+::")
+_TARGET_RE = re.compile(r"\.\.\s+_(`[^`]+`|[^`:]+):(\s|$)")
+_TOC_ID_RE = re.compile(r"reference-\d+")
+
+_chunks: dict[str, RenderedChunk] = {}
+_tocs: dict[str, str | None] = {}
+_chunks_lock = threading.Lock()
+
+
+class SourceChunks(t.NamedTuple):
+    """reStructuredText source split by :func:`split_source_sections`.
+
+    Attributes
+    ----------
+    head : str
+        Source before the first top-level section: the document title,
+        subtitle, docinfo, and introduction.
+    sections : tuple[str, ...]
+        Source of each top-level section, in document order.
+    """
+
+    head: str
+    sections: tuple[str, ...]
+
+
+class RenderedChunk(t.NamedTuple):
+    """One chunk of a document, published on its own.
+
+    Attributes
+    ----------
+    prefix : str
+        HTML before the body: the opening tag, title, subtitle, and docinfo.
+        Only used from the head chunk.
+    body : str
+        HTML of the chunk's content.
+    suffix : str
+        HTML after the body. Only used from the head chunk.
+    ids : frozenset[str]
+        Every id in the chunk's doctree.
+    anchors : frozenset[str]
+        Ids rendered into the HTML: ``ids``, less those of external targets.
+    targets : dict[str, str]
+        URI of each hyperlink target the chunk defines, by name. Sections and
+        other internal targets use :data:`XREF_SCHEME`.
+    names : frozenset[str]
+        Names the chunk defines, hyperlink targets or not.
+    references : frozenset[str]
+        Names the chunk references.
+    unresolved : frozenset[str]
+        Names the chunk references but does not define.
+    sections : tuple[docutils.nodes.section, ...]
+        Top-level sections, reduced to their titles and subsections, for the
+        table of contents.
+    outline : str
+        Digest of ``sections``: chunks with equal outlines contribute equal
+        table of contents entries.
+    title : str or None
+        First plain-text title in the chunk.
+    subtitle : str or None
+        First plain-text subtitle in the chunk.
+    metadata : dict[str, str]
+        Unprocessed docinfo fields; only a head chunk has them.
+    safe : bool
+        Whether stitching the chunk reproduces what publishing the whole
+        document renders, as far as the chunk alone can tell.
+    """
+
+    prefix: str
+    body: str
+    suffix: str
+    ids: frozenset[str]
+    anchors: frozenset[str]
+    targets: dict[str, str]
+    names: frozenset[str]
+    references: frozenset[str]
+    unresolved: frozenset[str]
+    sections: tuple[nodes.section, ...]
+    outline: str
+    title: str | None
+    subtitle: str | None
+    metadata: dict[str, str]
+    safe: bool
+
+
+def split_source_sections(
+    source: str,
+    doctitle_xform: bool = True,
+) -> SourceChunks | None:
+    r"""Split reStructuredText source at its top-level section titles.
+
+    Titles are recognized by their adornment, as the parser does. A title
+    (and a subtitle) the parser would promote to the document title stays in
+    the head. Hyperlink targets right above a section title start its chunk,
+    as they point at the section.
+
+    Parameters
+    ----------
+    source : str
+        reStructuredText content.
+    doctitle_xform : bool
+        Whether a lone top-level title is promoted to the document title, the
+        docutils setting of the same name.
+
+    Returns
+    -------
+    SourceChunks or None
+        The head and top-level sections, or ``None`` when a chunk's title
+        styles would be leveled differently on their own, or the split can't
+        be told from the source alone.
+
+    Examples
+    --------
+    >>> source = "Title\n=====\n\nIntro\n\nOne\n---\n\nText\n\nTwo\n---\n\nText\n"
+    >>> chunks = split_source_sections(source)
+    >>> chunks.head
+    'Title\n=====\n\nIntro\n\n'
+    >>> chunks.sections
+    ('One\n---\n\nText\n\n', 'Two\n---\n\nText\n')
+    >>> "".join([chunks.head, *chunks.sections]) == source
+    True
+    >>> split_source_sections("No sections")
+    SourceChunks(head='No sections', sections=())
+    """
+    lines = source.splitlines(keepends=True)
+    titles = _find_titles(lines)
+    styles = list(dict.fromkeys(style for _, _, style in titles))
+    counts = collections.Counter(style for _, _, style in titles)
+
+    # A lone title is promoted to the document title, and a lone title right
+    # below it to the subtitle, when nothing but invisible markup precedes
+    # them. Both stay in the head.
+    level = 0
+    previous_end = 0
+    while doctitle_xform and level < min(len(titles), 2):
+        start, end, style = titles[level]
+        if counts[style] != 1:
+            break
+        preceding = _is_prebibliographic(lines[previous_end:start])
+        if preceding is None:
+            return None
+        if not preceding:
+            break
+        previous_end = end
+        level += 1
+
+    if level >= len(styles):
+        return SourceChunks(source, ())
+
+    split_style = styles[level]
+    starts = [start for start, _, style in titles if style == split_style]
+    ends = [*starts[1:], len(lines)]
+    for start, end in zip(starts, ends, strict=True):
+        chunk_styles = list(
+            dict.fromkeys(
+                style for title_start, _, style in titles if start <= title_start < end
+            ),
+        )
+        if chunk_styles != styles[level : level + len(chunk_styles)]:
+            return None
+
+    # Targets right above a title point at its section: keep them with it.
+    bounds = [previous_end, *(end for _, end, style in titles if style == split_style)]
+    starts = [
+        _carry_targets(lines, start, bound)
+        for start, bound in zip(starts, bounds, strict=False)
+    ]
+    ends = [*starts[1:], len(lines)]
+    return SourceChunks(
+        head="".join(lines[: starts[0]]),
+        sections=tuple(
+            "".join(lines[start:end]) for start, end in zip(starts, ends, strict=True)
+        ),
+    )
+
+
+def _carry_targets(lines: Sequence[str], start: int, bound: int) -> int:
+    """Return where the chunk titled at ``start`` begins, targets included.
+
+    Hyperlink targets (and the blank lines between them) directly above the
+    title, down to line ``bound``, are moved into the chunk.
+    """
+    begin = start
+    index = start
+    while True:
+        while index > bound and not lines[index - 1].strip():
+            index -= 1
+        block_end = index
+        while index > bound and lines[index - 1].strip():
+            index -= 1
+        block = lines[index:block_end]
+        if (
+            not block
+            or not all(_TARGET_RE.match(line) or line[0].isspace() for line in block)
+            or not _TARGET_RE.match(block[0])
+        ):
+            return begin
+        begin = index
+
+
+def _adornment(line: str) -> str | None:
+    """Return the character ``line`` repeats, if it is a title adornment."""
+    stripped = line.rstrip()
+    if (
+        not stripped
+        or stripped[0] not in string.punctuation
+        or stripped != stripped[0] * len(stripped)
+    ):
+        return None
+    return stripped[0]
+
+
+def _find_titles(lines: Sequence[str]) -> list[tuple[int, int, tuple[str, bool]]]:
+    """Return start line, end line, and style of each column-zero title.
+
+    A style is the adornment character and whether the title has an overline.
+    """
+    titles: list[tuple[int, int, tuple[str, bool]]] = []
+    index = 0
+    while index + 1 < len(lines):
+        line = lines[index]
+        if index > 0 and lines[index - 1].strip():
+            index += 1
+            continue
+
+        char = _adornment(line)
+        if char is not None:
+            if (
+                index + 2 < len(lines)
+                and lines[index + 1].strip()
+                and _adornment(lines[index + 1]) is None
+                and _adornment(lines[index + 2]) == char
+            ):
+                titles.append((index, index + 3, (char, True)))
+                index += 3
+                continue
+        elif line.strip() and not line[0].isspace() and not line.startswith(".."):
+            underline = lines[index + 1].rstrip()
+            char = _adornment(underline)
+            if char is not None and (
+                len(underline) >= len(line.rstrip()) or len(underline) >= 4
+            ):
+                titles.append((index, index + 2, (char, False)))
+                index += 2
+                continue
+        index += 1
+    return titles
+
+
+def _is_prebibliographic(lines: Iterable[str]) -> bool | None:
+    """Return whether ``lines`` hold only markup the title may follow.
+
+    That is blank lines, comments, hyperlink targets, and substitution
+    definitions, as for :class:`docutils.transforms.frontmatter.DocTitle`.
+    ``None`` means it can't be told without parsing: directives may or may
+    not leave nodes behind.
+    """
+    in_explicit = False
+    directive = False
+    for line in lines:
+        if not line.strip():
+            continue
+        if line[0].isspace():
+            if not in_explicit:
+                return False
+            continue
+        if not line.startswith("..") or line.startswith((".. [", "..[")):
+            return False
+        in_explicit = True
+        directive = directive or _DIRECTIVE_RE.match(line) is not None
+    return None if directive else True
+
+
+def render_chunk(
+    source: str,
+    head: bool = False,
+    targets: Mapping[str, str] | None = None,
+) -> RenderedChunk:
+    r"""Publish one chunk of a document, with targets other chunks define.
+
+    Parameters
+    ----------
+    source : str
+        reStructuredText of the chunk.
+    head : bool
+        Whether the chunk is a document head, whose title may be promoted.
+        Section chunks are published with ``doctitle_xform`` off.
+    targets : mapping, optional
+        URI of hyperlink targets defined elsewhere, by name. References to
+        :data:`XREF_SCHEME` URIs are rendered as internal links.
+
+    Returns
+    -------
+    RenderedChunk
+        HTML and the cross-reference and TOC data of the chunk.
+
+    Examples
+    --------
+    >>> chunk = render_chunk("Two\n---\n\nBack to One_.\n")
+    >>> sorted(chunk.unresolved), chunk.safe
+    (['one'], False)
+    >>> chunk = render_chunk(
+    ...     "Two\n---\n\nBack to One_.\n",
+    ...     targets={"one": XREF_SCHEME + "one"},
+    ... )
+    >>> '<a class="reference internal" href="#one">One</a>' in chunk.body
+    True
+    >>> chunk.targets, chunk.safe
+    ({'two': 'django-docutils-xref:two'}, True)
+    """
+    targets = dict(targets or {})
+    injected = "".join(f".. _`{name}`: {uri}\n" for name, uri in targets.items())
+    doctree = publish_doctree(
+        f"{source}\n\n{injected}" if injected else source,
+        # Problems are reported by the whole publish chunks fall back to.
+        settings_overrides=(
+            {"warning_stream": False}
+            if head
+            else {"doctitle_xform": False, "warning_stream": False}
+        ),
+    )
+
+    for target in list(doctree.findall(nodes.target)):
+        if targets.keys() & set(target["names"]):
+            target.parent.remove(target)
+    for element in doctree.findall(nodes.Element):
+        refuri = element.get("refuri", "")
+        if isinstance(element, (nodes.reference, nodes.target)) and refuri.startswith(
+            XREF_SCHEME,
+        ):
+            del element["refuri"]
+            element["refid"] = refuri[len(XREF_SCHEME) :]
+
+    ids: set[str] = set()
+    anchors: set[str] = set()
+    for node in doctree.findall(nodes.Element):
+        ids.update(node["ids"])
+        if not (isinstance(node, nodes.target) and "refuri" in node):
+            anchors.update(node["ids"])
+    defined: dict[str, str] = {}
+    for name, node_id in doctree.nameids.items():
+        defining = doctree.ids.get(node_id) if node_id else None
+        if name in targets or defining is None:
+            continue
+        if isinstance(defining, (nodes.footnote, nodes.citation)) or (
+            isinstance(defining, nodes.target) and "refname" in defining
+        ):
+            # Footnotes aren't hyperlink targets; unresolved aliases are
+            # exported once the chunk is rendered with what they point to.
+            continue
+        if isinstance(defining, nodes.target) and "refuri" in defining:
+            defined[name] = defining["refuri"]
+        elif isinstance(defining, nodes.target) and "refid" in defining:
+            defined[name] = XREF_SCHEME + defining["refid"]
+        else:
+            defined[name] = XREF_SCHEME + node_id
+
+    names = frozenset(doctree.nameids.keys() - targets.keys())
+    references = frozenset(doctree.refnames)
+    unresolved = frozenset(
+        name for name in references if doctree.nameids.get(name) is None
+    )
+    if unresolved or not _renders_alone(doctree, ids):
+        # Only needed for its targets: rendered again with the missing ones,
+        # or the document is published whole.
+        return RenderedChunk(
+            prefix="",
+            body="",
+            suffix="",
+            ids=frozenset(ids),
+            anchors=frozenset(anchors),
+            targets=defined,
+            names=names,
+            references=references,
+            unresolved=unresolved,
+            sections=(),
+            outline="",
+            title=None,
+            subtitle=None,
+            metadata={},
+            safe=False,
+        )
+
+    writer = DjangoDocutilsWriter(parts=["fragment"])
+    doctree.transformer.apply_transforms()
+    publish_parts_from_doctree(doctree, writer=writer)
+
+    top_sections = [
+        child for child in doctree.children if isinstance(child, nodes.section)
+    ]
+    skeletons = tuple(_section_skeleton(section) for section in top_sections)
+    if head:
+        structured = not any(True for _ in doctree.findall(nodes.section))
+    else:
+        # Targets carried above the title point into the section, which
+        # renders their ids; the targets themselves render nothing.
+        visible = [
+            child
+            for child in doctree.children
+            if not (isinstance(child, nodes.target) and "refid" in child)
+        ]
+        structured = len(visible) == 1 and len(top_sections) == 1
+
+    # Pieces of ``html_body``, as docutils' HTML writers assemble it.
+    output: t.Any = writer
+    return RenderedChunk(
+        prefix="".join(
+            output.body_prefix[1:] + output.body_pre_docinfo + output.docinfo,
+        ),
+        body="".join(output.body),
+        suffix="".join(output.body_suffix[:-1]),
+        ids=frozenset(ids),
+        anchors=frozenset(anchors),
+        targets=defined,
+        names=names,
+        references=references,
+        unresolved=unresolved,
+        sections=skeletons,
+        outline=hashlib.sha256(
+            "".join(skeleton.pformat() for skeleton in skeletons).encode(),
+        ).hexdigest(),
+        title=extract_title(doctree),
+        subtitle=extract_subtitle(doctree),
+        metadata=extract_metadata(doctree),
+        safe=structured,
+    )
+
+
+def _renders_alone(doctree: nodes.document, ids: Iterable[str]) -> bool:
+    """Return whether ``doctree`` renders as it would within its document.
+
+    Checked before the writer pass, while the transforms the reader applied
+    are still known: chunks reporting problems, e.g. a substitution defined
+    in another chunk, may not survive it.
+    """
+    if any(
+        issubclass(applied[1], DOCUMENT_TRANSFORMS)
+        for applied in doctree.transformer.applied
+    ):
+        return False
+    for node in doctree.findall(nodes.Element):
+        if isinstance(node, (nodes.system_message, nodes.problematic, nodes.pending)):
+            return False
+    # The TOC numbers its entries from the document's counter.
+    return not any(_TOC_ID_RE.fullmatch(node_id) for node_id in ids)
+
+
+def _section_skeleton(section: nodes.section) -> nodes.section:
+    """Return a copy of ``section`` holding only its title and subsections."""
+    skeleton = section.copy()
+    skeleton += section[0].deepcopy()
+    for child in section.children[1:]:
+        if isinstance(child, nodes.section):
+            skeleton += _section_skeleton(child)
+    # Let the chunk's doctree go once its rendering is cached.
+    for node in skeleton.findall(nodes.Element):
+        node.document = None  # type:ignore[assignment]
+    return skeleton
+
+
+def get_rendered_chunk(
+    source: str,
+    head: bool = False,
+    targets: Mapping[str, str] | None = None,
+) -> RenderedChunk:
+    r"""Return :func:`render_chunk` output, from the in-process cache if possible.
+
+    Entries are keyed by the chunk's source, the injected targets, and the
+    render fingerprint, so settings changes never serve stale chunks.
+
+    Examples
+    --------
+    >>> clear_chunk_cache()
+    >>> chunk = get_rendered_chunk("One\n---\n\nText\n")
+    >>> get_rendered_chunk("One\n---\n\nText\n") is chunk
+    True
+    """
+    key = make_render_cache_key(
+        "chunk",
+        source,
+        head=head,
+        targets=sorted((targets or {}).items()),
+    )
+    with _chunks_lock:
+        chunk = _chunks.pop(key, None)
+        if chunk is not None:
+            _chunks[key] = chunk  # most recently used goes last
+            return chunk
+
+    chunk = render_chunk(source, head=head, targets=targets)
+    with _chunks_lock:
+        _chunks[key] = chunk
+        while len(_chunks) > INCREMENTAL_CACHE_MAXSIZE:
+            del _chunks[next(iter(_chunks))]
+    return chunk
+
+
+def clear_chunk_cache() -> None:
+    """Forget every rendered chunk and table of contents kept in this process."""
+    with _chunks_lock:
+        _chunks.clear()
+        _tocs.clear()
+
+
+def publish_document_incremental(source: str) -> PublishedDocument:
+    r"""Return every rendering of a document, re-publishing only edited chunks.
+
+    Produces what :func:`~django_docutils.lib.publisher.publish_document_from_source`
+    does. Top-level sections are published separately and cached by their
+    source, with references between them resolved and the table of contents
+    built from all of them. Documents that can't be split faithfully are
+    published whole, without the cache.
+
+    Parameters
+    ----------
+    source : str
+        reStructuredText content.
+
+    Returns
+    -------
+    PublishedDocument
+        Every rendering of the document.
+
+    Examples
+    --------
+    >>> source = (
+    ...     "Title\n=====\n\nSee `Two`_.\n\n"
+    ...     "One\n---\n\nText\n\nTwo\n---\n\nBack to One_.\n"
+    ... )
+    >>> document = publish_document_incremental(source)
+    >>> document == publish_document_from_source(source)
+    True
+    >>> edited = source.replace("Back to", "Return to")
+    >>> publish_document_incremental(edited) == publish_document_from_source(edited)
+    True
+    """
+    doctitle_xform = get_docutils_settings().get("doctitle_xform", True)
+    split = split_source_sections(source, doctitle_xform=bool(doctitle_xform))
+    if split is None:
+        return publish_document_from_source(source)
+
+    chunk_sources = [
+        (split.head, True),
+        *((section, False) for section in split.sections),
+    ]
+    first_pass = [get_rendered_chunk(text, head=head) for text, head in chunk_sources]
+
+    # Names defined by several chunks are ambiguous within the whole document.
+    targets: dict[str, str] = {}
+    names: set[str] = set()
+    duplicates: set[str] = set()
+    for chunk in first_pass:
+        duplicates |= names & chunk.names
+        names |= chunk.names
+        targets.update(chunk.targets)
+    if any(duplicates & chunk.references for chunk in first_pass):
+        return publish_document_from_source(source)
+
+    # Render chunks again with the targets they miss. Aliases of targets in
+    # other chunks become known as their chunk is, so this takes rounds.
+    chunks = list(first_pass)
+    pending = [index for index, chunk in enumerate(chunks) if chunk.unresolved]
+    while pending:
+        waiting = []
+        for index in pending:
+            unresolved = chunks[index].unresolved
+            if not unresolved <= targets.keys():
+                waiting.append(index)
+                continue
+            injected = {name: targets[name] for name in sorted(unresolved)}
+            if not all(_injectable(name, uri) for name, uri in injected.items()):
+                return publish_document_from_source(source)
+            text, head = chunk_sources[index]
+            chunks[index] = get_rendered_chunk(text, head=head, targets=injected)
+            targets.update(chunks[index].targets)
+        if len(waiting) == len(pending):
+            return publish_document_from_source(source)
+        pending = waiting
+
+    if not all(chunk.safe for chunk in chunks):
+        return publish_document_from_source(source)
+
+    # An id taken by two chunks would be made unique when published whole.
+    id_counts = collections.Counter(
+        node_id for chunk in chunks for node_id in chunk.ids
+    )
+    if any(id_counts[node_id] > 1 for chunk in chunks for node_id in chunk.anchors):
+        return publish_document_from_source(source)
+
+    head_chunk, *section_chunks = chunks
+    fragment = head_chunk.body + "".join(chunk.body for chunk in section_chunks)
+    return PublishedDocument(
+        html_body=mark_safe(head_chunk.prefix + fragment + head_chunk.suffix),
+        fragment=mark_safe(fragment),
+        toc=_get_toc(section_chunks),
+        title=next((chunk.title for chunk in chunks if chunk.title is not None), None),
+        subtitle=next(
+            (chunk.subtitle for chunk in chunks if chunk.subtitle is not None),
+            None,
+        ),
+        metadata=dict(head_chunk.metadata),
+    )
+
+
+def _injectable(name: str, uri: str) -> bool:
+    """Return whether a target for ``name`` and ``uri`` can be written as-is."""
+    return not (
+        "`" in name
+        or "\\" in name
+        or "\\" in uri
+        or uri.endswith("_")
+        or any(char.isspace() for char in uri)
+    )
+
+
+def _get_toc(chunks: Sequence[RenderedChunk]) -> str | None:
+    """Return the table of contents of section chunks, cached by their outlines.
+
+    Edits that leave every section title alone reuse the table of contents.
+    Entries are numbered like the whole document's: chunks whose ids could
+    collide with them are never stitched.
+    """
+    key = make_render_cache_key("toc", ":".join(chunk.outline for chunk in chunks))
+    with _chunks_lock:
+        if key in _tocs:
+            toc = _tocs[key] = _tocs.pop(key)  # most recently used goes last
+            return toc
+
+    toc = None
+    if chunks:
+        document = utils.new_document(
+            "<incremental>",
+            get_docutils_settings_values(
+                None,
+                (rst.Parser, standalone.Reader, null.Writer),
+            ),
+        )
+        for chunk in chunks:
+            for section in chunk.sections:
+                document += section.deepcopy()
+        toc = publish_toc_from_doctree(document)
+
+    with _chunks_lock:
+        _tocs[key] = toc
+        while len(_tocs) > INCREMENTAL_CACHE_MAXSIZE:
+            del _tocs[next(iter(_tocs))]
+    return toc
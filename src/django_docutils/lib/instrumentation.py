@@ -0,0 +1,226 @@
+"""Opt-in per-stage timing of the render pipeline.
+
+Publishing is split into stages — ``parse`` (including the parser's
+directives, roles and reader transforms), ``sanitize``, one
+``transform.<Name>`` per writer transform (``CodeTransform`` highlighting
+among them), ``translate`` (the HTML translator) and ``toc``. While timing is
+enabled each stage's duration is sent through :data:`stage_timed` and added to
+the :class:`StageTimings` collected by :func:`collect_stage_timings`.
+
+Timing is enabled while a collector is active or :data:`stage_timed` has
+receivers; otherwise stages run untimed. With
+``DJANGO_DOCUTILS_LIB_RST["server_timing"]`` set, the views attach the
+collected timings to their responses as a ``Server-Timing`` header, where
+browser developer tools display them.
+"""
+
+from __future__ import annotations
+
+import contextlib
+import contextvars
+import time
+import typing as t
+
+from django.dispatch import Signal
+from docutils.transforms import Transformer
+
+from .settings import DJANGO_DOCUTILS_LIB_RST
+
+if t.TYPE_CHECKING:
+    from collections.abc import Iterable, Iterator
+
+    from django.http import HttpResponseBase
+    from docutils import nodes
+    from docutils.transforms import Transform
+
+stage_timed = Signal()
+"""Sent after each timed stage, with ``stage`` (str) and ``duration`` (seconds)."""
+
+SERVER_TIMING_HEADER: t.Final = "Server-Timing"
+
+_timed_transform_classes: dict[type[Transform], type[Transform]] = {}
+
+_stage_timings: contextvars.ContextVar[StageTimings | None] = contextvars.ContextVar(
+    "django_docutils_stage_timings",
+    default=None,
+)
+
+
+class StageTimings:
+    """Total time and number of runs of each stage.
+
+    Examples
+    --------
+    >>> timings = StageTimings()
+    >>> timings.add("parse", 0.012)
+    >>> timings.add("parse", 0.003)
+    >>> timings.counts["parse"], round(timings.durations["parse"], 3)
+    (2, 0.015)
+    >>> timings.server_timing()
+    'parse;dur=15.000'
+    """
+
+    def __init__(self) -> None:
+        #: Seconds spent in each stage, in the order stages first ran.
+        self.durations: dict[str, float] = {}
+        #: Number of times each stage ran.
+        self.counts: dict[str, int] = {}
+
+    def add(self, stage: str, duration: float) -> None:
+        """Record one run of ``stage`` taking ``duration`` seconds."""
+        self.durations[stage] = self.durations.get(stage, 0.0) + duration
+        self.counts[stage] = self.counts.get(stage, 0) + 1
+
+    def server_timing(self) -> str:
+        """Return the timings as a ``Server-Timing`` header value."""
+        return ", ".join(
+            f"{stage};dur={duration * 1000:.3f}"
+            for stage, duration in self.durations.items()
+        )
+
+
+def stage_timing_enabled() -> bool:
+    """Return whether stages should be timed right now.
+
+    Examples
+    --------
+    >>> stage_timing_enabled()
+    False
+    >>> with collect_stage_timings():
+    ...     stage_timing_enabled()
+    True
+    """
+    return _stage_timings.get() is not None or stage_timed.has_listeners()
+
+
+def server_timing_enabled() -> bool:
+    """Return whether views should attach a ``Server-Timing`` header."""
+    return bool(DJANGO_DOCUTILS_LIB_RST.get("server_timing", False))
+
+
+def add_server_timing(response: HttpResponseBase, timings: StageTimings) -> None:
+    """Append ``timings`` to the response's ``Server-Timing`` header.
+
+    Examples
+    --------
+    >>> from django.http import HttpResponse
+    >>> response = HttpResponse()
+    >>> timings = StageTimings()
+    >>> timings.add("parse", 0.002)
+    >>> add_server_timing(response, timings)
+    >>> response["Server-Timing"]
+    'parse;dur=2.000'
+    """
+    if not timings.durations:
+        return
+    value = timings.server_timing()
+    existing = response.get(SERVER_TIMING_HEADER)
+    response[SERVER_TIMING_HEADER] = f"{existing}, {value}" if existing else value
+
+
+@contextlib.contextmanager
+def collect_stage_timings() -> Iterator[StageTimings]:
+    """Collect the timings of every stage run in the block.
+
+    Examples
+    --------
+    >>> with collect_stage_timings() as timings:
+    ...     with time_stage("parse"):
+    ...         pass
+    >>> list(timings.durations)
+    ['parse']
+    """
+    timings = StageTimings()
+    token = _stage_timings.set(timings)
+    try:
+        yield timings
+    finally:
+        _stage_timings.reset(token)
+
+
+@contextlib.contextmanager
+def time_stage(stage: str) -> Iterator[None]:
+    """Time the block as ``stage`` when timing is enabled.
+
+    Also usable as a decorator.
+
+    Examples
+    --------
+    >>> seen = []
+    >>> def receiver(sender, stage, duration, **kwargs):
+    ...     seen.append(stage)
+    >>> stage_timed.connect(receiver)
+    >>> with time_stage("parse"):
+    ...     pass
+    >>> stage_timed.disconnect(receiver)
+    True
+    >>> seen
+    ['parse']
+    """
+    if not stage_timing_enabled():
+        yield
+        return
+
+    started = time.perf_counter()
+    try:
+        yield
+    finally:
+        duration = time.perf_counter() - started
+        timings = _stage_timings.get()
+        if timings is not None:
+            timings.add(stage, duration)
+        stage_timed.send(sender=None, stage=stage, duration=duration)
+
+
+def _timed_transform_class(transform_class: type[Transform]) -> type[Transform]:
+    """Return a subclass of ``transform_class`` timing its ``apply``."""
+    timed_class = _timed_transform_classes.get(transform_class)
+    if timed_class is not None:
+        return timed_class
+
+    stage = f"transform.{transform_class.__name__}"
+
+    class TimedTransform(transform_class):  # type:ignore[valid-type,misc]
+        def apply(self, **kwargs: t.Any) -> None:
+            with time_stage(stage):
+                super().apply(**kwargs)
+
+    TimedTransform.__name__ = transform_class.__name__
+    TimedTransform.__qualname__ = transform_class.__qualname__
+    TimedTransform.__module__ = transform_class.__module__
+    _timed_transform_classes[transform_class] = TimedTransform
+    return TimedTransform
+
+
+class TimedTransformer(Transformer):
+    """Transformer timing each transform it applies as ``transform.<Name>``."""
+
+    def add_transform(
+        self,
+        transform_class: type[Transform],
+        priority: int | None = None,
+        **kwargs: t.Any,
+    ) -> None:
+        """Store a timed version of a single transform."""
+        super().add_transform(
+            _timed_transform_class(transform_class),
+            priority,
+            **kwargs,
+        )
+
+    def add_transforms(self, transform_list: Iterable[type[Transform]]) -> None:
+        """Store timed versions of multiple transforms."""
+        super().add_transforms(
+            [_timed_transform_class(cls) for cls in transform_list],
+        )
+
+    def add_pending(self, pending: nodes.pending, priority: int | None = None) -> None:
+        """Store a timed version of the transform of a ``pending`` node."""
+        super().add_pending(pending, priority)
+        priority_string, transform_class, _, kwargs = self.transforms[-1]
+        self.transforms[-1] = (
+            priority_string,
+            _timed_transform_class(transform_class),
+            pending,
+            kwargs,
+        )
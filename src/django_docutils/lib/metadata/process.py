@@ -32,9 +32,54 @@ See *processors.py* for more examples.
 
 from __future__ import annotations
 
+import typing as t
+
 from django.utils.module_loading import import_string
 
-from django_docutils.lib.settings import DJANGO_DOCUTILS_LIB_RST
+from django_docutils.lib.settings import (
+    DJANGO_DOCUTILS_LIB_RST,
+    get_settings_generation,
+)
+
+if t.TYPE_CHECKING:
+    from collections.abc import Callable, Iterable
+
+    MetadataProcessor = Callable[[dict[str, t.Any]], dict[str, t.Any]]
+
+_pipeline: tuple[int, MetadataProcessor] | None = None
+
+
+def get_metadata_pipeline() -> MetadataProcessor:
+    """Return the configured metadata processors, chained into one callable.
+
+    Processor import strings are resolved once per settings generation.
+
+    Examples
+    --------
+    >>> get_metadata_pipeline() is get_metadata_pipeline()
+    True
+    >>> get_metadata_pipeline()({"created": "2017-07-30"})["created"].year
+    2017
+    """
+    global _pipeline
+    generation = get_settings_generation()
+    if _pipeline is not None and _pipeline[0] == generation:
+        return _pipeline[1]
+
+    processors: tuple[MetadataProcessor, ...] = ()
+    if DJANGO_DOCUTILS_LIB_RST and "metadata_processors" in DJANGO_DOCUTILS_LIB_RST:
+        processors = tuple(
+            import_string(processor_str)
+            for processor_str in DJANGO_DOCUTILS_LIB_RST["metadata_processors"]
+        )
+
+    def pipeline(metadata: dict[str, t.Any]) -> dict[str, t.Any]:
+        for processor_fn in processors:
+            metadata = processor_fn(metadata)
+        return metadata
+
+    _pipeline = (generation, pipeline)
+    return pipeline
 
 
 def process_metadata(metadata: dict[str, str]) -> dict[str, str]:
@@ -52,12 +97,33 @@ def process_metadata(metadata: dict[str, str]) -> dict[str, str]:
     dict
         Metadata from rst file.
     """
-    if not DJANGO_DOCUTILS_LIB_RST:
-        return metadata
+    return get_metadata_pipeline()(metadata)
 
-    if "metadata_processors" in DJANGO_DOCUTILS_LIB_RST:
-        for processor_str in DJANGO_DOCUTILS_LIB_RST["metadata_processors"]:
-            processor_fn = import_string(processor_str)
-            metadata = processor_fn(metadata)
 
-    return metadata
+def process_metadata_many(
+    metadata_list: Iterable[dict[str, t.Any]],
+) -> list[dict[str, t.Any]]:
+    """Return :func:`process_metadata` of each metadata dict, e.g. for listings.
+
+    The pipeline is looked up once for the whole batch.
+
+    Parameters
+    ----------
+    metadata_list : iterable of dict
+        Data returned from processing RST files
+
+    Returns
+    -------
+    list of dict
+        Metadata of each file, in order.
+
+    Examples
+    --------
+    >>> processed = process_metadata_many(
+    ...     [{"created": "2017-07-30"}, {"created": "2018-01-02 9:15AM"}],
+    ... )
+    >>> [metadata["created"].hour for metadata in processed]
+    [0, 9]
+    """
+    pipeline = get_metadata_pipeline()
+    return [pipeline(metadata) for metadata in metadata_list]
@@ -3,7 +3,9 @@
 from __future__ import annotations
 
 import datetime
+import functools
 import typing as t
+import zoneinfo
 
 from django.conf import settings
 
@@ -15,31 +17,70 @@ try:
 except ImportError:
     pass
 
+DATETIME_FORMATS: t.Final = (
+    "%Y-%m-%d %I:%M%p",
+    "%Y-%m-%d",
+)
+"""Formats metadata times are parsed with, most detailed to least."""
+
+DATETIME_CACHE_MAXSIZE: t.Final = 4096
+"""Distinct metadata time strings :func:`parse_datetime` remembers."""
+
+
+@functools.lru_cache(maxsize=DATETIME_CACHE_MAXSIZE)
+def parse_datetime(value: str) -> datetime.datetime | None:
+    """Return ``value`` parsed with the first of :data:`DATETIME_FORMATS` to fit.
+
+    Examples
+    --------
+    >>> parse_datetime("2017-07-30 2:30PM")
+    datetime.datetime(2017, 7, 30, 14, 30)
+    >>> parse_datetime("2017-07-30")
+    datetime.datetime(2017, 7, 30, 0, 0)
+    >>> parse_datetime("last week") is None
+    True
+    """
+    for _format in DATETIME_FORMATS:
+        parsed = _strptime(value, _format)
+        if parsed is not None:
+            return parsed
+    return None
+
+
+def _strptime(value: str, _format: str) -> datetime.datetime | None:
+    try:
+        return datetime.datetime.strptime(value, _format)
+    except ValueError:
+        return None
+
+
+@functools.lru_cache(maxsize=DATETIME_CACHE_MAXSIZE)
+def localize_datetime(value: datetime.datetime, time_zone: str) -> datetime.datetime:
+    """Return naive ``value`` as a time in ``time_zone``.
+
+    Uses pytz when installed, which rejects ambiguous and non-existent times,
+    and :mod:`zoneinfo` otherwise.
+
+    Examples
+    --------
+    >>> localize_datetime(datetime.datetime(2017, 7, 30, 14, 30), "UTC").isoformat()
+    '2017-07-30T14:30:00+00:00'
+    """
+    if HAS_PYTZ:
+        return pytz.timezone(time_zone).localize(value, is_dst=None)
+    return value.replace(tzinfo=zoneinfo.ZoneInfo(time_zone))
+
 
 def process_datetime(metadata: dict[str, t.Any]) -> dict[str, t.Any]:
-    """Optionally supports localizing times via pytz."""
-    timezone_formats = [  # timezone formats to try, most detailed to least
-        "%Y-%m-%d %I:%M%p",
-        "%Y-%m-%d",
-    ]
+    """Parse ``created`` and ``modified`` times, in ``settings.TIME_ZONE``.
 
+    Values no format fits are left as they are.
+    """
     for time_key in ["created", "modified"]:
-        if time_key in metadata:
-            for _format in timezone_formats:
-                try:
-                    metadata[time_key] = datetime.datetime.strptime(
-                        metadata[time_key],
-                        _format,
-                    )
-                    break
-                except ValueError:
-                    continue
-
-            if HAS_PYTZ:
-                metadata[time_key] = pytz.timezone(settings.TIME_ZONE).localize(
-                    metadata[time_key],
-                    is_dst=None,
-                )
+        if time_key in metadata and isinstance(metadata[time_key], str):
+            parsed = parse_datetime(metadata[time_key])
+            if parsed is not None:
+                metadata[time_key] = localize_datetime(parsed, settings.TIME_ZONE)
     return metadata
 
 
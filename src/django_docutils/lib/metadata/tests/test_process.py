@@ -3,12 +3,23 @@
 from __future__ import annotations
 
 import datetime
+import typing as t
+import zoneinfo
 
 from django.utils.encoding import force_bytes
 from docutils.core import publish_doctree
 
+from django_docutils.lib.metadata import process, processors
 from django_docutils.lib.metadata.extract import extract_metadata
-from django_docutils.lib.metadata.process import process_metadata
+from django_docutils.lib.metadata.process import (
+    get_metadata_pipeline,
+    process_metadata,
+    process_metadata_many,
+)
+
+if t.TYPE_CHECKING:
+    import pytest
+    from pytest_mock import MockerFixture
 
 
 def test_process_metadata_file() -> None:
@@ -84,3 +95,52 @@ some content
     assert created.strftime("%I") == "02"
     assert created.strftime("%p") == "PM"
     assert created.minute == 30
+
+
+def test_metadata_pipeline_resolved_once(
+    settings: t.Any,
+    mocker: MockerFixture,
+) -> None:
+    """Processors are imported once per settings generation."""
+    get_metadata_pipeline()
+    import_spy = mocker.spy(process, "import_string")
+
+    processed = process_metadata_many(
+        [{"created": "2017-07-30"}, {"created": "2017-07-31", "author": "tony"}],
+    )
+
+    assert import_spy.call_count == 0
+    assert [metadata["created"].day for metadata in processed] == [30, 31]
+
+    settings.DJANGO_DOCUTILS_LIB_RST = {
+        **settings.DJANGO_DOCUTILS_LIB_RST,
+        "metadata_processors": [],
+    }
+
+    assert process_metadata({"created": "2017-07-30"}) == {"created": "2017-07-30"}
+
+
+def test_process_datetime_zoneinfo(
+    settings: t.Any,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """Without pytz, times are localized through zoneinfo."""
+    settings.TIME_ZONE = "America/Chicago"
+    monkeypatch.setattr(processors, "HAS_PYTZ", False)
+    processors.localize_datetime.cache_clear()
+
+    metadata = processors.process_datetime(
+        {"created": "2017-07-30 2:30PM", "modified": "not a date"},
+    )
+    processors.localize_datetime.cache_clear()
+
+    assert metadata["created"] == datetime.datetime(
+        2017,
+        7,
+        30,
+        14,
+        30,
+        tzinfo=zoneinfo.ZoneInfo("America/Chicago"),
+    )
+    assert metadata["created"].utcoffset() == datetime.timedelta(hours=-5)
+    assert metadata["modified"] == "not a date"
@@ -0,0 +1,212 @@
+"""Process-pool rendering for bulk publishing.
+
+Docutils parsing is pure Python and CPU-bound, so threads serialize on the
+GIL. :func:`publish_html_parallel` spreads
+:func:`~django_docutils.lib.publisher.publish_html_from_source` across worker
+processes instead, streaming results back in source order.
+
+Workers set Django up from ``DJANGO_SETTINGS_MODULE`` when they don't inherit
+a configured process (the ``spawn`` and ``forkserver`` start methods), so
+settings applied with ``settings.configure()`` only reach ``fork`` workers.
+"""
+
+from __future__ import annotations
+
+import collections
+import functools
+import itertools
+import os
+import time
+import traceback
+import typing as t
+from concurrent.futures import ProcessPoolExecutor
+
+from .directives.registry import register_django_docutils_directives
+from .publisher import publish_html_from_source
+from .roles.registry import register_django_docutils_roles
+
+if t.TYPE_CHECKING:
+    from collections.abc import Callable, Iterable, Iterator
+    from concurrent.futures import Future
+    from multiprocessing.context import BaseContext
+
+    from typing_extensions import Unpack
+
+    from .publisher import PublishHtmlDocTreeKwargs
+
+T = t.TypeVar("T")
+R = t.TypeVar("R")
+
+DEFAULT_CHUNKSIZE: t.Final = 16
+"""Sources sent to a worker per task."""
+
+
+class RenderResult(t.NamedTuple):
+    """Outcome of rendering one source in a worker.
+
+    Attributes
+    ----------
+    html : str | None
+        Rendered HTML, or ``None`` when rendering failed or only an empty TOC
+        was requested.
+    error : str | None
+        Formatted traceback of the exception rendering raised, or ``None``
+        on success.
+    duration : float
+        Seconds the worker spent rendering the source.
+    """
+
+    html: str | None
+    error: str | None
+    duration: float
+
+
+def _initialize_worker() -> None:
+    """Set Django up and register roles and directives once per worker."""
+    from django.apps import apps
+
+    if not apps.ready:
+        import django
+
+        django.setup()
+
+    register_django_docutils_roles()
+    register_django_docutils_directives()
+
+
+def _render_chunk(
+    sources: list[str],
+    show_title: bool,
+    toc_only: bool,
+) -> list[RenderResult]:
+    """Render a chunk of sources, capturing each document's failure."""
+    results = []
+    for source in sources:
+        started = time.perf_counter()
+        try:
+            html = publish_html_from_source(
+                source,
+                show_title=show_title,
+                toc_only=toc_only,
+            )
+        except Exception:  # noqa: BLE001 - reported per document
+            results.append(
+                RenderResult(
+                    html=None,
+                    error=traceback.format_exc(),
+                    duration=time.perf_counter() - started,
+                ),
+            )
+        else:
+            results.append(
+                RenderResult(
+                    html=None if html is None else str(html),
+                    error=None,
+                    duration=time.perf_counter() - started,
+                ),
+            )
+    return results
+
+
+def publish_html_parallel(
+    sources: Iterable[str],
+    workers: int | None = None,
+    chunksize: int = DEFAULT_CHUNKSIZE,
+    mp_context: BaseContext | None = None,
+    **kwargs: Unpack[PublishHtmlDocTreeKwargs],
+) -> Iterator[RenderResult]:
+    """Render sources across a process pool, yielding results in order.
+
+    Sources are consumed lazily and only a bounded number of chunks is in
+    flight at once, so memory stays flat however many documents are
+    rendered. A source that fails to render yields a :class:`RenderResult`
+    carrying the traceback; the rest of the batch carries on.
+
+    Parameters
+    ----------
+    sources : iterable of str
+        reStructuredText content.
+    workers : int, optional
+        Worker processes. Defaults to the number of CPUs.
+    chunksize : int
+        Sources per task. Larger chunks cut inter-process overhead on many
+        small documents; smaller ones balance uneven document sizes.
+    mp_context : multiprocessing.context.BaseContext, optional
+        Start method context handed to
+        :class:`~concurrent.futures.ProcessPoolExecutor`.
+    **kwargs : PublishHtmlDocTreeKwargs
+        Rendering flags, applied to every source.
+
+    Yields
+    ------
+    RenderResult
+        One result per source, in source order.
+
+    Examples
+    --------
+    >>> results = list(publish_html_parallel(["Hello **world**"], workers=1))
+    >>> "<strong>world</strong>" in results[0].html, results[0].error
+    (True, None)
+    """
+    yield from map_chunks_in_pool(
+        functools.partial(
+            _render_chunk,
+            show_title=kwargs.get("show_title", True),
+            toc_only=kwargs.get("toc_only", False),
+        ),
+        sources,
+        workers=workers,
+        chunksize=chunksize,
+        mp_context=mp_context,
+    )
+
+
+def map_chunks_in_pool(
+    func: Callable[[list[T]], list[R]],
+    items: Iterable[T],
+    workers: int | None = None,
+    chunksize: int = DEFAULT_CHUNKSIZE,
+    mp_context: BaseContext | None = None,
+) -> Iterator[R]:
+    """Run ``func`` over chunks of ``items`` in worker processes, in order.
+
+    The process pool behind :func:`publish_html_parallel`, for callers
+    rendering something other than plain HTML. ``func`` must be picklable
+    (a module-level function or a :func:`functools.partial` of one), take a
+    list of items, and return one result per item.
+
+    Parameters
+    ----------
+    func : callable
+        Renders one chunk of items in a worker.
+    items : iterable
+        Items to render, consumed lazily.
+    workers : int, optional
+        Worker processes. Defaults to the number of CPUs.
+    chunksize : int
+        Items per task.
+    mp_context : multiprocessing.context.BaseContext, optional
+        Start method context handed to
+        :class:`~concurrent.futures.ProcessPoolExecutor`.
+
+    Yields
+    ------
+    object
+        Results of ``func``, flattened, in item order.
+    """
+    workers = workers or os.cpu_count() or 1
+    max_pending = workers * 2
+
+    item_iter = iter(items)
+    with ProcessPoolExecutor(
+        max_workers=workers,
+        mp_context=mp_context,
+        initializer=_initialize_worker,
+    ) as executor:
+        pending: collections.deque[Future[list[R]]] = collections.deque()
+        while chunk := list(itertools.islice(item_iter, chunksize)):
+            pending.append(executor.submit(func, chunk))
+            if len(pending) >= max_pending:
+                yield from pending.popleft().result()
+        while pending:
+            yield from pending.popleft().result()
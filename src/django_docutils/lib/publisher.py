@@ -6,21 +6,55 @@ import typing as t
 
 from django.utils.encoding import force_bytes, force_str
 from django.utils.safestring import mark_safe
-from docutils import io, nodes
+from docutils import io, nodes, writers
 from docutils.core import Publisher, publish_doctree as docutils_publish_doctree
+from docutils.parsers import rst
+from docutils.readers import standalone
 from docutils.readers.doctree import Reader
+from docutils.writers import null
 
+from .asynchronous import run_in_render_executor
+from .cache import cached_render
 from .directives.registry import register_django_docutils_directives
+from .doctree_store import get_doctree_store
+from .instrumentation import TimedTransformer, stage_timing_enabled, time_stage
+from .metadata.extract import extract_metadata, extract_subtitle, extract_title
 from .roles.registry import register_django_docutils_roles
 from .sanitize import sanitize_doctree
-from .settings import get_docutils_settings
-from .transforms.toc import Contents
+from .settings import get_docutils_settings, get_docutils_settings_values
+from .transforms.remote_url import RemoteUrlTransform
+from .transforms.toc import build_toc_document
 from .writers import DjangoDocutilsWriter
 
 if t.TYPE_CHECKING:
+    from collections.abc import Iterable, Iterator
+
+    from docutils.transforms import Transform
     from typing_extensions import NotRequired, Unpack
 
 
+class DjangoDocutilsParser(rst.Parser):
+    """reStructuredText parser that fills in deferred role lookups.
+
+    Adds :class:`~django_docutils.lib.transforms.remote_url.RemoteUrlTransform`,
+    which looks up the targets of remote URL roles once the document is parsed.
+    """
+
+    def get_transforms(self) -> list[type[Transform]]:
+        """Return the parser's transforms, plus remote URL resolution."""
+        return [*super().get_transforms(), RemoteUrlTransform]
+
+
+class DocTreeReader(Reader):  # type:ignore[type-arg]
+    """Doctree reader that times writer transforms when timing is enabled."""
+
+    def parse(self) -> None:
+        """Refurbish the document, with a timed transformer if enabled."""
+        super().parse()
+        if stage_timing_enabled():
+            self.document.transformer = TimedTransformer(self.document)
+
+
 def publish_parts_from_doctree(
     document: nodes.document,
     destination_path: str | None = None,
@@ -47,7 +81,9 @@ def publish_parts_from_doctree(
     settings : optional
         Pre-built docutils settings object. The resolved security settings
         are written onto it, but configuration files it already read cannot
-        be retroactively undone — prefer ``None``.
+        be retroactively undone — prefer ``None``, which uses a memoized
+        settings object from
+        :func:`~django_docutils.lib.settings.get_docutils_settings_values`.
     settings_spec : optional
         docutils settings spec passed through to the publisher.
     settings_overrides : mapping, optional
@@ -82,7 +118,11 @@ def publish_parts_from_doctree(
     if writer is not None:
         writer.django_docutils_settings = docutils_settings
 
-    reader = Reader(parser_name="null")  # type:ignore
+    reader = DocTreeReader(parser_name="null")
+    if not writer and writer_name:
+        writer = writers.get_writer_class(writer_name)()
+    if settings is None and settings_spec is None and config_section is None:
+        settings = get_docutils_settings_values(settings_overrides, (reader, writer))
     pub = Publisher(
         reader,
         None,
@@ -91,8 +131,6 @@ def publish_parts_from_doctree(
         destination_class=io.StringOutput,
         settings=settings,
     )
-    if not writer and writer_name:
-        pub.set_writer(writer_name)
     pub.process_programmatic_settings(
         settings_spec,
         docutils_settings,
@@ -109,39 +147,12 @@ def publish_toc_from_doctree(
 ) -> str | None:
     """Publish table of contents from docutils doctree."""
     if not writer:
-        writer = DjangoDocutilsWriter()
-    # Create a new document tree with just the table of contents
-    # ==========================================================
-
-    # document tree template:
-    toc_tree = nodes.document(
-        "",  # type:ignore
-        "",  # type:ignore
-        source="toc-generator",
-        classes=["fixed-toc-menu menu"],
-    )
-    toc_tree += nodes.paragraph("", "Contents", classes=["menu-label"])
-    # Set up a Contents instance:
-    # The Contents transform requires a "pending" startnode and
-    # generation options startnode
-    pending = nodes.pending(Contents, rawsource="")  # type:ignore
-
-    contents_transform = Contents(doctree, pending)
-
-    # this assures we get backlinks pointing to themselves
-    # so users can copy anchor from headers
-    contents_transform.backlinks = "entry"
+        writer = DjangoDocutilsWriter(parts=["html_body"])
 
-    toc_contents = contents_transform.build_contents(doctree)
-
-    if not toc_contents:  # ToC is empty
+    toc_tree = build_toc_document(doctree)
+    if toc_tree is None:
         return None
 
-    # run the contents builder and append the result to the template:
-    toc_topic = nodes.topic(classes=["contents", "toc"])
-
-    toc_topic += toc_contents
-    toc_tree += toc_topic
     toc = publish_parts_from_doctree(toc_tree, writer=writer)
     return mark_safe(force_str(toc["html_body"]))
 
@@ -167,6 +178,12 @@ def publish_doctree(
     docutils.nodes.document
         document/doctree for reStructuredText content
 
+    Notes
+    -----
+    When ``DJANGO_DOCUTILS_LIB_RST["doctree_store"]`` is configured, parsed
+    documents are kept on disk by :mod:`django_docutils.lib.doctree_store`
+    and loaded from there instead of being parsed again.
+
     Examples
     --------
     >>> doctree = publish_doctree("Hello **world**")
@@ -175,13 +192,57 @@ def publish_doctree(
     """
     register_django_docutils_directives()
     register_django_docutils_roles()
-    docutils_settings = get_docutils_settings(settings_overrides)
+    return _publish_doctree(source, settings_overrides)
+
 
-    return docutils_publish_doctree(  # type:ignore
-        source=force_bytes(source),
-        settings_overrides=docutils_settings,
+def _publish_doctree(
+    source: str | bytes,
+    settings_overrides: t.Mapping[str, object] | None = None,
+) -> nodes.document:
+    """Parse ``source`` without (re-)registering roles and directives."""
+    settings = get_docutils_settings_values(
+        settings_overrides,
+        (DjangoDocutilsParser, standalone.Reader, null.Writer),
     )
 
+    with time_stage("parse"):
+        store = get_doctree_store()
+        if store is None:
+            return docutils_publish_doctree(  # type:ignore
+                source=force_bytes(source),
+                parser=DjangoDocutilsParser(),
+                settings=settings,
+            )
+
+        key = store.make_key(source, settings_overrides)
+        document = store.load(key, settings)
+        if document is None:
+            document = docutils_publish_doctree(
+                source=force_bytes(source),
+                parser=DjangoDocutilsParser(),
+                settings=settings,
+            )
+            store.save(key, document)
+        return document
+
+
+async def apublish_doctree(
+    source: str | bytes,
+    settings_overrides: t.Mapping[str, object] | None = None,
+) -> nodes.document:
+    """Return :func:`publish_doctree` output, parsed off the event loop.
+
+    Runs on the bounded executor of :mod:`django_docutils.lib.asynchronous`.
+
+    Examples
+    --------
+    >>> import asyncio
+    >>> doctree = asyncio.run(apublish_doctree("Hello **world**"))
+    >>> doctree.astext().startswith("Hello")
+    True
+    """
+    return await run_in_render_executor(publish_doctree, source, settings_overrides)
+
 
 class PublishHtmlDocTreeKwargs(t.TypedDict):
     """Keyword arguments accepted by publish_html_from_source.
@@ -217,14 +278,58 @@ def publish_html_from_source(
     str or None
         Rendered HTML, or ``None`` when only an empty TOC was requested.
 
+    Notes
+    -----
+    When ``DJANGO_DOCUTILS_LIB_RST["cache"]`` is configured, the result is
+    served from :mod:`django_docutils.lib.cache` and docutils only runs on a
+    miss.
+
     Examples
     --------
     >>> html = publish_html_from_source("Hello **world**")
     >>> html is not None and "world" in html
     True
     """
-    doctree = publish_doctree(source)
-    return publish_html_from_doctree(doctree, **kwargs)
+    show_title = kwargs.get("show_title", True)
+    toc_only = kwargs.get("toc_only", False)
+
+    def render() -> str | None:
+        doctree = publish_doctree(source)
+        return publish_html_from_doctree(
+            doctree,
+            show_title=show_title,
+            toc_only=toc_only,
+        )
+
+    html = cached_render(
+        "html",
+        source,
+        render,
+        show_title=show_title,
+        toc_only=toc_only,
+    )
+    if html is None:
+        return None
+    return mark_safe(html)
+
+
+async def apublish_html_from_source(
+    source: str,
+    **kwargs: Unpack[PublishHtmlDocTreeKwargs],
+) -> str | None:
+    """Return :func:`publish_html_from_source` output, rendered off the event loop.
+
+    Runs on the bounded executor of :mod:`django_docutils.lib.asynchronous`,
+    through the rendered-output cache like its synchronous counterpart.
+
+    Examples
+    --------
+    >>> import asyncio
+    >>> html = asyncio.run(apublish_html_from_source("Hello **world**"))
+    >>> html == publish_html_from_source("Hello **world**")
+    True
+    """
+    return await run_in_render_executor(publish_html_from_source, source, **kwargs)
 
 
 def publish_html_from_doctree(
@@ -255,8 +360,34 @@ def publish_html_from_doctree(
     >>> html is not None and "<strong>world</strong>" in html
     True
     """
-    writer = DjangoDocutilsWriter()
+    return _publish_html_from_doctree(
+        doctree,
+        writer=DjangoDocutilsWriter(parts=[get_html_part(show_title, toc_only)]),
+        show_title=show_title,
+        toc_only=toc_only,
+    )
+
+
+def get_html_part(show_title: bool = True, toc_only: bool = False) -> str:
+    """Return the writer part :func:`publish_html_from_doctree` returns.
 
+    Examples
+    --------
+    >>> get_html_part(), get_html_part(show_title=False)
+    ('html_body', 'fragment')
+    """
+    if show_title or toc_only:  # the TOC is the html_body of its own document
+        return "html_body"
+    return "fragment"
+
+
+def _publish_html_from_doctree(
+    doctree: nodes.document,
+    writer: DjangoDocutilsWriter,
+    show_title: bool = True,
+    toc_only: bool = False,
+) -> str | None:
+    """Render ``doctree`` with an existing ``writer``, which may be reused."""
     doctree.transformer.apply_transforms()
 
     if toc_only:  # special flag to only return toc, used for sidebars
@@ -270,3 +401,303 @@ def publish_html_from_doctree(
     if show_title:
         return mark_safe(force_str(parts["html_body"]))
     return mark_safe(force_str(parts["fragment"]))
+
+
+def publish_many(
+    sources: Iterable[str],
+    deduplicate: bool = False,
+    **kwargs: Unpack[PublishHtmlDocTreeKwargs],
+) -> Iterator[str | None]:
+    """Yield HTML for each reStructuredText source, in order.
+
+    Batch counterpart of :func:`publish_html_from_source`. Roles and
+    directives are registered once for the whole batch rather than once per
+    document, and one writer is reused for every document. Results are
+    yielded as they are rendered, so only one document is held in memory at
+    a time.
+
+    Parameters
+    ----------
+    sources : iterable of str
+        reStructuredText content, consumed lazily.
+    deduplicate : bool
+        Render each distinct source once and repeat its HTML for later
+        occurrences. Keeps the HTML of every distinct source until the batch
+        finishes.
+    **kwargs : PublishHtmlDocTreeKwargs
+        Rendering flags, applied to every source.
+
+    Yields
+    ------
+    str or None
+        HTML of each source, or ``None`` when only an empty TOC was
+        requested.
+
+    Examples
+    --------
+    >>> html = list(publish_many(["Hello **world**", "Hello *you*"]))
+    >>> "<strong>world</strong>" in html[0], "<em>you</em>" in html[1]
+    (True, True)
+    """
+    show_title = kwargs.get("show_title", True)
+    toc_only = kwargs.get("toc_only", False)
+
+    register_django_docutils_directives()
+    register_django_docutils_roles()
+    writer = DjangoDocutilsWriter(parts=[get_html_part(show_title, toc_only)])
+    rendered: dict[str, str | None] = {}
+
+    for source in sources:
+        if deduplicate and source in rendered:
+            yield rendered[source]
+            continue
+
+        def render(source: str = source) -> str | None:
+            return _publish_html_from_doctree(
+                _publish_doctree(source),
+                writer=writer,
+                show_title=show_title,
+                toc_only=toc_only,
+            )
+
+        html = cached_render(
+            "html",
+            source,
+            render,
+            show_title=show_title,
+            toc_only=toc_only,
+        )
+        if html is not None:
+            html = mark_safe(html)
+        if deduplicate:
+            rendered[source] = html
+        yield html
+
+
+class PublishedDocument(t.NamedTuple):
+    """Every rendering of a document, produced by a single publish.
+
+    Attributes
+    ----------
+    html_body : str
+        Document HTML including the top level title.
+    fragment : str
+        Document HTML without the title, subtitle, or docinfo.
+    toc : str or None
+        Table of contents HTML, or ``None`` when the document has no sections.
+    title : str or None
+        Plain-text document title.
+    subtitle : str or None
+        Plain-text document subtitle.
+    metadata : dict[str, str]
+        Unprocessed docinfo fields, as returned by
+        :func:`~django_docutils.lib.metadata.extract.extract_metadata`.
+    """
+
+    html_body: str
+    fragment: str
+    toc: str | None
+    title: str | None
+    subtitle: str | None
+    metadata: dict[str, str]
+
+    def html(self, show_title: bool = True, toc_only: bool = False) -> str | None:
+        """Return the rendering :func:`publish_html_from_doctree` would.
+
+        Parameters
+        ----------
+        show_title : bool
+            Show top level title
+        toc_only : bool
+            Special flag: return show TOC, used for sidebars
+
+        Returns
+        -------
+        str or None
+            HTML, or ``None`` when only an empty TOC was requested.
+
+        Examples
+        --------
+        >>> document = publish_document_from_source("Hello **world**")
+        >>> document.html(show_title=False) == document.fragment
+        True
+        >>> document.html(toc_only=True) is None
+        True
+        """
+        if toc_only:
+            return self.toc
+        if show_title:
+            return self.html_body
+        return self.fragment
+
+
+def publish_document_from_doctree(doctree: nodes.document) -> PublishedDocument:
+    r"""Return body, fragment, TOC, title, and metadata from one publish.
+
+    Transforms are applied once and the table of contents is rendered during
+    the main writer pass, instead of publishing the document once per
+    rendering as :func:`publish_html_from_doctree` and
+    :func:`publish_toc_from_doctree` do.
+
+    Parameters
+    ----------
+    doctree : docutils.nodes.document
+        reStructuredText document (doctree) to render.
+
+    Returns
+    -------
+    PublishedDocument
+        Every rendering of the document.
+
+    Examples
+    --------
+    >>> doctree = publish_doctree(
+    ...     "Title\n=====\n\nOne\n---\n\nText\n\nTwo\n---\n\nText\n"
+    ... )
+    >>> document = publish_document_from_doctree(doctree)
+    >>> document.title
+    'Title'
+    >>> "Title" in document.html_body, "Title" in document.fragment
+    (True, False)
+    >>> document.toc is not None and "menu-list" in document.toc
+    True
+    """
+    writer = DjangoDocutilsWriter(build_toc=True, parts=["html_body", "fragment"])
+
+    doctree.transformer.apply_transforms()
+
+    parts = publish_parts_from_doctree(doctree, writer=writer)
+
+    return PublishedDocument(
+        html_body=mark_safe(force_str(parts["html_body"])),
+        fragment=mark_safe(force_str(parts["fragment"])),
+        toc=mark_safe(parts["toc"]) if parts["toc"] else None,
+        title=extract_title(doctree),
+        subtitle=extract_subtitle(doctree),
+        metadata=extract_metadata(doctree),
+    )
+
+
+def publish_document_from_source(source: str) -> PublishedDocument:
+    """Return every rendering of reStructuredText source from one parse.
+
+    Parameters
+    ----------
+    source : str
+        reStructuredText content.
+
+    Returns
+    -------
+    PublishedDocument
+        Every rendering of the document, served from the rendered-output cache
+        when ``DJANGO_DOCUTILS_LIB_RST["cache"]`` is configured.
+
+    Examples
+    --------
+    >>> document = publish_document_from_source("Hello **world**")
+    >>> "<strong>world</strong>" in document.fragment
+    True
+    >>> document.toc is None
+    True
+    """
+    return cached_render(
+        "document",
+        source,
+        lambda: publish_document_from_doctree(publish_doctree(source)),
+    )
+
+
+async def apublish_document_from_source(source: str) -> PublishedDocument:
+    """Return :func:`publish_document_from_source` output, off the event loop.
+
+    Runs on the bounded executor of :mod:`django_docutils.lib.asynchronous`.
+
+    Examples
+    --------
+    >>> import asyncio
+    >>> document = asyncio.run(apublish_document_from_source("Hello **world**"))
+    >>> "<strong>world</strong>" in document.fragment
+    True
+    """
+    return await run_in_render_executor(publish_document_from_source, source)
+
+
+class StreamedDocument(t.NamedTuple):
+    """Document HTML produced lazily, from :func:`stream_document_from_doctree`.
+
+    Attributes
+    ----------
+    chunks : Iterator[str]
+        Document HTML, translated one top-level node at a time as it is
+        consumed. Joined, equals what :func:`publish_html_from_doctree`
+        returns.
+    toc : str or None
+        Table of contents HTML, or ``None`` when the document has no sections.
+    """
+
+    chunks: Iterator[str]
+    toc: str | None
+
+
+def stream_document_from_doctree(
+    doctree: nodes.document,
+    show_title: bool = True,
+) -> StreamedDocument:
+    r"""Return the document HTML as a chunk iterator, plus its TOC.
+
+    Transforms, sanitizing, and the table of contents run before this returns,
+    so errors surface before the first chunk is sent. The body is translated
+    while ``chunks`` is consumed and never assembled into docutils parts, so
+    peak memory no longer grows with the rendered size of the document.
+
+    Parameters
+    ----------
+    doctree : docutils.nodes.document
+        reStructuredText document (doctree) to render.
+    show_title : bool
+        Show top level title
+
+    Returns
+    -------
+    StreamedDocument
+        Lazily translated HTML and the table of contents.
+
+    Examples
+    --------
+    >>> source = "Title\n=====\n\nHello **world**\n"
+    >>> streamed = stream_document_from_doctree(publish_doctree(source))
+    >>> html = "".join(streamed.chunks)
+    >>> html == publish_html_from_doctree(publish_doctree(source))
+    True
+    >>> streamed.toc is None
+    True
+    """
+    writer = DjangoDocutilsWriter(build_toc=True, stream=True)
+
+    doctree.transformer.apply_transforms()
+
+    parts = publish_parts_from_doctree(doctree, writer=writer)
+
+    return StreamedDocument(
+        chunks=(mark_safe(chunk) for chunk in writer.iter_html_body(show_title)),
+        toc=mark_safe(parts["toc"]) if parts["toc"] else None,
+    )
+
+
+def stream_document_from_source(
+    source: str,
+    show_title: bool = True,
+) -> StreamedDocument:
+    """Return reStructuredText source rendered as a chunk iterator, plus its TOC.
+
+    Unlike :func:`publish_html_from_source`, never consults the rendered-output
+    cache: a cached rendering is already a whole string and gains nothing
+    from streaming.
+
+    Examples
+    --------
+    >>> streamed = stream_document_from_source("Hello **world**")
+    >>> "<strong>world</strong>" in "".join(streamed.chunks)
+    True
+    """
+    return stream_document_from_doctree(publish_doctree(source), show_title=show_title)
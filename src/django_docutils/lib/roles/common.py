@@ -8,6 +8,7 @@ from docutils import nodes, utils
 
 from django_docutils.lib.utils import split_explicit_title
 
+from .remote import RemoteUrlResolver, remote_url_reference
 from .types import RemoteUrlHandlerFn, RoleFnReturnValue, UrlHandlerFn
 
 
@@ -82,9 +83,9 @@ def generic_url_role(
 def generic_remote_url_role(
     name: str,
     text: str,
-    url_handler_fn: RemoteUrlHandlerFn,
+    url_handler_fn: RemoteUrlHandlerFn | RemoteUrlResolver,
     innernodeclass: type[nodes.Text | nodes.TextElement] = nodes.Text,
-) -> tuple[list[nodes.reference], list[t.Any]]:
+) -> tuple[list[nodes.reference | remote_url_reference], list[t.Any]]:
     """Docutils Role that can call an external data source for title and URL.
 
     Same as generic_url_role, but can return url and title via external data source.
@@ -105,7 +106,9 @@ def generic_remote_url_role(
       - 'airline-mode/airline-mode'
       - 'this repo <airline-mode/airline-mode>'
     url_handler_fn : django_docutils.lib.roles.types.RemoteUrlHandlerFn
-        A function that accepts the target param.
+        A function that accepts the target param. A
+        :class:`~django_docutils.lib.roles.remote.RemoteUrlResolver` defers the
+        lookup until the document is parsed, so it can be batched and cached.
 
     Returns
     -------
@@ -133,11 +136,41 @@ def generic_remote_url_role(
     title = utils.unescape(title)
     target = utils.unescape(target)
 
+    if isinstance(url_handler_fn, RemoteUrlResolver):
+        placeholder = remote_url_reference(
+            "",
+            "",
+            role=name,
+            target=target,
+            title=title if has_explicit_title else None,
+            innernodeclass=innernodeclass,
+            resolver=url_handler_fn,
+        )
+        return [placeholder], []
+
     remote_title, url = url_handler_fn(target)
     if not has_explicit_title:
         title = utils.unescape(remote_title)
 
+    return [make_remote_url_reference(name, title, url, innernodeclass)], []
+
+
+def make_remote_url_reference(
+    name: str,
+    title: str,
+    url: str,
+    innernodeclass: type[nodes.Text | nodes.TextElement] = nodes.Text,
+) -> nodes.reference:
+    """Return the reference node :func:`generic_remote_url_role` links with.
+
+    Examples
+    --------
+    >>> reference = make_remote_url_reference("gh", "vim", "https://github.com/vim")
+    >>> print(reference.pformat(), end="")
+    <reference classes="gh" internal="1" refuri="https://github.com/vim">
+        vim
+    """
     sn = innernodeclass(title)
     rn = nodes.reference("", "", internal=True, refuri=url, classes=[name])
     rn += sn
-    return [rn], []
+    return rn
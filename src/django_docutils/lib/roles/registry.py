@@ -2,12 +2,22 @@
 
 from __future__ import annotations
 
+import types
 import typing as t
 
 from django.utils.module_loading import import_string
 from docutils.parsers.rst import roles
 
-from django_docutils.lib.settings import DJANGO_DOCUTILS_LIB_RST
+from django_docutils.lib.settings import (
+    DJANGO_DOCUTILS_LIB_RST,
+    get_settings_generation,
+)
+
+if t.TYPE_CHECKING:
+    from collections.abc import Mapping
+
+_role_table: tuple[int, Mapping[str, t.Any]] | None = None
+_registered_generation: int | None = None
 
 
 def register_django_docutils_roles() -> None:
@@ -58,29 +68,70 @@ def register_django_docutils_roles() -> None:
     ... }
     ...
 
+    Roles come from the table :func:`get_django_docutils_roles` resolves once
+    per settings generation. Documents can replace roles in docutils'
+    process-wide registry (``.. role:: gh(emphasis)``), so the table is
+    written back on every call.
+
     Returns
     -------
     None
     """
-    if not DJANGO_DOCUTILS_LIB_RST:
+    global _registered_generation
+    generation = get_settings_generation()
+    role_table = get_django_docutils_roles()
+    if _registered_generation == generation:
+        roles._roles.update(role_table)  # type:ignore[attr-defined]
         return
 
-    if "roles" not in DJANGO_DOCUTILS_LIB_RST:
-        return
+    for role_name, role in role_table.items():
+        roles.register_local_role(role_name, role)
+    _registered_generation = generation
+
 
-    django_docutils_roles = DJANGO_DOCUTILS_LIB_RST["roles"]
+def get_django_docutils_roles() -> Mapping[str, t.Any]:
+    """Return the configured local roles, resolved once per settings generation.
 
-    local_roles = django_docutils_roles.get("local", None)
+    Import strings are imported and class-based roles instantiated, as
+    :func:`resolve_role_mapping` does.
 
-    if local_roles:
-        register_role_mapping(local_roles)
+    Examples
+    --------
+    >>> get_django_docutils_roles() is get_django_docutils_roles()
+    True
+    >>> get_django_docutils_roles()["gh"]
+    <function github_role at ...>
+    """
+    global _role_table
+    generation = get_settings_generation()
+    if _role_table is not None and _role_table[0] == generation:
+        return _role_table[1]
 
-    return
+    local_roles = {}
+    if DJANGO_DOCUTILS_LIB_RST and "roles" in DJANGO_DOCUTILS_LIB_RST:
+        local_roles = DJANGO_DOCUTILS_LIB_RST["roles"].get("local", None) or {}
+    role_table = types.MappingProxyType(resolve_role_mapping(local_roles))
+    _role_table = (generation, role_table)
+    return role_table
 
 
 def register_role_mapping(role_mapping: dict[str, t.Any]) -> None:
     """Register a dict mapping of roles.
 
+    See :func:`resolve_role_mapping` for the format of ``role_mapping``.
+
+    Parameters
+    ----------
+    role_mapping : dict
+        Mapping of docutils roles to register
+    """
+    for role_name, role in resolve_role_mapping(role_mapping).items():
+        roles.register_local_role(role_name, role)
+
+
+def resolve_role_mapping(role_mapping: Mapping[str, t.Any]) -> dict[str, t.Any]:
+    """Resolve a dict mapping of roles to the callbacks docutils registers.
+
     An item consists of a role name, import string to a callable, and an
     optional mapping of keyword args for special roles that are classes
     that can accept arguments.
@@ -91,8 +142,21 @@ def register_role_mapping(role_mapping: dict[str, t.Any]) -> None:
     Parameters
     ----------
     role_mapping : dict
-        Mapping of docutils roles to register
+        Mapping of docutils roles to resolve
+
+    Returns
+    -------
+    dict
+        Role callbacks, ready for ``roles.register_local_role``, by role name.
+
+    Examples
+    --------
+    >>> resolve_role_mapping(
+    ...     {"gh": "django_docutils.lib.roles.github.github_role"},
+    ... )
+    {'gh': <function github_role at ...>}
     """
+    resolved: dict[str, t.Any] = {}
     for role_name, role_cb_str in role_mapping.items():
         role_cb_kwargs = {}
 
@@ -104,8 +168,8 @@ def register_role_mapping(role_mapping: dict[str, t.Any]) -> None:
             #     }
             # ),
 
-            # pop off dict of kwargs
-            role_cb_kwargs = role_cb_str[1]
+            # pop off dict of kwargs, copied so resolving leaves settings as is
+            role_cb_kwargs = dict(role_cb_str[1])
 
             # move class string item to a pure string
             role_cb_str = role_cb_str[0]
@@ -139,8 +203,9 @@ def register_role_mapping(role_mapping: dict[str, t.Any]) -> None:
         # element that's a dict of the kwargs passed into the role.
         if isinstance(role_, type):
             if role_cb_kwargs:
-                roles.register_local_role(role_name, role_(**role_cb_kwargs))
+                resolved[role_name] = role_(**role_cb_kwargs)
             else:
-                roles.register_local_role(role_name, role_())
+                resolved[role_name] = role_()
         else:
-            roles.register_local_role(role_name, role_)
+            resolved[role_name] = role_
+    return resolved
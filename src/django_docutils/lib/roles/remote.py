@@ -0,0 +1,174 @@
+"""Batched, cached lookups for roles backed by external data sources.
+
+Called with a plain :class:`~django_docutils.lib.roles.types.RemoteUrlHandlerFn`,
+:func:`~django_docutils.lib.roles.common.generic_remote_url_role` looks each
+target up while the parser runs, one round-trip per role occurrence. Given a
+:class:`RemoteUrlResolver` it only records the target in a
+:class:`remote_url_reference` placeholder. Once the document is parsed,
+:class:`~django_docutils.lib.transforms.remote_url.RemoteUrlTransform` looks up
+the unique targets of each resolver together and fills the placeholders in:
+
+.. code-block:: python
+
+   def lookup_products(targets):
+       products = Product.objects.filter(sku__in=targets)
+       return {p.sku: (p.title, p.get_absolute_url()) for p in products}
+
+   product_resolver = RemoteUrlResolver(batch_url_handler_fn=lookup_products)
+
+   def product_role(
+       name, rawtext, text, lineno, inliner, options={}, content=[]
+   ):
+       return generic_remote_url_role(name, text, product_resolver)
+"""
+
+from __future__ import annotations
+
+import threading
+import time
+import typing as t
+from concurrent.futures import ThreadPoolExecutor
+
+from docutils import nodes
+
+if t.TYPE_CHECKING:
+    from collections.abc import Iterable
+
+    from .types import BatchRemoteUrlHandlerFn, RemoteUrlHandlerFn
+
+REMOTE_URL_CACHE_MAXSIZE: t.Final = 1024
+"""Looked up targets each resolver keeps by default."""
+
+DEFAULT_MAX_WORKERS: t.Final = 8
+"""Targets looked up at once when a resolver has no batch handler."""
+
+
+class remote_url_reference(nodes.Inline, nodes.TextElement):
+    """Placeholder for a role reference whose title and URL are looked up later.
+
+    Attributes: ``role`` (role name), ``target``, ``title`` (the explicit
+    title, or ``None``), ``innernodeclass``, and ``resolver``, the
+    :class:`RemoteUrlResolver` that looks ``target`` up.
+    """
+
+
+class RemoteUrlResolver:
+    """Looks up the title and URL of role targets, many at a time.
+
+    Parameters
+    ----------
+    url_handler_fn : RemoteUrlHandlerFn, optional
+        Looks one target up. Targets without a cached answer are looked up
+        concurrently, on up to ``max_workers`` threads.
+    batch_url_handler_fn : BatchRemoteUrlHandlerFn, optional
+        Looks every target without a cached answer up in one call. Targets it
+        leaves out fall back to ``url_handler_fn`` if given, otherwise raise
+        :class:`KeyError`.
+    ttl : float, optional
+        Seconds an answer is reused for. ``None`` reuses answers until they are
+        evicted, ``0`` looks targets up for every document. Documents kept in
+        the :mod:`~django_docutils.lib.doctree_store` keep the answers they
+        were parsed with, whatever the ``ttl``.
+    maxsize : int
+        Answers kept, least recently used are evicted first.
+    max_workers : int
+        Threads looking targets up through ``url_handler_fn``.
+
+    Examples
+    --------
+    >>> calls = []
+    >>> def lookup(targets):
+    ...     calls.append(sorted(targets))
+    ...     return {target: (target.title(), f"/{target}/") for target in targets}
+    >>> resolver = RemoteUrlResolver(batch_url_handler_fn=lookup)
+    >>> resolver.resolve_many(["vim", "tmux", "vim"])
+    {'vim': ('Vim', '/vim/'), 'tmux': ('Tmux', '/tmux/')}
+    >>> resolver.resolve_many(["tmux", "git"])
+    {'tmux': ('Tmux', '/tmux/'), 'git': ('Git', '/git/')}
+    >>> calls
+    [['tmux', 'vim'], ['git']]
+    """
+
+    def __init__(
+        self,
+        url_handler_fn: RemoteUrlHandlerFn | None = None,
+        *,
+        batch_url_handler_fn: BatchRemoteUrlHandlerFn | None = None,
+        ttl: float | None = None,
+        maxsize: int = REMOTE_URL_CACHE_MAXSIZE,
+        max_workers: int = DEFAULT_MAX_WORKERS,
+    ) -> None:
+        if url_handler_fn is None and batch_url_handler_fn is None:
+            msg = "RemoteUrlResolver needs url_handler_fn or batch_url_handler_fn"
+            raise TypeError(msg)
+        self.url_handler_fn = url_handler_fn
+        self.batch_url_handler_fn = batch_url_handler_fn
+        self.ttl = ttl
+        self.maxsize = maxsize
+        self.max_workers = max_workers
+        self._answers: dict[str, tuple[float, tuple[str, str]]] = {}
+        self._lock = threading.Lock()
+
+    def __call__(self, target: str) -> tuple[str, str]:
+        """Return the title and URL of ``target``."""
+        return self.resolve_many([target])[target]
+
+    def resolve_many(self, targets: Iterable[str]) -> dict[str, tuple[str, str]]:
+        """Return the title and URL of each of ``targets``, keyed by target.
+
+        Each target is looked up once, however often it is repeated, and only
+        if no fresh answer is cached.
+        """
+        unique = list(dict.fromkeys(targets))
+        answers: dict[str, tuple[str, str]] = {}
+        missing: list[str] = []
+        now = time.monotonic()
+        with self._lock:
+            for target in unique:
+                cached = self._answers.pop(target, None)
+                if cached is None or (self.ttl is not None and cached[0] <= now):
+                    missing.append(target)
+                    continue
+                self._answers[target] = cached
+                answers[target] = cached[1]
+
+        if missing:
+            found = self._look_up(missing)
+            self._remember(found)
+            answers.update(found)
+        return {target: answers[target] for target in unique}
+
+    def clear(self) -> None:
+        """Forget every cached answer."""
+        with self._lock:
+            self._answers.clear()
+
+    def _look_up(self, targets: list[str]) -> dict[str, tuple[str, str]]:
+        found: dict[str, tuple[str, str]] = {}
+        if self.batch_url_handler_fn is not None:
+            found.update(self.batch_url_handler_fn(targets))
+            targets = [target for target in targets if target not in found]
+            if targets and self.url_handler_fn is None:
+                raise KeyError(targets[0])
+
+        url_handler_fn = self.url_handler_fn
+        if len(targets) == 1 and url_handler_fn is not None:
+            found[targets[0]] = url_handler_fn(targets[0])
+        elif targets and url_handler_fn is not None:
+            workers = min(self.max_workers, len(targets))
+            with ThreadPoolExecutor(max_workers=workers) as executor:
+                found.update(
+                    zip(targets, executor.map(url_handler_fn, targets), strict=True),
+                )
+        return found
+
+    def _remember(self, found: dict[str, tuple[str, str]]) -> None:
+        if self.ttl == 0:
+            return
+        expires = time.monotonic() + (self.ttl or 0)
+        with self._lock:
+            for target, answer in found.items():
+                self._answers.pop(target, None)
+                self._answers[target] = (expires, answer)
+            while len(self._answers) > self.maxsize:
+                del self._answers[next(iter(self._answers))]
@@ -7,6 +7,9 @@ from typing import Protocol
 
 from docutils import nodes
 
+if t.TYPE_CHECKING:
+    from collections.abc import Mapping, Sequence
+
 
 class UrlHandlerFn(Protocol):
     """Protocol for role handler callback maps directly to a URL patern."""
@@ -24,6 +27,14 @@ class RemoteUrlHandlerFn(Protocol):
         ...
 
 
+class BatchRemoteUrlHandlerFn(Protocol):
+    """Protocol for role handler callback that looks up many targets at once."""
+
+    def __call__(self, targets: Sequence[str]) -> Mapping[str, tuple[str, str]]:
+        """Return the title and URL of each target, keyed by target."""
+        ...
+
+
 RoleFnReturnValue = tuple[list[nodes.reference], list[t.Any]]
 """Role function return value.
 
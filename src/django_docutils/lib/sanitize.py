@@ -8,23 +8,40 @@ pipeline; :func:`sanitize_doctree` is the reusable entry point.
 
 from __future__ import annotations
 
+import functools
+import re
 import typing as t
 import urllib.parse
 
 from docutils import nodes
-from docutils.transforms import Transform
+from docutils.transforms import Transform, Transformer, universal, writer_aux
 
+from .instrumentation import time_stage
 from .settings import (
     get_allowed_uri_schemes,
     get_docutils_settings,
+    get_settings_generation,
     unsafe_docutils_settings_allowed,
 )
 
-_C0_CONTROL_CHARS: t.Final[frozenset[str]] = frozenset(
-    chr(code_point) for code_point in range(0x20)
-) | {"\x7f"}
+_C0_CONTROL_RE: t.Final = re.compile(r"[\x00-\x1f\x7f]")
 """C0 / DEL control characters that disqualify a URI outright."""
 
+_FAST_PATH_REJECT_RE: t.Final = re.compile(r"[\x00-\x1f\x7f\[\]]")
+"""Characters sending an ``http(s)://`` URI down the full ``urlsplit`` check.
+
+Besides control characters, brackets are the only ASCII characters
+``urlsplit`` can reject a URI over (malformed IPv6 hosts).
+"""
+
+FAST_PATH_SCHEMES: t.Final = ("http", "https")
+"""Schemes whose ``<scheme>://`` prefix is checked without ``urlsplit``."""
+
+URI_VERDICT_CACHE_MAXSIZE: t.Final = 4096
+"""Distinct (URI, policy) verdicts :func:`uri_is_allowed` remembers."""
+
+_uri_policy: tuple[int, UriPolicy] | None = None
+
 
 def _uri_is_allowed(uri: str, allowed_uri_schemes: frozenset[str]) -> bool:
     r"""Return whether a URI can be emitted into HTML attributes.
@@ -47,7 +64,7 @@ def _uri_is_allowed(uri: str, allowed_uri_schemes: frozenset[str]) -> bool:
     >>> _uri_is_allowed("http://[::1", frozenset({"http"}))
     False
     """
-    if any(char in _C0_CONTROL_CHARS for char in uri):
+    if _C0_CONTROL_RE.search(uri):
         return False
     try:
         parts = urllib.parse.urlsplit(uri)
@@ -58,6 +75,83 @@ def _uri_is_allowed(uri: str, allowed_uri_schemes: frozenset[str]) -> bool:
     return parts.scheme.lower() in allowed_uri_schemes
 
 
+class UriPolicy(t.NamedTuple):
+    """URI policy compiled from settings, as :func:`uri_is_allowed` applies it.
+
+    Examples
+    --------
+    >>> policy = UriPolicy.from_schemes(frozenset({"https", "mailto"}))
+    >>> policy.fast_prefixes
+    ('https://',)
+    """
+
+    allowed_uri_schemes: frozenset[str]
+    fast_prefixes: tuple[str, ...]
+
+    @classmethod
+    def from_schemes(cls, allowed_uri_schemes: frozenset[str]) -> UriPolicy:
+        """Return the policy allowing ``allowed_uri_schemes``."""
+        return cls(
+            allowed_uri_schemes=allowed_uri_schemes,
+            fast_prefixes=tuple(
+                f"{scheme}://"
+                for scheme in FAST_PATH_SCHEMES
+                if scheme in allowed_uri_schemes
+            ),
+        )
+
+
+def get_uri_policy() -> UriPolicy:
+    """Return the URI policy for the current settings.
+
+    Built from :func:`~django_docutils.lib.settings.get_allowed_uri_schemes`
+    once per settings generation.
+
+    Examples
+    --------
+    >>> get_uri_policy() is get_uri_policy()
+    True
+    >>> "javascript" in get_uri_policy().allowed_uri_schemes
+    False
+    """
+    global _uri_policy
+    generation = get_settings_generation()
+    if _uri_policy is not None and _uri_policy[0] == generation:
+        return _uri_policy[1]
+
+    policy = UriPolicy.from_schemes(get_allowed_uri_schemes())
+    _uri_policy = (generation, policy)
+    return policy
+
+
+@functools.lru_cache(maxsize=URI_VERDICT_CACHE_MAXSIZE)
+def uri_is_allowed(uri: str, policy: UriPolicy) -> bool:
+    """Return whether ``policy`` lets a URI be emitted into HTML attributes.
+
+    Verdicts are remembered per (URI, policy), so links repeated across a
+    document or between documents are checked once. ASCII ``http(s)://`` URIs
+    free of control characters and brackets skip ``urlsplit``; everything else
+    goes through :func:`_uri_is_allowed`.
+
+    Examples
+    --------
+    >>> policy = UriPolicy.from_schemes(frozenset({"https"}))
+    >>> uri_is_allowed("https://example.com", policy)
+    True
+    >>> uri_is_allowed("http://example.com", policy)
+    False
+    >>> uri_is_allowed("javascript:alert(1)", policy)
+    False
+    """
+    if (
+        uri.startswith(policy.fast_prefixes)
+        and uri.isascii()
+        and not _FAST_PATH_REJECT_RE.search(uri)
+    ):
+        return True
+    return _uri_is_allowed(uri, policy.allowed_uri_schemes)
+
+
 def _replace_node_with_text(node: nodes.Element) -> None:
     """Replace a node with its rendered text content.
 
@@ -91,9 +185,78 @@ def _remove_node(node: nodes.Element) -> None:
         node.parent.remove(node)
 
 
+SANITIZE_SAFE_TRANSFORMS: t.Final[tuple[type[Transform], ...]] = (
+    universal.Messages,
+    universal.FilterMessages,
+    universal.StripClassesAndElements,
+    universal.Validate,
+    writer_aux.Admonitions,
+)
+"""Docutils writer transforms that never add raw nodes or URIs.
+
+Running them after a sanitize pass leaves the document sanitized. Other
+transforms declare the same by setting ``django_docutils_sanitize_safe = True``.
+"""
+
+_SANITIZED_NODES: t.Final = (
+    nodes.raw,
+    nodes.reference,
+    nodes.target,
+    nodes.image,
+    nodes.meta,
+)
+
+
+class _SanitizedMarker(t.NamedTuple):
+    """Policy a document was sanitized under, and the transforms applied then."""
+
+    policy: tuple[object, ...]
+    transformer: Transformer
+    applied: int
+
+
+def _transform_is_sanitize_safe(transform_class: type[Transform]) -> bool:
+    """Return whether a transform keeps a sanitized document sanitized.
+
+    Examples
+    --------
+    >>> _transform_is_sanitize_safe(universal.Messages)
+    True
+    >>> _transform_is_sanitize_safe(SanitizeTransform)
+    False
+    """
+    return issubclass(transform_class, SANITIZE_SAFE_TRANSFORMS) or (
+        getattr(transform_class, "django_docutils_sanitize_safe", False) is True
+    )
+
+
+def _is_sanitized(document: nodes.document, policy: tuple[object, ...]) -> bool:
+    """Return whether ``document`` is still sanitized under ``policy``.
+
+    True when the last pass used the same policy and only sanitize-safe
+    transforms have been applied since.
+    """
+    marker = getattr(document, "django_docutils_sanitized", None)
+    if not isinstance(marker, _SanitizedMarker) or marker.policy != policy:
+        return False
+
+    transformer = document.transformer
+    # A transformer created after the pass has applied nothing before it.
+    applied = (
+        transformer.applied[marker.applied :]
+        if transformer is marker.transformer
+        else transformer.applied
+    )
+    return all(
+        _transform_is_sanitize_safe(transform_class)
+        for _, transform_class, _, _ in applied
+    )
+
+
 def sanitize_doctree(
     document: nodes.document,
     docutils_settings: t.Mapping[str, object] | None = None,
+    skip_if_sanitized: bool = False,
 ) -> None:
     """Remove unsafe HTML-producing nodes and attributes from a doctree.
 
@@ -107,6 +270,13 @@ def sanitize_doctree(
         ``raw_enabled`` only skips raw-node removal when the project also
         sets ``allow_unsafe_docutils_settings``. URI scheme policy is
         project-level via :func:`get_allowed_uri_schemes`, not per-call.
+    skip_if_sanitized : bool
+        Return early when an earlier pass sanitized ``document`` under the
+        same policy and only transforms in :data:`SANITIZE_SAFE_TRANSFORMS`,
+        or declaring ``django_docutils_sanitize_safe``, were applied since.
+        Only for callers that know nothing but transforms touched the
+        document in between, such as
+        :class:`~django_docutils.lib.writers.DjangoDocutilsWriter`.
 
     Examples
     --------
@@ -121,44 +291,85 @@ def sanitize_doctree(
         if docutils_settings is not None
         else get_docutils_settings()
     )
-    allowed_uri_schemes = get_allowed_uri_schemes()
+    uri_policy = get_uri_policy()
+    unsafe_allowed = unsafe_docutils_settings_allowed()
+    raw_skip_allowed = settings.get("raw_enabled") is True and unsafe_allowed
+    policy = (raw_skip_allowed, unsafe_allowed, uri_policy)
+
+    if skip_if_sanitized and _is_sanitized(document, policy):
+        return
+    _sanitize_nodes(document, policy)
+
+
+@time_stage("sanitize")
+def _sanitize_nodes(
+    document: nodes.document,
+    policy: tuple[bool, bool, UriPolicy],
+) -> None:
+    """Apply ``policy`` to every node of ``document``; timed as a stage."""
+    raw_skip_allowed, unsafe_allowed, uri_policy = policy
+
+    # One walk collects every node the policy inspects. They are handled kind
+    # by kind afterwards, in the order of the original per-kind passes, so a
+    # raw node is gone before an enclosing reference is flattened to text.
+    raw_nodes: list[nodes.raw] = []
+    references: list[nodes.reference] = []
+    targets: list[nodes.target] = []
+    images: list[nodes.image] = []
+    meta_nodes: list[nodes.meta] = []
+    stack: list[nodes.Node] = [document]
+    while stack:
+        node = stack.pop()
+        if isinstance(node, _SANITIZED_NODES):
+            if isinstance(node, nodes.raw):
+                raw_nodes.append(node)
+            elif isinstance(node, nodes.reference):
+                references.append(node)
+            elif isinstance(node, nodes.target):
+                targets.append(node)
+            elif isinstance(node, nodes.image):
+                images.append(node)
+            else:
+                meta_nodes.append(node)
+        if isinstance(node, nodes.Element):
+            stack.extend(reversed(node.children))
 
-    raw_skip_allowed = (
-        settings.get("raw_enabled") is True and unsafe_docutils_settings_allowed()
-    )
     if not raw_skip_allowed:
-        for raw_node in list(document.findall(nodes.raw)):
+        for raw_node in raw_nodes:
             if raw_node.get("django_docutils_trusted_raw") is not True:
                 _remove_node(raw_node)
 
-    for reference in list(document.findall(nodes.reference)):
+    for reference in references:
         refuri = reference.get("refuri")
-        if isinstance(refuri, str) and not _uri_is_allowed(
-            refuri,
-            allowed_uri_schemes,
-        ):
+        if isinstance(refuri, str) and not uri_is_allowed(refuri, uri_policy):
             _replace_node_with_text(reference)
 
-    for target in list(document.findall(nodes.target)):
+    for target in targets:
         refuri = target.get("refuri")
-        if isinstance(refuri, str) and not _uri_is_allowed(refuri, allowed_uri_schemes):
+        if isinstance(refuri, str) and not uri_is_allowed(refuri, uri_policy):
             del target["refuri"]
 
-    for image in list(document.findall(nodes.image)):
+    for image in images:
         uri = image.get("uri")
-        if isinstance(uri, str) and not _uri_is_allowed(uri, allowed_uri_schemes):
+        if isinstance(uri, str) and not uri_is_allowed(uri, uri_policy):
             _remove_node(image)
 
     # ``.. meta:: :http-equiv=refresh:`` emits a ``<meta>`` into the head
     # parts, outside the reference/target/image URI policy. A refresh forces
     # navigation regardless of scheme — a refresh to an allow-listed host is
     # still hostile — so the node is removed, not scheme-validated.
-    if not unsafe_docutils_settings_allowed():
-        for meta_node in list(document.findall(nodes.meta)):
+    if not unsafe_allowed:
+        for meta_node in meta_nodes:
             http_equiv = meta_node.get("http-equiv")
             if isinstance(http_equiv, str) and http_equiv.lower() == "refresh":
                 _remove_node(meta_node)
 
+    document.django_docutils_sanitized = _SanitizedMarker(  # type:ignore[attr-defined]
+        policy=policy,
+        transformer=document.transformer,
+        applied=len(document.transformer.applied),
+    )
+
 
 class SanitizeTransform(Transform):
     """Run :func:`~django_docutils.lib.sanitize.sanitize_doctree` as a transform.
@@ -2,12 +2,20 @@
 
 from __future__ import annotations
 
+import hashlib
+import json
 import typing as t
+import warnings
 
 from django.conf import settings
 from django.core.signals import setting_changed
+from docutils import frontend, utils
 
 if t.TYPE_CHECKING:
+    from collections.abc import Sequence
+
+    from docutils import SettingsSpec
+
     from .types import DjangoDocutilsLibRSTSettings, DjangoDocutilsLibTextSettings
 
 SAFE_DOCUTILS_DEFAULTS: t.Final[dict[str, object]] = {
@@ -50,6 +58,64 @@ DJANGO_DOCUTILS_LIB_TEXT = t.cast(
 
 DJANGO_DOCUTILS_ANONYMOUS_USER_NAME: str | None = "AnonymousCoward"
 
+DOCUTILS_SETTINGS_VALUES_MAXSIZE: t.Final = 64
+"""Distinct settings objects :func:`get_docutils_settings_values` memoizes."""
+
+_settings_generation = 0
+
+_docutils_settings_values: dict[tuple[object, ...], frontend.Values] = {}
+_docutils_settings_values_generation = 0
+
+
+def get_settings_generation() -> int:
+    """Return a counter bumped every time Django settings change.
+
+    Memoized state derived from settings (fingerprints, resolved registries,
+    compiled policies) records the generation it was built under and rebuilds
+    itself once :func:`reload_settings` has moved the counter on.
+
+    Returns
+    -------
+    int
+        Current settings generation.
+
+    Examples
+    --------
+    >>> generation = get_settings_generation()
+    >>> reload_settings(None, None, "DEBUG", False, True)
+    >>> get_settings_generation() > generation
+    True
+    """
+    return _settings_generation
+
+
+def settings_fingerprint(value: object) -> str:
+    """Return a stable digest of a settings structure.
+
+    Mappings are serialized with sorted keys, and values JSON cannot represent
+    fall back to their ``repr``, so equal configurations always produce the
+    same digest — across processes as well as within one.
+
+    Parameters
+    ----------
+    value : object
+        Settings structure (typically a mapping) to fingerprint.
+
+    Returns
+    -------
+    str
+        Hex digest of the serialized structure.
+
+    Examples
+    --------
+    >>> settings_fingerprint({"a": 1, "b": 2}) == settings_fingerprint({"b": 2, "a": 1})
+    True
+    >>> settings_fingerprint({"a": 1}) == settings_fingerprint({"a": 2})
+    False
+    """
+    serialized = json.dumps(value, sort_keys=True, default=repr)
+    return hashlib.sha256(serialized.encode("utf-8")).hexdigest()
+
 
 def unsafe_docutils_settings_allowed() -> bool:
     """Return whether project settings may re-enable unsafe Docutils features.
@@ -112,6 +178,90 @@ def get_docutils_settings(
     return resolved
 
 
+def _copy_docutils_settings_values(values: frontend.Values) -> frontend.Values:
+    """Return a copy of ``values`` a publisher may mutate freely.
+
+    Publishing writes paths and recorded dependencies onto its settings, so
+    list settings and the dependency recorder are never shared.
+    """
+    copied = values.copy()
+    for name, value in vars(copied).items():
+        if isinstance(value, list):
+            setattr(copied, name, list(value))
+    copied.record_dependencies = utils.DependencyList()
+    return copied
+
+
+def get_docutils_settings_values(
+    settings_overrides: t.Mapping[str, object] | None = None,
+    components: Sequence[SettingsSpec | type[SettingsSpec]] = (),
+) -> frontend.Values:
+    """Return a docutils settings object for ``components``, ready to publish.
+
+    Handing docutils a ``settings_overrides`` dict makes it build an
+    ``OptionParser`` and the full settings spec of every component on each
+    publish. This resolves the overrides with :func:`get_docutils_settings`
+    and builds the settings object once per distinct (components, resolved
+    settings) pair. The memoized object is never handed out: each call returns
+    a private copy, and the memo is dropped whenever :func:`reload_settings`
+    fires.
+
+    Parameters
+    ----------
+    settings_overrides : mapping, optional
+        Per-call Docutils settings, resolved via :func:`get_docutils_settings`.
+    components : sequence
+        Parser, reader, and writer (instances or classes), in the order
+        ``docutils.core.Publisher`` hands them to its option parser.
+
+    Returns
+    -------
+    docutils.frontend.Values
+        Complete settings object for ``docutils.core.Publisher(settings=...)``.
+
+    Examples
+    --------
+    >>> from docutils.parsers.rst import Parser
+    >>> values = get_docutils_settings_values(components=(Parser,))
+    >>> values.raw_enabled, values.file_insertion_enabled
+    (False, False)
+    >>> values is get_docutils_settings_values(components=(Parser,))
+    False
+    """
+    global _docutils_settings_values_generation
+    generation = get_settings_generation()
+    if _docutils_settings_values_generation != generation:
+        _docutils_settings_values.clear()
+        _docutils_settings_values_generation = generation
+
+    resolved = get_docutils_settings(settings_overrides)
+    key = (
+        *(
+            component if isinstance(component, type) else type(component)
+            for component in components
+        ),
+        settings_fingerprint(resolved),
+    )
+    values = _docutils_settings_values.get(key)
+    if values is None:
+        # Propagate exceptions by default when used programmatically, as
+        # ``Publisher.process_programmatic_settings`` does.
+        defaults = {"traceback": True, **resolved}
+        with warnings.catch_warnings():
+            warnings.filterwarnings("ignore", category=DeprecationWarning)
+            option_parser = frontend.OptionParser(
+                components=tuple(components),
+                defaults=defaults,
+                read_config_files=True,
+            )
+            values = option_parser.get_default_values()
+        if len(_docutils_settings_values) >= DOCUTILS_SETTINGS_VALUES_MAXSIZE:
+            del _docutils_settings_values[next(iter(_docutils_settings_values))]
+        _docutils_settings_values[key] = values
+
+    return _copy_docutils_settings_values(values)
+
+
 def get_allowed_uri_schemes() -> frozenset[str]:
     """Return normalized URI schemes allowed in rendered HTML attributes.
 
@@ -158,6 +308,9 @@ def reload_settings(
     >>> dict(DJANGO_DOCUTILS_LIB_RST) == before
     True
     """
+    global _settings_generation
+    _settings_generation += 1
+
     if setting == "DJANGO_DOCUTILS_LIB_RST" and isinstance(value, dict):
         # Snapshot before clear(): on override_settings teardown, value can be
         # the same object as DJANGO_DOCUTILS_LIB_RST.
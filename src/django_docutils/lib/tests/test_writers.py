@@ -2,13 +2,24 @@
 
 from __future__ import annotations
 
+import typing as t
+
+import pytest
 from django.utils.encoding import force_bytes
+from docutils import nodes
 from docutils.core import publish_doctree
 from docutils.writers.html5_polyglot import Writer
 
 from django_docutils.lib.publisher import publish_parts_from_doctree
 from django_docutils.lib.settings import DJANGO_DOCUTILS_LIB_RST
-from django_docutils.lib.writers import DjangoDocutilsWriter
+from django_docutils.lib.writers import (
+    DjangoDocutilsHTMLTranslator,
+    DjangoDocutilsWriter,
+    get_site_hosts,
+)
+
+if t.TYPE_CHECKING:
+    from pytest_mock import MockerFixture
 
 
 def test_HTMLWriter_hides_docinfo() -> None:
@@ -53,3 +64,172 @@ some content
 
     assert "key1" not in parts["html_body"]
     assert "first section" in parts["html_body"]
+
+
+PARTS_CONTENT = """
+Title
+=====
+
+Some *text* with a ``literal``.
+
+Section
+-------
+
+More text.
+"""
+
+
+@pytest.mark.parametrize("part", ["html_body", "fragment", "stylesheet", "whole"])
+def test_requested_parts_match_full_assembly(part: str) -> None:
+    """A part assembled alone is the part docutils assembles with the others."""
+    full = publish_parts_from_doctree(
+        publish_doctree(source=force_bytes(PARTS_CONTENT)),
+        writer=DjangoDocutilsWriter(),
+    )
+    selected = publish_parts_from_doctree(
+        publish_doctree(source=force_bytes(PARTS_CONTENT)),
+        writer=DjangoDocutilsWriter(parts=[part]),
+    )
+
+    assert selected[part] == full[part]
+    assert "head" not in selected
+
+
+def test_requested_parts_skip_template_and_stylesheets(
+    mocker: MockerFixture,
+) -> None:
+    """Without ``whole`` or ``stylesheet``, neither is read from disk."""
+    apply_template = mocker.spy(Writer, "apply_template")
+    stylesheet_call = mocker.spy(DjangoDocutilsHTMLTranslator, "stylesheet_call")
+
+    parts = publish_parts_from_doctree(
+        publish_doctree(source=force_bytes(PARTS_CONTENT)),
+        writer=DjangoDocutilsWriter(parts=["html_body"]),
+    )
+
+    assert "Section" in parts["html_body"]
+    assert apply_template.call_count == 0
+    assert stylesheet_call.call_count == 0
+
+
+@pytest.mark.parametrize(
+    ("uri", "link_class"),
+    [
+        ("https://example.com/page/", "insite"),
+        ("https://docs.example.org/", "insite"),
+        ("https://EXAMPLE.com:8000/", "insite"),
+        ("https://example.com.evil.net/", "offsite"),
+        ("https://evil.net/?next=example.com", "offsite"),
+        ("//evil.net/page/", "offsite"),
+        ("/page/", "insite"),
+        ("page/", "insite"),
+        ("#top", "insite"),
+        ("mailto:admin@example.com", "offsite"),
+    ],
+)
+def test_reference_site_classes(settings: t.Any, uri: str, link_class: str) -> None:
+    """Links are ``insite`` when their host is one of ``ALLOWED_HOSTS``."""
+    settings.ALLOWED_HOSTS = ["example.com", ".example.org", "*"]
+
+    parts = publish_parts_from_doctree(
+        publish_doctree(source=force_bytes(f"`link <{uri}>`_")),
+        writer=DjangoDocutilsWriter(parts=["fragment"]),
+    )
+
+    assert f"external {link_class}" in parts["fragment"]
+    assert ('target="_blank"' in parts["fragment"]) == (link_class == "offsite")
+
+
+def test_site_hosts_follow_settings(settings: t.Any) -> None:
+    """Changing ``ALLOWED_HOSTS`` rebuilds the memoized hosts."""
+    settings.ALLOWED_HOSTS = ["example.com"]
+    assert get_site_hosts().names == {"example.com"}
+
+    settings.ALLOWED_HOSTS = ["example.org"]
+
+    assert get_site_hosts().names == {"example.org"}
+
+
+def _publish_fragment(content: str) -> str:
+    parts = publish_parts_from_doctree(
+        publish_doctree(source=force_bytes(content)),
+        writer=DjangoDocutilsWriter(parts=["fragment"]),
+    )
+    return parts["fragment"]
+
+
+def test_topic_and_admonition_titles_close() -> None:
+    """Titles whose entry keeps the default close tag render as paragraphs."""
+    fragment = _publish_fragment(
+        ".. topic:: Topic\n\n   body\n\n.. sidebar:: Aside\n\n   body\n\n"
+        ".. note:: body\n",
+    )
+
+    assert '<p class="topic-title first">Topic</p>' in fragment
+    assert '<p class="sidebar-title">Aside</p>' in fragment
+    assert '<p class="admonition-title">Note</p>' in fragment
+
+
+def test_title_tags_setting(settings: t.Any) -> None:
+    """``title_tags`` adds to and replaces the built-in title tags."""
+    settings.DJANGO_DOCUTILS_LIB_RST = {
+        "title_tags": {
+            "docutils.nodes.sidebar": {
+                "tag": "h4",
+                "attributes": {"class": "aside-title"},
+            },
+        },
+    }
+
+    fragment = _publish_fragment(".. sidebar:: Aside\n\n   body\n\n.. note:: body\n")
+
+    assert '<h4 class="aside-title">Aside</h4>' in fragment
+    assert '<p class="admonition-title">Note</p>' in fragment
+
+
+def test_title_tags_setting_covers_sections(settings: t.Any) -> None:
+    """``title_tags`` entries for sections and documents replace headings."""
+    settings.DJANGO_DOCUTILS_LIB_RST = {
+        "title_tags": {
+            "docutils.nodes.section": {
+                "tag": "h3",
+                "attributes": {"class": "section-title"},
+            },
+            "docutils.nodes.document": {"tag": "h1", "attributes": {"class": "page"}},
+        },
+    }
+
+    parts = publish_parts_from_doctree(
+        publish_doctree(force_bytes("Page\n====\n\nA\n-\n\nbody\n\nB\n-\n\nbody\n")),
+        writer=DjangoDocutilsWriter(parts=["html_body"]),
+    )
+
+    assert '<h1 class="page">Page</h1>' in parts["html_body"]
+    assert (
+        '<h3 class="section-title"><a class="toc-backref" href="#a">A</a></h3>'
+        in parts["html_body"]
+    )
+
+
+class custom_section(nodes.section):
+    """Section subclass, as extensions define."""
+
+
+class CustomSectionTranslator(DjangoDocutilsHTMLTranslator):
+    """Translator rendering :class:`custom_section` as a section."""
+
+    visit_custom_section = DjangoDocutilsHTMLTranslator.visit_section
+    depart_custom_section = DjangoDocutilsHTMLTranslator.depart_section
+
+
+def test_section_subclass_title() -> None:
+    """Titles of section subclasses render as section headings."""
+    doctree = publish_doctree(force_bytes("A\n=\n\nbody\n\nB\n=\n\nbody\n"))
+    for section in list(doctree.findall(nodes.section)):
+        section.__class__ = custom_section
+    writer = DjangoDocutilsWriter(parts=["fragment"])
+    writer.translator_class = CustomSectionTranslator
+
+    parts = publish_parts_from_doctree(doctree, writer=writer)
+
+    assert '<h2><a class="toc-backref" href="#a"' in parts["fragment"]
@@ -2,14 +2,62 @@
 
 from __future__ import annotations
 
+import functools
 import re
+import typing as t
 
 from django.conf import settings
 from django.utils.module_loading import import_string
 
+from .settings import get_settings_generation
+
+if t.TYPE_CHECKING:
+    from collections.abc import Callable, Iterable
+
 _word_re = re.compile(r"\w+", re.UNICODE)
 _word_beginning_split_re = re.compile(r"([\s\(\{\[\<]+)", re.UNICODE)
 
+SMART_TITLE_CACHE_MAXSIZE: t.Final = 2048
+"""Distinct strings :func:`smart_title` remembers the titlecase of."""
+
+_uncapitalized_word_filters: tuple[int, tuple[Callable[[str], t.Any], ...]] | None = (
+    None
+)
+
+
+def get_uncapitalized_word_filters() -> tuple[Callable[[str], t.Any], ...]:
+    """Return ``DJANGO_DOCUTILS_LIB_TEXT["uncapitalized_word_filters"]``, imported.
+
+    Imported once per settings generation.
+
+    Examples
+    --------
+    >>> from django.test import override_settings
+    >>> with override_settings(
+    ...     DJANGO_DOCUTILS_LIB_TEXT={
+    ...         "uncapitalized_word_filters": ["keyword.iskeyword"],
+    ...     },
+    ... ):
+    ...     filters = get_uncapitalized_word_filters()
+    ...     filters is get_uncapitalized_word_filters(), is_uncapitalized_word("if")
+    (True, True)
+    """
+    global _uncapitalized_word_filters
+    generation = get_settings_generation()
+    if (
+        _uncapitalized_word_filters is not None
+        and _uncapitalized_word_filters[0] == generation
+    ):
+        return _uncapitalized_word_filters[1]
+
+    config = getattr(settings, "DJANGO_DOCUTILS_LIB_TEXT", {})
+    filters = tuple(
+        import_string(filter_fn_str)
+        for filter_fn_str in config.get("uncapitalized_word_filters", [])
+    )
+    _uncapitalized_word_filters = (generation, filters)
+    return filters
+
 
 def is_uncapitalized_word(value: str) -> bool:
     """Return True if term/word segment is special uncap term (e.g. "django-").
@@ -51,17 +99,7 @@ def is_uncapitalized_word(value: str) -> bool:
            ]
        }
     """
-    try:
-        config = settings.DJANGO_DOCUTILS_LIB_TEXT
-    except AttributeError:
-        return False
-
-    if "uncapitalized_word_filters" in config:
-        for filter_fn_str in config["uncapitalized_word_filters"]:
-            filter_ = import_string(filter_fn_str)
-            if filter_(value):
-                return True
-    return False
+    return any(filter_(value) for filter_ in get_uncapitalized_word_filters())
 
 
 def smart_capfirst(value: str) -> str:
@@ -69,10 +107,18 @@ def smart_capfirst(value: str) -> str:
     return value[0].upper() + value[1:]
 
 
+@functools.lru_cache(maxsize=SMART_TITLE_CACHE_MAXSIZE)
 def smart_title(value: str) -> str:
     """Convert a string into titlecase, except for special cases.
 
     Django can still be capitalized, but it must already be like that.
+
+    Results are memoized, most recently used first.
+
+    Examples
+    --------
+    >>> smart_title("django-docutils (a [docutils] bridge)")
+    'Django-docutils (A [Docutils] Bridge)'
     """
     return "".join(
         [
@@ -81,3 +127,14 @@ def smart_title(value: str) -> str:
             if item
         ],
     )
+
+
+def smart_title_many(values: Iterable[str]) -> list[str]:
+    """Return :func:`smart_title` of each of ``values``, e.g. for menus.
+
+    Examples
+    --------
+    >>> smart_title_many(["getting started", "api", "getting started"])
+    ['Getting Started', 'Api', 'Getting Started']
+    """
+    return [smart_title(value) for value in values]
@@ -2,99 +2,181 @@
 
 from __future__ import annotations
 
+import functools
 import re
 import typing as t
-from collections.abc import Iterable, Iterator
 
 from docutils import nodes
 from docutils.transforms import Transform
-from pygments import highlight
-from pygments.formatters.html import HtmlFormatter
-from pygments.token import Token, _TokenType
-
-TokenStream = Iterable[tuple[_TokenType, str]]
-TokenGenerator = Iterator[tuple[str | int, str]]
-
-
-class InlineHtmlFormatter(HtmlFormatter):  # type:ignore
-    """HTMLFormatter for inline codeblocks."""
-
-    def format_unencoded(self, tokensource: TokenStream, outfile: t.Any) -> None:
-        r"""Trim inline element of space and newlines.
-
-        1. Trailing newline: Final token generated returns ``(Token.Other, '\n')``
-           results in a blank space ``<span class="x"></span>``.
-
-           This would be unnoticeable for a code block, but as this is inline, it looks
-           strange. Let's filter out any trailing newlines from token source, then
-           fallback to the normal process by passing it back into parent class method.
-        2. Trailing space:
-
-           *After* this method ``_format_lines`` still adds a ``\n`` (which renders as a
-           space again in the browser). To suppress that pass ``lineseparator=''`` to
-           the ``InlineHtmlFormatter`` class.
-        """
-
-        def filter_trailing_newline(source: TokenStream) -> TokenStream:
-            tokens = list(source)
-
-            # filter out the trailing newline token
-            if tokens[-1] == (Token.Text, "\n"):
-                del tokens[-1]
-
-            return ((t, v) for t, v in tokens)
-
-        source = filter_trailing_newline(tokensource)
-
-        return super().format_unencoded(source, outfile)
-
-    def _wrap_div(
-        self,
-        inner: TokenStream,
-    ) -> TokenGenerator | TokenStream:
-        styles = []
-        if (
-            self.noclasses
-            and not self.nobackground
-            and self.style.background_color is not None
-        ):
-            styles.append(f"background: {self.style.background_color}")
-        if self.cssstyles:
-            styles.append(self.cssstyles)
-        style = "; ".join(styles)
-
-        yield (
-            0,
-            (
-                "<span"
-                + (f' class="{self.cssclass}"' if self.cssclass else "")
-                + (f' style="{style}"' if style else "")
-                + ">"
-            ),
-        )
-        yield from inner
-        yield 0, "</span>\n"
-
-    def _wrap_pre(self, inner: TokenStream) -> TokenStream:
-        yield from inner
-
-
-formatter = InlineHtmlFormatter(
-    cssclass="highlight docutils literal inline-code",
-    noclasses=False,
-    lineseparator="",  # removes \n from end of inline snippet
+
+from django_docutils.lib.highlight import get_lexer, highlight_code
+from django_docutils.lib.settings import (
+    DJANGO_DOCUTILS_LIB_RST,
+    get_settings_generation,
 )
 
+if t.TYPE_CHECKING:
+    from pygments.lexer import Lexer
+
+    from django_docutils.lib.formatters import InlineHtmlFormatter
+
+DEFAULT_GUESS_MIN_LENGTH: t.Final = 3
+"""Shortest inline literal, in characters, a lexer is guessed for."""
+
+DEFAULT_GUESS_MAX_LENGTH: t.Final = 200
+"""Longest inline literal, in characters, a lexer is guessed for."""
+
+LEXER_GUESS_CACHE_MAXSIZE: t.Final = 2048
+"""Distinct (literal, policy) guesses :func:`guess_inline_lexer` remembers."""
+
+_lexer_guess_policy: tuple[int, LexerGuessPolicy] | None = None
+
+
+class LexerGuessPolicy(t.NamedTuple):
+    """Lexers and literal lengths :class:`CodeTransform` guesses among.
+
+    Built from ``DJANGO_DOCUTILS_LIB_RST["inline_code"]`` by
+    :func:`get_lexer_guess_policy`.
+    """
+
+    lexer_classes: tuple[type[Lexer], ...]
+    min_length: int
+    max_length: int
+
+
+def get_lexer_guess_policy() -> LexerGuessPolicy:
+    """Return the lexer guessing policy for the current settings.
+
+    Lexer aliases in ``DJANGO_DOCUTILS_LIB_RST["inline_code"]["guess_lexers"]``
+    are resolved once per settings generation; an unknown alias raises
+    :class:`pygments.util.ClassNotFound`.
+
+    Examples
+    --------
+    >>> get_lexer_guess_policy().lexer_classes
+    ()
+    >>> get_lexer_guess_policy() is get_lexer_guess_policy()
+    True
+    """
+    global _lexer_guess_policy
+    generation = get_settings_generation()
+    if _lexer_guess_policy is not None and _lexer_guess_policy[0] == generation:
+        return _lexer_guess_policy[1]
+
+    from pygments.lexers import find_lexer_class_by_name
+
+    inline_code_settings = DJANGO_DOCUTILS_LIB_RST.get("inline_code", {})
+    policy = LexerGuessPolicy(
+        lexer_classes=tuple(
+            find_lexer_class_by_name(alias)
+            for alias in inline_code_settings.get("guess_lexers", [])
+        ),
+        min_length=inline_code_settings.get(
+            "guess_min_length",
+            DEFAULT_GUESS_MIN_LENGTH,
+        ),
+        max_length=inline_code_settings.get(
+            "guess_max_length",
+            DEFAULT_GUESS_MAX_LENGTH,
+        ),
+    )
+    _lexer_guess_policy = (generation, policy)
+    return policy
+
+
+@functools.lru_cache(maxsize=LEXER_GUESS_CACHE_MAXSIZE)
+def guess_inline_lexer(text: str, policy: LexerGuessPolicy) -> type[Lexer] | None:
+    """Return the lexer class in ``policy`` scoring highest for ``text``.
+
+    Only the lexers ``policy`` allows are scored, each through its
+    ``analyse_text``, rather than every lexer Pygments ships. Literals outside
+    the policy's length bounds, and literals no lexer claims, get ``None``.
+    Guesses are remembered per (literal, policy), so literals repeated within
+    and across documents are scored once.
+
+    Examples
+    --------
+    >>> from pygments.lexers.python import PythonLexer
+    >>> from pygments.lexers.shell import BashLexer
+    >>> policy = LexerGuessPolicy((BashLexer, PythonLexer), 3, 200)
+    >>> guess_inline_lexer("#!/usr/bin/env python3", policy).__name__
+    'PythonLexer'
+    >>> guess_inline_lexer("#!", policy) is None
+    True
+    """
+    if not policy.min_length <= len(text) <= policy.max_length:
+        return None
+
+    best_class = None
+    best_score = 0.0
+    for lexer_class in policy.lexer_classes:
+        score = lexer_class.analyse_text(text)
+        if score > best_score:
+            best_class, best_score = lexer_class, score
+            if score >= 1.0:
+                break
+    return best_class
+
+
+@functools.cache
+def get_inline_formatter() -> InlineHtmlFormatter:
+    """Return the formatter inline literals are highlighted with.
+
+    Built on first use, so Pygments' HTML formatter is only imported by
+    processes that highlight inline code.
+
+    Examples
+    --------
+    >>> get_inline_formatter().cssclass
+    'highlight docutils literal inline-code'
+    """
+    from django_docutils.lib.formatters import InlineHtmlFormatter
+
+    return InlineHtmlFormatter(
+        cssclass="highlight docutils literal inline-code",
+        noclasses=False,
+        lineseparator="",  # removes \n from end of inline snippet
+    )
+
+
+def __getattr__(name: str) -> t.Any:
+    """Resolve the Pygments-backed ``InlineHtmlFormatter`` and ``formatter``.
+
+    Both used to be built at import time; they remain importable from here
+    but now import Pygments on first access.
+    """
+    if name == "InlineHtmlFormatter":
+        from django_docutils.lib.formatters import InlineHtmlFormatter
+
+        return InlineHtmlFormatter
+    if name == "formatter":
+        return get_inline_formatter()
+    msg = f"module {__name__!r} has no attribute {name!r}"
+    raise AttributeError(msg)
+
 
 class CodeTransform(Transform):
-    """Run over unparsed literals and try to guess language + highlight."""
+    """Run over unparsed literals and try to guess language + highlight.
+
+    Literals starting with ``$ ``, ``{%`` / ``{{``, or a ``:role:`` are
+    highlighted as shell sessions, Django templates, and reStructuredText.
+    Other literals are only highlighted when
+    ``DJANGO_DOCUTILS_LIB_RST["inline_code"]["guess_lexers"]`` names lexers
+    to guess among; see :func:`guess_inline_lexer`.
+    """
 
     default_priority = 120
 
+    #: Only adds raw nodes holding Pygments-escaped HTML, marked trusted, so
+    #: the writer's final sanitize pass need not run again after it.
+    django_docutils_sanitize_safe = True
+
     def apply(self, **kwargs: t.Any) -> None:
         """Apply CodeTransform."""
         paragraph_nodes = self.document.traverse(nodes.literal)
 
+        guess_policy = get_lexer_guess_policy()
+
         for node in paragraph_nodes:
             text = node.astext()
 
@@ -103,29 +185,24 @@ class CodeTransform(Transform):
             newlexer: t.Any = None
 
             if text.startswith("$ "):
-                from pygments.lexers.shell import BashSessionLexer
-
                 from django_docutils.lib.directives.code import patch_bash_session_lexer
 
                 patch_bash_session_lexer()
 
-                newlexer = BashSessionLexer()
+                newlexer = get_lexer("console")
             elif text.startswith(("{%", "{{")):
-                from pygments.lexers.templates import DjangoLexer
-
-                newlexer = DjangoLexer()
+                newlexer = get_lexer("django")
             elif re.match(r"^:\w+:", text):  # match :rolename: beginning
-                from pygments.lexers.markup import RstLexer
-
-                newlexer = RstLexer()  # type:ignore
-            else:
-                from pygments.lexers import guess_lexer
-                from pygments.lexers.mime import MIMELexer
-                from pygments.lexers.special import TextLexer
-
-                guess = guess_lexer(text)
-                if not any(guess.__class__ != lex for lex in [MIMELexer, TextLexer]):
-                    newlexer = guess
+                newlexer = get_lexer("rst")
+            elif guess_policy.lexer_classes:
+                # Guess on the literal as it would be highlighted, so literals
+                # differing only in wrapping share one memoized guess.
+                guessed_class = guess_inline_lexer(
+                    text.strip().replace("\n", " "),
+                    guess_policy,
+                )
+                if guessed_class is not None:
+                    newlexer = guessed_class()
 
             if newlexer:
                 """Inline code can't have newlines, but we still get them:
@@ -146,7 +223,7 @@ class CodeTransform(Transform):
                 text = text.strip()  # trim any whitespace around text
                 text = text.replace("\n", " ")  # switch out newlines w/ space
 
-                newtext = highlight(text, newlexer, formatter)
+                newtext = highlight_code(text, newlexer, get_inline_formatter())
 
             if newtext:
                 newnode = nodes.raw("", newtext, format="html")
@@ -0,0 +1,72 @@
+"""Fill in remote URL role placeholders once the document is parsed."""
+
+from __future__ import annotations
+
+import typing as t
+
+from docutils import utils
+from docutils.transforms import Transform
+
+from django_docutils.lib.roles.common import make_remote_url_reference
+from django_docutils.lib.roles.remote import remote_url_reference
+
+if t.TYPE_CHECKING:
+    from django_docutils.lib.roles.remote import RemoteUrlResolver
+
+
+class RemoteUrlTransform(Transform):
+    """Replace remote URL role placeholders with references.
+
+    The unique targets of each resolver are looked up together, through
+    :meth:`~django_docutils.lib.roles.remote.RemoteUrlResolver.resolve_many`,
+    so a page citing the same data source many times makes one round-trip.
+    Runs before substitutions are applied, so substituted roles resolve too.
+
+    Examples
+    --------
+    >>> from docutils import nodes
+    >>> from django_docutils.lib.publisher import publish_doctree
+    >>> from django_docutils.lib.roles.common import generic_remote_url_role
+    >>> from django_docutils.lib.roles.remote import RemoteUrlResolver
+    >>> from docutils.parsers.rst import roles
+    >>> lookups = []
+    >>> def lookup(targets):
+    ...     lookups.append(list(targets))
+    ...     return {target: (target.upper(), f"/{target}/") for target in targets}
+    >>> resolver = RemoteUrlResolver(batch_url_handler_fn=lookup)
+    >>> def product_role(name, rawtext, text, lineno, inliner, options=None,
+    ...                  content=None):
+    ...     return generic_remote_url_role(name, text, resolver)
+    >>> roles.register_local_role("product", product_role)
+    >>> doctree = publish_doctree(
+    ...     ":product:`ab`, :product:`cd` and :product:`the first <ab>`"
+    ... )
+    >>> lookups
+    [['ab', 'cd']]
+    >>> [node.astext() for node in doctree.findall(nodes.reference)]
+    ['AB', 'CD', 'the first']
+    """
+
+    default_priority = 215
+
+    def apply(self, **kwargs: t.Any) -> None:
+        """Look up the placeholders' targets and replace them with references."""
+        placeholders: dict[RemoteUrlResolver, list[remote_url_reference]] = {}
+        for node in self.document.findall(remote_url_reference):
+            placeholders.setdefault(node["resolver"], []).append(node)
+
+        for resolver, pending in placeholders.items():
+            answers = resolver.resolve_many(node["target"] for node in pending)
+            for node in pending:
+                remote_title, url = answers[node["target"]]
+                title = node["title"]
+                if title is None:
+                    title = utils.unescape(remote_title)
+                node.replace_self(
+                    make_remote_url_reference(
+                        node["role"],
+                        title,
+                        url,
+                        node["innernodeclass"],
+                    ),
+                )
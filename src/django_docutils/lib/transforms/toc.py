@@ -75,3 +75,67 @@ class Contents(parts.Contents):
                 contents["classes"].append("auto-toc")
             return contents
         return []
+
+
+def build_toc_document(
+    doctree: nodes.document,
+    settings: t.Any = None,
+    reporter: t.Any = None,
+) -> nodes.document | None:
+    r"""Return a standalone document holding the table of contents of ``doctree``.
+
+    Section titles in ``doctree`` gain backlinks pointing at their own TOC
+    entry, so readers can copy an anchor from a header.
+
+    Parameters
+    ----------
+    doctree : docutils.nodes.document
+        Document to build the table of contents for.
+    settings : optional
+        docutils settings for the new document. Publishing the document
+        through a doctree reader fills these in when omitted.
+    reporter : optional
+        docutils reporter for the new document.
+
+    Returns
+    -------
+    docutils.nodes.document or None
+        ``fixed-toc-menu`` document, or ``None`` when ``doctree`` has no
+        sections.
+
+    Examples
+    --------
+    >>> from django_docutils.lib.publisher import publish_doctree
+    >>> doctree = publish_doctree("Title\n=====\n\nOne\n---\n\nTwo\n---\n")
+    >>> toc_tree = build_toc_document(doctree)
+    >>> [node.astext() for node in toc_tree.findall(nodes.reference)]
+    ['One', 'Two']
+    >>> build_toc_document(publish_doctree("No sections")) is None
+    True
+    """
+    toc_tree = nodes.document(
+        settings,
+        reporter,
+        source="toc-generator",
+        classes=["fixed-toc-menu menu"],
+    )
+    toc_tree += nodes.paragraph("", "Contents", classes=["menu-label"])
+    # The Contents transform requires a "pending" startnode and generation
+    # options startnode
+    pending = nodes.pending(Contents, rawsource="")
+
+    contents_transform = Contents(doctree, pending)
+
+    # this assures we get backlinks pointing to themselves
+    # so users can copy anchor from headers
+    contents_transform.backlinks = "entry"
+
+    toc_contents = contents_transform.build_contents(doctree)
+
+    if not toc_contents:  # ToC is empty
+        return None
+
+    toc_topic = nodes.topic(classes=["contents", "toc"])
+    toc_topic += toc_contents
+    toc_tree += toc_topic
+    return toc_tree
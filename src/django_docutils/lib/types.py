@@ -4,6 +4,9 @@ from __future__ import annotations
 
 import typing as t
 
+if t.TYPE_CHECKING:
+    from django_docutils._internal.types import StrPath
+
 
 class DjangoDocutilsLibRSTRolesSettings(t.TypedDict, total=False):
     """Docutils role mappings.
@@ -53,6 +56,90 @@ class DjangoDocutilsLibRSTDocutilsSettings(t.TypedDict, total=False):
     initial_header_level: int
 
 
+class DjangoDocutilsLibRSTCacheSettings(t.TypedDict, total=False):
+    """Rendered-output cache settings.
+
+    Attributes
+    ----------
+    alias : str
+        :data:`django.core.cache.caches` alias rendered HTML is stored in.
+        Unset means ``"default"``.
+    timeout : int | None
+        Seconds an entry lives; ``None`` keeps entries until evicted. Unset
+        means the cache's own default timeout.
+    key_prefix : str
+        Prefix of every cache key. Unset means ``"django_docutils"``.
+    """
+
+    alias: str
+    timeout: int | None
+    key_prefix: str
+
+
+class DjangoDocutilsLibRSTDoctreeStoreSettings(t.TypedDict):
+    """Persistent doctree store settings.
+
+    Attributes
+    ----------
+    path : StrPath
+        Directory parsed doctrees are pickled into. Must only be writable by
+        the application.
+    """
+
+    path: StrPath
+
+
+class DjangoDocutilsLibRSTInlineCodeSettings(t.TypedDict, total=False):
+    """Inline literal highlighting settings for ``CodeTransform``.
+
+    Attributes
+    ----------
+    guess_lexers : list[str]
+        Pygments lexer aliases a lexer is guessed among for literals no
+        prefix rule matches. Unset or empty means such literals are left
+        unhighlighted.
+    guess_min_length : int
+        Shortest literal, in characters, a lexer is guessed for. Unset means 3.
+    guess_max_length : int
+        Longest literal, in characters, a lexer is guessed for. Unset means
+        200.
+    """
+
+    guess_lexers: list[str]
+    guess_min_length: int
+    guess_max_length: int
+
+
+class DjangoDocutilsLibRSTTitleTagSettings(t.TypedDict, total=False):
+    """How the writer renders titles of one kind of parent node.
+
+    Attributes
+    ----------
+    tag : str
+        Element the title is wrapped in. Unset means ``"p"``.
+    attributes : dict[str, str]
+        HTML attributes of the element, e.g. ``{"class": "card-title"}``.
+    close_tag : str
+        Markup closing the element. Unset means ``</tag>`` and a newline.
+    """
+
+    tag: str
+    attributes: dict[str, str]
+    close_tag: str
+
+
+class DjangoDocutilsLibRSTAsyncRenderSettings(t.TypedDict, total=False):
+    """Settings of the executor async views and ``apublish_*`` render on.
+
+    Attributes
+    ----------
+    max_workers : int
+        Renders run at once; further renders queue. Unset means 4.
+    """
+
+    max_workers: int
+
+
 class DjangoDocutilsLibRSTSettings(t.TypedDict, total=False):
     """Core settings object for ``DJANGO_DOCUTILS_LIB_RST``.
 
@@ -78,6 +165,28 @@ class DjangoDocutilsLibRSTSettings(t.TypedDict, total=False):
         :class:`docutils.parsers.rst.Directive` subclass registered for it.
     roles : DjangoDocutilsLibRSTRolesSettings
         Role registrations, grouped by the scope they are registered in.
+    cache : DjangoDocutilsLibRSTCacheSettings
+        Opt in to caching rendered HTML in Django's cache framework. Unset
+        means every render runs docutils.
+    doctree_store : DjangoDocutilsLibRSTDoctreeStoreSettings
+        Opt in to keeping parsed doctrees on disk across processes and
+        restarts. Unset means every publish parses its source.
+    server_timing : bool
+        Attach per-stage render timings to view responses as a
+        ``Server-Timing`` header. Unset means ``False``.
+    inline_code : DjangoDocutilsLibRSTInlineCodeSettings
+        How ``CodeTransform`` highlights inline literals.
+    highlight_cache : DjangoDocutilsLibRSTCacheSettings
+        Opt in to sharing Pygments highlighting across processes through
+        Django's cache framework. Unset means each process keeps its own.
+    title_tags : dict[str, DjangoDocutilsLibRSTTitleTagSettings]
+        Import string of a :class:`docutils.nodes.Element` subclass to how
+        titles directly inside it render, adding to or replacing the
+        writer's built-in topic, sidebar, admonition, and table titles.
+        Section and document entries replace the heading tag and attributes.
+    async_render : DjangoDocutilsLibRSTAsyncRenderSettings
+        How many renders async views and ``apublish_*`` coroutines run at
+        once, off the event loop.
     """
 
     allow_unsafe_docutils_settings: bool
@@ -87,6 +196,13 @@ class DjangoDocutilsLibRSTSettings(t.TypedDict, total=False):
     docutils: DjangoDocutilsLibRSTDocutilsSettings
     directives: dict[str, str]
     roles: DjangoDocutilsLibRSTRolesSettings
+    cache: DjangoDocutilsLibRSTCacheSettings
+    doctree_store: DjangoDocutilsLibRSTDoctreeStoreSettings
+    server_timing: bool
+    inline_code: DjangoDocutilsLibRSTInlineCodeSettings
+    highlight_cache: DjangoDocutilsLibRSTCacheSettings
+    title_tags: dict[str, DjangoDocutilsLibRSTTitleTagSettings]
+    async_render: DjangoDocutilsLibRSTAsyncRenderSettings
 
 
 class DjangoDocutilsLibTextSettings(t.TypedDict):
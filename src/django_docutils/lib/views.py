@@ -2,26 +2,185 @@
 
 from __future__ import annotations
 
+import itertools
 import pathlib
 import typing as t
+import uuid
 
+from asgiref.sync import sync_to_async
+from django.http import StreamingHttpResponse
+from django.template.loader import select_template
+from django.template.response import TemplateResponse
 from django.utils.functional import cached_property
-from django.views.generic.base import ContextMixin, TemplateView
-
+from django.utils.safestring import mark_safe
+from django.views.generic.base import ContextMixin, TemplateView, View
+
+from .asynchronous import aiter_in_render_executor, run_in_render_executor
+from .cache import cached_render
+from .instrumentation import (
+    add_server_timing,
+    collect_stage_timings,
+    server_timing_enabled,
+)
 from .publisher import (
+    PublishedDocument,
+    StreamedDocument,
     publish_doctree,
-    publish_html_from_doctree,
-    publish_toc_from_doctree,
+    publish_document_from_doctree,
+    stream_document_from_source,
 )
 from .text import smart_title
 
 if t.TYPE_CHECKING:
-    from django.http import HttpRequest
+    from collections.abc import AsyncIterable, AsyncIterator, Iterable
+
+    from django.http import HttpRequest, HttpResponse, HttpResponseBase
     from docutils import nodes
 
     from django_docutils._internal.types import StrPath
 
 
+class ServerTimingTemplateResponse(TemplateResponse):
+    """TemplateResponse reporting render stage timings as ``Server-Timing``.
+
+    Only when ``DJANGO_DOCUTILS_LIB_RST["server_timing"]`` is set.
+    """
+
+    def render(self) -> ServerTimingTemplateResponse:
+        """Render the response, timing docutils stages run while rendering."""
+        if self.is_rendered or not server_timing_enabled():
+            return super().render()  # type:ignore[return-value]
+
+        with collect_stage_timings() as timings:
+            response = super().render()
+        add_server_timing(self, timings)
+        return response  # type:ignore[return-value]
+
+
+def stream_template_response(
+    request: HttpRequest,
+    template_names: list[str],
+    context: dict[str, t.Any],
+    chunks: Iterable[str] | AsyncIterable[str],
+    content_type: str | None = None,
+    status: int | None = None,
+    using: str | None = None,
+) -> StreamingHttpResponse:
+    """Return a response streaming ``chunks`` as the template's ``content``.
+
+    The template is rendered once, with a placeholder standing in for
+    ``content``. What precedes the placeholder is sent first, then the chunks
+    as they are produced, then the rest of the template. A template using
+    ``content`` more than once gets the joined chunks in every place, and
+    one not using it is sent as is.
+
+    Parameters
+    ----------
+    request : django.http.HttpRequest
+        Request the template is rendered for.
+    template_names : list[str]
+        Candidate templates, as for :func:`django.template.loader.select_template`.
+    context : dict
+        Template context. ``content`` is overwritten.
+    chunks : iterable or async iterable of str
+        HTML, e.g. from
+        :func:`~django_docutils.lib.publisher.stream_document_from_source`.
+        An async iterable makes an async streaming response, for ASGI.
+    content_type, status : optional
+        Forwarded to :class:`django.http.StreamingHttpResponse`.
+    using : str, optional
+        Template engine name.
+
+    Returns
+    -------
+    django.http.StreamingHttpResponse
+        Response whose content, joined, matches rendering ``content`` in full.
+    """
+    placeholder = f"<!-- django-docutils:content:{uuid.uuid4().hex} -->"
+    html = select_template(template_names, using=using).render(
+        {**context, "content": mark_safe(placeholder)},
+        request,
+    )
+    streaming_content: Iterable[str] | AsyncIterable[str]
+    if not isinstance(chunks, t.AsyncIterable):
+        if html.count(placeholder) == 1:
+            head, _, tail = html.partition(placeholder)
+            streaming_content = itertools.chain([head], chunks, [tail])
+        else:
+            streaming_content = [html.replace(placeholder, "".join(chunks))]
+    else:
+        streaming_content = _aiter_template_content(html, placeholder, chunks)
+    return StreamingHttpResponse(
+        streaming_content,
+        content_type=content_type,
+        status=status,
+    )
+
+
+async def _aiter_template_content(
+    html: str,
+    placeholder: str,
+    chunks: AsyncIterable[str],
+) -> AsyncIterator[str]:
+    """Yield ``html`` with async ``chunks`` in place of ``placeholder``."""
+    if html.count(placeholder) == 1:
+        head, _, tail = html.partition(placeholder)
+        yield head
+        async for chunk in chunks:
+            yield chunk
+        yield tail
+    else:
+        yield html.replace(placeholder, "".join([chunk async for chunk in chunks]))
+
+
+class ServerTimingMixin(View):
+    """View mixin reporting docutils stage timings as ``Server-Timing``.
+
+    Covers stages run while the view handles the request and, through
+    :class:`ServerTimingTemplateResponse`, while its template renders. Only
+    when ``DJANGO_DOCUTILS_LIB_RST["server_timing"]`` is set.
+    """
+
+    response_class: type[HttpResponse] = ServerTimingTemplateResponse
+
+    def dispatch(
+        self,
+        request: HttpRequest,
+        *args: t.Any,
+        **kwargs: t.Any,
+    ) -> HttpResponseBase:
+        """Dispatch the request, timing docutils stages run on the way."""
+        if not server_timing_enabled():
+            return super().dispatch(request, *args, **kwargs)
+        if self.view_is_async:
+            # Async handlers return a coroutine; time it as it is awaited.
+            return self._adispatch(  # type:ignore[return-value]
+                request,
+                *args,
+                **kwargs,
+            )
+
+        with collect_stage_timings() as timings:
+            response = super().dispatch(request, *args, **kwargs)
+        add_server_timing(response, timings)
+        return response
+
+    async def _adispatch(
+        self,
+        request: HttpRequest,
+        *args: t.Any,
+        **kwargs: t.Any,
+    ) -> HttpResponseBase:
+        with collect_stage_timings() as timings:
+            response = await super().dispatch(  # type:ignore[misc]
+                request,
+                *args,
+                **kwargs,
+            )
+        add_server_timing(response, timings)
+        return response  # type:ignore[no-any-return]
+
+
 class TitleMixin(ContextMixin):
     """ContextMixin that capitalizes title and subtitle."""
 
@@ -67,23 +226,55 @@ class RSTMixin:
 
         return publish_doctree(self.raw_content)
 
+    @cached_property
+    def published_document(self) -> PublishedDocument | None:
+        """Return body, TOC, and metadata of RST content from a single publish.
+
+        Published from :attr:`doctree`, so overriding it changes the output.
+        Served from the rendered-output cache when one is configured, which
+        ``manage.py docutils_prerender`` can warm ahead of time; entries are
+        keyed by :attr:`raw_content`, so a view whose :attr:`doctree` differs
+        from the parsed source should leave that cache off.
+        """
+        if self.raw_content is None:
+            return None
+
+        def render() -> PublishedDocument:
+            assert self.doctree is not None
+            return publish_document_from_doctree(self.doctree)
+
+        return cached_render("document", self.raw_content, render)
+
     @cached_property
     def sidebar(self, **kwargs: object) -> str | None:
         """Return table of contents sidebar of RST content as HTML."""
-        if self.doctree is None:
+        if self.published_document is None:
             return None
 
-        return publish_toc_from_doctree(self.doctree)
+        return self.published_document.toc
 
     @cached_property
     def content(self) -> str | None:
         """Return reStructuredText content as HTML."""
-        if self.doctree is None:
+        if self.published_document is None:
             return None
 
-        return publish_html_from_doctree(
-            self.doctree,
-            **getattr(self, "rst_settings", {}),
+        return self.published_document.html(**getattr(self, "rst_settings", {}))
+
+    @cached_property
+    def streamed_document(self) -> StreamedDocument | None:
+        """Return RST content as lazily translated HTML chunks, plus its TOC.
+
+        Bypasses the rendered-output cache; see
+        :func:`~django_docutils.lib.publisher.stream_document_from_source`.
+        """
+        if self.raw_content is None:
+            return None
+
+        rst_settings = getattr(self, "rst_settings", {})
+        return stream_document_from_source(
+            self.raw_content,
+            show_title=rst_settings.get("show_title", True),
         )
 
     def get_base_template(self) -> str:
@@ -93,7 +284,7 @@ class RSTMixin:
         return "base.html"
 
 
-class RSTRawView(TemplateTitleView):
+class RSTRawView(ServerTimingMixin, TemplateTitleView):
     """Send pure reStructuredText to template.
 
     Requires template tags to process it.
@@ -129,11 +320,26 @@ class RSTRawView(TemplateTitleView):
 
 
 class RSTView(RSTRawView, RSTMixin):
-    """RestructuredText Django View."""
+    """RestructuredText Django View.
+
+    With ``stream = True``, the response is a
+    :class:`~django.http.StreamingHttpResponse` sending the document HTML as
+    it is translated, so large documents start arriving before they finish
+    rendering and are never held in memory whole.
+    """
 
     template_name = "rst/base.html"
     file_path: StrPath | None = None
     title = None
+    stream: bool = False
+
+    def is_streaming(self) -> bool:
+        """Return whether this response streams the document HTML."""
+        return (
+            self.stream
+            and self.raw_content is not None
+            and not getattr(self, "rst_settings", {}).get("toc_only", False)
+        )
 
     @cached_property
     def raw_content(self) -> str | None:
@@ -147,7 +353,69 @@ class RSTView(RSTRawView, RSTMixin):
     def get_context_data(self, **kwargs: object) -> dict[str, t.Any]:
         """Merge content and sidebar to context data."""
         context = super().get_context_data(**kwargs)
+        if self.is_streaming():
+            assert self.streamed_document is not None
+            context["sidebar"] = self.streamed_document.toc
+            return context
+
         context["content"] = self.content
         context["sidebar"] = self.sidebar
 
         return context
+
+    def get_content_chunks(self) -> Iterable[str] | AsyncIterable[str]:
+        """Return the document HTML chunks a streaming response sends."""
+        assert self.streamed_document is not None
+        return self.streamed_document.chunks
+
+    def render_to_response(
+        self,
+        context: dict[str, t.Any],
+        **response_kwargs: t.Any,
+    ) -> HttpResponse:
+        """Render the template, streaming the document HTML if ``stream``."""
+        if not self.is_streaming():
+            return super().render_to_response(context, **response_kwargs)
+
+        # StreamingHttpResponse serves wherever views return HttpResponse.
+        return stream_template_response(  # type:ignore[return-value]
+            self.request,
+            self.get_template_names(),
+            context,
+            self.get_content_chunks(),
+            content_type=response_kwargs.get("content_type"),
+            status=response_kwargs.get("status"),
+            using=self.template_engine,
+        )
+
+
+class AsyncRSTView(RSTView):
+    """:class:`RSTView` for ASGI deployments, rendering off the event loop.
+
+    Reading and publishing the document run on the bounded executor of
+    :mod:`django_docutils.lib.asynchronous`, so slow renders queue there
+    instead of blocking other requests. With ``stream = True``, each chunk of
+    HTML is translated on the executor as the client reads it.
+    """
+
+    def _render_document(self) -> None:
+        """Fill the cached document properties the response will read."""
+        if not self.is_streaming():
+            _ = self.content, self.sidebar
+        else:
+            _ = self.streamed_document
+
+    def get_content_chunks(self) -> AsyncIterable[str]:
+        """Return the document HTML chunks, each translated on the executor."""
+        chunks = t.cast("Iterable[str]", super().get_content_chunks())
+        return aiter_in_render_executor(iter(chunks))
+
+    async def get(  # type:ignore[override]
+        self,
+        request: HttpRequest,
+        *args: t.Any,
+        **kwargs: t.Any,
+    ) -> HttpResponse:
+        """Render the document on the executor, then respond as :class:`RSTView`."""
+        await run_in_render_executor(self._render_document)
+        return await sync_to_async(super().get)(request, *args, **kwargs)
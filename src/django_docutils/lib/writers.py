@@ -2,16 +2,152 @@
 
 from __future__ import annotations
 
+import copy
+import functools
 import typing as t
+from urllib.parse import urlsplit
 
 from django.conf import settings
 from django.utils.module_loading import import_string
-from docutils import nodes
+from docutils import nodes, writers
 from docutils.transforms import Transform
+from docutils.writers import _html_base
 from docutils.writers.html5_polyglot import HTMLTranslator, Writer
 
+from .instrumentation import time_stage
 from .sanitize import sanitize_doctree
-from .settings import DJANGO_DOCUTILS_LIB_RST
+from .settings import DJANGO_DOCUTILS_LIB_RST, get_settings_generation
+from .transforms.toc import build_toc_document
+
+try:
+    from django_docutils.favicon.rst.nodes import icon  # type:ignore[import-not-found]
+except ImportError:  # the favicon app is optional
+    icon = None
+
+if t.TYPE_CHECKING:
+    from collections.abc import Iterable, Iterator
+
+    _HTMLWriterBase = _html_base.Writer
+else:
+    _HTMLWriterBase = object
+
+HTML_PARTS: t.Final = frozenset(("whole", *_html_base.Writer.visitor_attributes))
+"""Names of the parts docutils' HTML writers assemble."""
+
+STYLESHEET_PARTS: t.Final = frozenset(("whole", "stylesheet"))
+"""Parts that show the stylesheets; without them, none are read or linked."""
+
+FRONT_MATTER_NODES: t.Final = (
+    nodes.Titular,
+    nodes.PreBibliographic,
+    nodes.docinfo,
+    nodes.decoration,
+)
+"""Leading document children the HTML translator files outside ``body``.
+
+Departing a document title, subtitle, docinfo, or header moves output into
+other parts, so :func:`iter_translated_html` walks them all before yielding.
+"""
+
+
+SITE_LINK_CACHE_MAXSIZE: t.Final = 4096
+"""Distinct (URI, hosts) verdicts :func:`is_offsite_uri` remembers."""
+
+_site_hosts: tuple[int, SiteHosts] | None = None
+
+
+class SiteHosts(t.NamedTuple):
+    """Hosts links count as on this site for, from ``settings.ALLOWED_HOSTS``.
+
+    Attributes
+    ----------
+    names : frozenset[str]
+        Lowercase host names matched exactly.
+    suffixes : tuple[str, ...]
+        ``.example.com`` style patterns, matching every subdomain.
+    """
+
+    names: frozenset[str]
+    suffixes: tuple[str, ...]
+
+    @classmethod
+    def from_allowed_hosts(cls, allowed_hosts: Iterable[str]) -> SiteHosts:
+        """Build from ``ALLOWED_HOSTS`` patterns.
+
+        Patterns follow :func:`django.http.request.validate_host`, except
+        that ``*`` is ignored: it says nothing about which hosts are this
+        site.
+
+        Examples
+        --------
+        >>> hosts = SiteHosts.from_allowed_hosts(["Example.com", ".example.org", "*"])
+        >>> sorted(hosts.names), hosts.suffixes
+        (['example.com', 'example.org'], ('.example.org',))
+        """
+        names = set()
+        suffixes = []
+        for pattern in allowed_hosts:
+            host = pattern.lower().strip("[]").rstrip(".")
+            if not host or host == "*":
+                continue
+            if host.startswith("."):
+                suffixes.append(host)
+                host = host[1:]
+            names.add(host)
+        return cls(frozenset(names), tuple(suffixes))
+
+
+def get_site_hosts() -> SiteHosts:
+    """Return the hosts of ``settings.ALLOWED_HOSTS``, built once per settings.
+
+    Examples
+    --------
+    >>> get_site_hosts() is get_site_hosts()
+    True
+    """
+    global _site_hosts
+    generation = get_settings_generation()
+    if _site_hosts is not None and _site_hosts[0] == generation:
+        return _site_hosts[1]
+
+    site_hosts = SiteHosts.from_allowed_hosts(settings.ALLOWED_HOSTS)
+    _site_hosts = (generation, site_hosts)
+    return site_hosts
+
+
+@functools.lru_cache(maxsize=SITE_LINK_CACHE_MAXSIZE)
+def is_offsite_uri(uri: str, site_hosts: SiteHosts) -> bool:
+    """Return whether a link leaves the site.
+
+    Fragments and relative URLs stay on the site, as do URLs whose host is
+    one of ``site_hosts``. URLs of other hosts, and of schemes without one,
+    such as ``mailto:``, leave it.
+
+    Examples
+    --------
+    >>> site_hosts = SiteHosts.from_allowed_hosts([".example.com"])
+    >>> is_offsite_uri("https://docs.example.com/page/", site_hosts)
+    False
+    >>> is_offsite_uri("/page/", site_hosts), is_offsite_uri("#top", site_hosts)
+    (False, False)
+    >>> is_offsite_uri("https://example.com.evil.org/", site_hosts)
+    True
+    >>> is_offsite_uri("//evil.org/page/", site_hosts)
+    True
+    >>> is_offsite_uri("mailto:admin@example.com", site_hosts)
+    True
+    """
+    try:
+        parts = urlsplit(uri)
+        host = parts.hostname
+    except ValueError:  # e.g. an unbalanced IPv6 bracket
+        return True
+    if not parts.scheme and not parts.netloc:
+        return False
+    if not host:
+        return True
+    host = host.rstrip(".")
+    return host not in site_hosts.names and not host.endswith(site_hosts.suffixes)
 
 
 class ParentNodeClassTuple(t.NamedTuple):
@@ -35,9 +171,116 @@ class ParentNodeClassTuple(t.NamedTuple):
     close_tag: str | None
 
 
+TITLE_PARENT_TAGS: t.Final = (
+    ParentNodeClassTuple(
+        nodes.topic,
+        ["p", ""],
+        {"CLASS": "topic-title first"},
+        None,
+    ),
+    ParentNodeClassTuple(
+        nodes.sidebar,
+        ["p", ""],
+        {"CLASS": "sidebar-title"},
+        None,
+    ),
+    ParentNodeClassTuple(
+        nodes.Admonition,
+        ["p", ""],
+        {"CLASS": "admonition-title"},
+        None,
+    ),
+    ParentNodeClassTuple(nodes.table, ["caption", ""], {}, "</caption>"),
+)
+"""Parents whose titles render as a tag other than ``h1``-``h6``."""
+
+DEFAULT_TITLE_CLOSE_TAG: t.Final = "</p>\n"
+"""Markup closing a title when its :class:`ParentNodeClassTuple` sets none."""
+
+_title_parent_tags: tuple[int, TitleParentTags] | None = None
+
+
+class TitleParentTags:
+    """Title tags by parent node type, looked up along the parent's MRO.
+
+    Lookups are memoized per concrete parent type, so each kind of title
+    costs one dictionary lookup after its first.
+
+    Examples
+    --------
+    >>> tags = TitleParentTags(TITLE_PARENT_TAGS)
+    >>> tags.lookup(nodes.note).kwargs
+    {'CLASS': 'admonition-title'}
+    >>> tags.lookup(nodes.section) is None
+    True
+    """
+
+    def __init__(self, entries: Iterable[ParentNodeClassTuple]) -> None:
+        #: Entries by the parent node type they were registered for. Later
+        #: entries replace earlier ones for the same type.
+        self.by_type = {entry.parent_node_type: entry for entry in entries}
+        self._resolved: dict[type[nodes.Node], ParentNodeClassTuple | None] = {}
+
+    def lookup(self, parent_type: type[nodes.Node]) -> ParentNodeClassTuple | None:
+        """Return the entry for the nearest registered class of ``parent_type``."""
+        try:
+            return self._resolved[parent_type]
+        except KeyError:
+            pass
+        entry = next(
+            (self.by_type[cls] for cls in parent_type.__mro__ if cls in self.by_type),
+            None,
+        )
+        self._resolved[parent_type] = entry
+        return entry
+
+
+def get_title_parent_tags() -> TitleParentTags:
+    """Return :data:`TITLE_PARENT_TAGS` plus ``DJANGO_DOCUTILS_LIB_RST["title_tags"]``.
+
+    Built once per settings generation.
+
+    Examples
+    --------
+    >>> get_title_parent_tags() is get_title_parent_tags()
+    True
+    """
+    global _title_parent_tags
+    generation = get_settings_generation()
+    if _title_parent_tags is not None and _title_parent_tags[0] == generation:
+        return _title_parent_tags[1]
+
+    entries = list(TITLE_PARENT_TAGS)
+    for node_class_str, title_tag in DJANGO_DOCUTILS_LIB_RST.get(
+        "title_tags",
+        {},
+    ).items():
+        tag = title_tag.get("tag", "p")
+        entries.append(
+            ParentNodeClassTuple(
+                import_string(node_class_str),
+                [tag, ""],
+                dict(title_tag.get("attributes", {})),
+                title_tag.get("close_tag", f"</{tag}>\n"),
+            ),
+        )
+    title_parent_tags = TitleParentTags(entries)
+    _title_parent_tags = (generation, title_parent_tags)
+    return title_parent_tags
+
+
 class DjangoDocutilsHTMLTranslator(HTMLTranslator):
     """Django Docutils touchups to docutil's HTML renderer."""
 
+    #: Methods rendering titles of these parent types and their subclasses,
+    #: returning the close tag. They take the parent's entry in
+    #: :func:`get_title_parent_tags`, if any, for the tag and attributes;
+    #: other parents are rendered from their entry alone.
+    title_visitors: t.ClassVar[dict[type[nodes.Node], str]] = {
+        nodes.document: "_visit_document_title",
+        nodes.section: "_visit_section_title",
+    }
+
     def __init__(self, document: nodes.document) -> None:
         HTMLTranslator.__init__(self, document)
 
@@ -67,11 +310,7 @@ class DjangoDocutilsHTMLTranslator(HTMLTranslator):
                 atts["href"] = self.cloak_mailto(atts["href"])
                 self.in_mailto = True
             atts["class"] += " external"
-            if (
-                not any(node["refuri"] in host for host in settings.ALLOWED_HOSTS)
-                and not node["refuri"].startswith("#")
-                and not node["refuri"].startswith("/")
-            ):
+            if is_offsite_uri(node["refuri"], get_site_hosts()):
                 atts["target"] = "_blank"
                 atts["class"] += " offsite"
                 # sphinx sites, a ref wrapping a nodes.literal is a code link
@@ -86,13 +325,8 @@ class DjangoDocutilsHTMLTranslator(HTMLTranslator):
             atts["href"] = "#" + node["refid"]
             atts["class"] += " internal"
 
-        try:
-            from django_docutils.favicon.rst.nodes import icon  # type: ignore[import-not-found] # noqa I001
-
-            if isinstance(node[0], icon):
-                atts["class"] = ""
-        except ImportError:
-            pass
+        if icon is not None and isinstance(node[0], icon):
+            atts["class"] = ""
         self.body.append(self.starttag(node, "a", "", **atts))
 
     def visit_title(self, node: nodes.Element) -> None:
@@ -108,73 +342,53 @@ class DjangoDocutilsHTMLTranslator(HTMLTranslator):
 
         - s/with-subtitle/subtitle for bulma css
 
+        Titles of parents in :attr:`title_visitors` are rendered by that
+        method; others by their entry in :func:`get_title_parent_tags`.
         """
-        close_tag: str | None = "</p>\n"
-
-        # add backlinks to refid (toc header backlinks)
-        # This assures headers link to themselves, so users can copy a link
-        # to the anchor, rather than docutils default behavior of linking back
-        # to the doc
-        if isinstance(node.parent, nodes.section):
-            node["refid"] = node.parent["ids"][0]
-
-        # specific cases we don't use h{1-6} tags for
-        parent_node_classes: list[ParentNodeClassTuple] = [
-            ParentNodeClassTuple(
-                nodes.topic,
-                ["p", ""],
-                {"CLASS": "topic-title first"},
-                None,
-            ),
-            ParentNodeClassTuple(
-                nodes.sidebar,
-                ["p", ""],
-                {"CLASS": "sidebar-title"},
-                None,
-            ),
-            ParentNodeClassTuple(
-                nodes.Admonition,
-                ["p", ""],
-                {"CLASS": "admonition-title"},
-                None,
+        entry = get_title_parent_tags().lookup(type(node.parent))
+        visitor = next(
+            (
+                self.title_visitors[cls]
+                for cls in type(node.parent).__mro__
+                if cls in self.title_visitors
             ),
-            ParentNodeClassTuple(nodes.table, ["caption", ""], {}, "</caption>"),
-        ]
-
-        # if node is wrapped in a certain type and processed, toggle this
-        is_processed = False
-
-        for parent_node_class in parent_node_classes:
-            if isinstance(node.parent, parent_node_class.parent_node_type):
-                self.body.append(
-                    self.starttag(
-                        node,
-                        *parent_node_class.args,
-                        **parent_node_class.kwargs,
-                    ),
-                )
-                if close_tag:
-                    close_tag = parent_node_class.close_tag
-                is_processed = True
-
-        # if one of the specific nodes already appended tag, don't re-run
-        # since we used a for loop above, we can't elif this
-        if not is_processed:
-            if isinstance(node.parent, nodes.document):
-                self.body.append(self.starttag(node, "h1", "", CLASS="title is-1"))
-                close_tag = "</h1>\n"
-                self.in_document_title = len(self.body)
-            elif isinstance(node.parent, nodes.section):
-                # now, handle plain-old headers
-                # this is pretty verbose, break it off into another method
-                close_tag = self._visit_section_title(node, close_tag)
+            None,
+        )
+        if visitor is not None:
+            close_tag = getattr(self, visitor)(node, entry=entry)
+        else:
+            # specific cases we don't use h{1-6} tags for
+            close_tag = DEFAULT_TITLE_CLOSE_TAG
+            if entry is not None:
+                self.body.append(self.starttag(node, *entry.args, **entry.kwargs))
+                if entry.close_tag is not None:
+                    close_tag = entry.close_tag
 
         self.context.append(close_tag)
 
+    def _visit_document_title(
+        self,
+        node: nodes.Element,
+        entry: ParentNodeClassTuple | None = None,
+    ) -> str:
+        """Open the document title, returning its close tag.
+
+        A configured ``entry`` replaces the ``h1`` tag and its attributes.
+        """
+        if entry is None:
+            self.body.append(self.starttag(node, "h1", "", CLASS="title is-1"))
+            close_tag = "</h1>\n"
+        else:
+            self.body.append(self.starttag(node, *entry.args, **entry.kwargs))
+            close_tag = entry.close_tag or DEFAULT_TITLE_CLOSE_TAG
+        self.in_document_title = len(self.body)
+        return close_tag
+
     def _visit_section_title(
         self,
         node: nodes.Element,
-        close_tag: str | None,
+        close_tag: str | None = None,
+        entry: ParentNodeClassTuple | None = None,
     ) -> str:
         """Our special sauce for section titles.
 
@@ -184,29 +398,41 @@ class DjangoDocutilsHTMLTranslator(HTMLTranslator):
         ----------
         node : :class:`docutils.nodes.title`
             Title node being visited
-        close_tag : str
-            Close tag (passed in from visit_title)
+        close_tag : str, optional
+            Unused, kept for compatibility with earlier callers.
+        entry : ParentNodeClassTuple, optional
+            Configured title tag of the section type, replacing the
+            ``h1``-``h6`` tag and its attributes. The backlink is kept.
 
         Returns
         -------
         str
             Close tag for section title node.
         """
+        # add backlinks to refid (toc header backlinks)
+        # This assures headers link to themselves, so users can copy a link
+        # to the anchor, rather than docutils default behavior of linking back
+        # to the doc
+        node["refid"] = node.parent["ids"][0]
+
         h_level = self.section_level + self.initial_header_level - 1
-        atts: dict[str, str] = {}
-        if len(node.parent) >= 2 and isinstance(node.parent[1], nodes.subtitle):
-            atts["CLASS"] = "subtitle"
+        if entry is None:
+            atts: dict[str, str] = {}
+            if len(node.parent) >= 2 and isinstance(node.parent[1], nodes.subtitle):
+                atts["CLASS"] = "subtitle"
+            self.body.append(self.starttag(node, f"h{h_level}", "", **atts))
+            close_tag = f"</h{h_level}>\n"
+        else:
+            self.body.append(self.starttag(node, *entry.args, **entry.kwargs))
+            close_tag = entry.close_tag or DEFAULT_TITLE_CLOSE_TAG
 
-        self.body.append(self.starttag(node, f"h{h_level}", "", **atts))
         attrs: dict[str, str] = {}
         if node.hasattr("refid"):
             attrs["class"] = "toc-backref"
             attrs["href"] = "#" + node["refid"]
         if attrs:
             self.body.append(self.starttag(nodes.reference(), "a", "", **attrs))
-            close_tag = f"</a></h{h_level}>\n"
-        else:
-            close_tag = f"</h{h_level}>\n"
+            close_tag = f"</a>{close_tag}"
         return close_tag
 
     def visit_docinfo(self, node: nodes.Element) -> None:
@@ -225,7 +451,191 @@ class DjangoDocutilsHTMLTranslator(HTMLTranslator):
         self.body.append("</em>")
 
 
-class DjangoDocutilsWriter(Writer):
+def iter_translated_html(
+    translator: _html_base.HTMLTranslator,
+    show_title: bool = True,
+) -> Iterator[str]:
+    r"""Translate the translator's document, yielding HTML as it is produced.
+
+    Joined, the chunks equal the ``html_body`` part (``fragment`` without
+    ``show_title``), but only one top-level node's HTML is held at a time.
+    The document must already be transformed and sanitized.
+
+    Parameters
+    ----------
+    translator : docutils.writers._html_base.HTMLTranslator
+        Fresh translator of the document to render.
+    show_title : bool
+        Include the document title, subtitle, and wrapping element.
+
+    Examples
+    --------
+    >>> from django_docutils.lib.publisher import (
+    ...     publish_doctree,
+    ...     publish_parts_from_doctree,
+    ... )
+    >>> writer = DjangoDocutilsWriter(stream=True)
+    >>> _ = publish_parts_from_doctree(publish_doctree("Hi **you**"), writer=writer)
+    >>> chunks = iter_translated_html(writer.translator_class(writer.document))
+    >>> [chunk.strip() for chunk in chunks]
+    ['<main>', '<p>Hi <strong>you</strong></p>\n</main>']
+    """
+    document = translator.document
+    children = list(document.children)
+    translator.dispatch_visit(document)
+
+    index = 0
+    while index < len(children) and isinstance(children[index], FRONT_MATTER_NODES):
+        children[index].walkabout(translator)
+        index += 1
+
+    if show_title:
+        yield "".join(
+            [
+                *translator.body_prefix[1:],
+                translator.starttag(document, **translator.documenttag_args),
+                *translator.body_pre_docinfo,
+                *translator.docinfo,
+            ],
+        )
+    del translator.body_pre_docinfo[:]
+    del translator.docinfo[:]
+
+    for child in children[index:]:
+        if translator.body:
+            yield "".join(translator.body)
+            del translator.body[:]
+        child.walkabout(translator)
+
+    translator.dispatch_departure(document)
+    tail = (
+        translator.body + translator.body_suffix[:-1] if show_title else translator.body
+    )
+    if tail:
+        yield "".join(tail)
+
+
+class HTMLPartsWriterMixin(_HTMLWriterBase):
+    """Mixin for docutils HTML writers assembling only the parts asked for.
+
+    Docutils' HTML writers fill in every part on each publish: they join
+    ``whole`` through the page template, which is read from disk, and read
+    and embed every stylesheet. Given ``parts``, only those parts are
+    assembled, and the template and stylesheets are skipped unless a part
+    shows them. With ``stream``, nothing is assembled and the body is left
+    to :meth:`iter_html_body`.
+
+    Parameters
+    ----------
+    stream : bool
+        Leave the body untranslated until :meth:`iter_html_body` is consumed.
+    parts : iterable of str, optional
+        Names from :data:`HTML_PARTS` to assemble. ``None`` assembles them
+        all.
+
+    Raises
+    ------
+    ValueError
+        ``parts`` names a part docutils' HTML writers do not build.
+
+    Examples
+    --------
+    >>> from django_docutils.lib.publisher import (
+    ...     publish_doctree,
+    ...     publish_parts_from_doctree,
+    ... )
+    >>> writer = DjangoDocutilsWriter(parts=["fragment"])
+    >>> parts = publish_parts_from_doctree(publish_doctree("Hi"), writer=writer)
+    >>> sorted(part for part in parts if part in HTML_PARTS)
+    ['fragment']
+    >>> DjangoDocutilsWriter(parts=["body_html"])
+    Traceback (most recent call last):
+    ...
+    ValueError: unknown HTML writer parts: body_html
+    """
+
+    translator_class: t.Any
+
+    #: Parts :meth:`assemble_parts` fills in. ``None`` means all of them.
+    requested_parts: frozenset[str] | None = None
+
+    def __init__(
+        self, stream: bool = False, parts: Iterable[str] | None = None
+    ) -> None:
+        super().__init__()
+        #: Leave the body untranslated until :meth:`iter_html_body` is
+        #: consumed. No HTML part is then assembled.
+        self.stream = stream
+        if parts is not None:
+            self.requested_parts = frozenset(parts)
+            unknown = self.requested_parts - HTML_PARTS
+            if unknown:
+                msg = f"unknown HTML writer parts: {', '.join(sorted(unknown))}"
+                raise ValueError(msg)
+
+    def make_translator(self) -> _html_base.HTMLTranslator:
+        """Return a translator for the document being written.
+
+        Stylesheets are left out when no requested part shows them.
+        """
+        assert self.document is not None
+        translator_class: type[_html_base.HTMLTranslator] = self.translator_class
+        if not self.stream and (
+            self.requested_parts is None or self.requested_parts & STYLESHEET_PARTS
+        ):
+            return translator_class(self.document)
+
+        settings = self.document.settings
+        no_stylesheets = copy.copy(settings)
+        no_stylesheets.stylesheet = []
+        no_stylesheets.stylesheet_path = []
+        self.document.settings = no_stylesheets
+        try:
+            return translator_class(self.document)
+        finally:
+            self.document.settings = settings
+
+    def translate(self) -> None:
+        """Render the requested parts of the document, or nothing if streaming."""
+        if self.stream:
+            self.output = ""
+            return
+        if self.requested_parts is None:
+            super().translate()
+            return
+
+        assert self.document is not None
+        self.visitor = visitor = self.make_translator()
+        self.document.walkabout(visitor)
+        for attr in self.visitor_attributes:
+            setattr(self, attr, getattr(visitor, attr))
+        self.output = self.apply_template() if "whole" in self.requested_parts else ""
+
+    def iter_html_body(self, show_title: bool = True) -> Iterator[str]:
+        """Yield the body HTML in chunks, translating as they are consumed.
+
+        For writers created with ``stream=True``, after the document has been
+        published. See :func:`iter_translated_html`.
+        """
+        return iter_translated_html(self.make_translator(), show_title)
+
+    def assemble_parts(self) -> None:
+        """Assemble the requested parts, or none of the HTML parts if streaming."""
+        if self.requested_parts is None and not self.stream:
+            super().assemble_parts()
+            return
+
+        writers.Writer.assemble_parts(self)
+        requested_parts = frozenset() if self.stream else self.requested_parts
+        assert requested_parts is not None
+        if "whole" not in requested_parts:
+            del self.parts["whole"]  # type:ignore[misc]
+        for part in self.visitor_attributes:
+            if part in requested_parts:
+                self.parts[part] = "".join(getattr(self, part))  # type:ignore[literal-required]
+
+
+class DjangoDocutilsWriter(HTMLPartsWriterMixin, Writer):
     """DjangoDocutils's hand-crafted docutils' writer.
 
     Example:
@@ -242,12 +652,23 @@ class DjangoDocutilsWriter(Writer):
     #: final sanitize pass applies the same policy as the pre-publish pass.
     django_docutils_settings: t.Mapping[str, object] | None = None
 
-    def __init__(self) -> None:
-        Writer.__init__(self)
+    #: HTML of the table of contents, built during :meth:`translate` when
+    #: ``build_toc`` is set. Empty when the document has no sections.
+    toc: str = ""
+
+    def __init__(
+        self,
+        build_toc: bool = False,
+        stream: bool = False,
+        parts: Iterable[str] | None = None,
+    ) -> None:
+        super().__init__(stream=stream, parts=parts)
         # I'd like to put this into the class attribute, but I think
         # somewhere up the Writer/Translator hierarchy are 'old' python
         # classes. (e.g. Python =< 2.1 classes)
         self.translator_class = DjangoDocutilsHTMLTranslator
+        #: Also render the table of contents into ``parts["toc"]``.
+        self.build_toc = build_toc
 
     def translate(self) -> None:
         """Sanitize the document, then render it.
@@ -258,10 +679,55 @@ class DjangoDocutilsWriter(Writer):
         transform cannot inject raw nodes or unsafe URIs that survive to the
         output. The settings resolved for this render — including per-call
         ``settings_overrides`` — are reused so this pass applies the same
-        policy as the pre-publish sanitize.
+        policy as the pre-publish sanitize, and is skipped when only
+        sanitize-safe transforms ran since that pass.
+        """
+        sanitize_doctree(
+            self.document,
+            self.django_docutils_settings,
+            skip_if_sanitized=True,
+        )
+        with time_stage("translate"):
+            super().translate()
+        if self.build_toc:
+            self.toc = self.translate_toc()
+
+    @time_stage("toc")
+    def translate_toc(self) -> str:
+        """Render the table of contents of the document being written.
+
+        The TOC is built from the already-transformed and sanitized document
+        and walked with a second translator, so it costs no extra parse or
+        publish.
+
+        Returns
+        -------
+        str
+            HTML of the ``fixed-toc-menu`` document, or ``""`` when the
+            document has no sections.
         """
-        sanitize_doctree(self.document, self.django_docutils_settings)
-        Writer.translate(self)
+        assert self.document is not None
+        # Stylesheets only feed the ``whole`` part, which the TOC never uses.
+        toc_settings = copy.copy(self.document.settings)
+        toc_settings.stylesheet = []
+        toc_settings.stylesheet_path = []
+        toc_tree = build_toc_document(
+            self.document,
+            settings=toc_settings,
+            reporter=self.document.reporter,
+        )
+        if toc_tree is None:
+            return ""
+        sanitize_doctree(toc_tree, self.django_docutils_settings)
+        visitor = self.translator_class(toc_tree)
+        toc_tree.walkabout(visitor)
+        return "".join(visitor.html_body)
+
+    def assemble_parts(self) -> None:
+        """Assemble docutils parts, plus ``toc`` when ``build_toc`` is set."""
+        super().assemble_parts()
+        if self.build_toc:
+            self.parts["toc"] = self.toc  # type:ignore[typeddict-unknown-key]
 
     def get_transforms(self) -> list[type[Transform]]:
         """Return transformed required by DjangoDocutilsWriter.
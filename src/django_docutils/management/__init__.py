@@ -0,0 +1 @@
+"""Django management integration for django-docutils."""
@@ -0,0 +1,258 @@
+"""Pre-render reStructuredText ahead of deploys.
+
+Walks the directories :class:`~django_docutils.template.DocutilsTemplates`
+engines search and the ``file_path`` of every
+:class:`~django_docutils.lib.views.RSTRawView` in the URLconf, renders them
+across a process pool, and stores the output in the rendered-output cache
+(``DJANGO_DOCUTILS_LIB_RST["cache"]``) or under ``--output-dir``.
+"""
+
+from __future__ import annotations
+
+import pathlib
+import time
+import traceback
+import typing as t
+
+from django.conf import settings
+from django.core.management.base import BaseCommand, CommandError
+from django.template import engines
+from django.urls import URLResolver, get_resolver
+
+from django_docutils.lib.cache import get_render_cache, store_rendered
+from django_docutils.lib.parallel import DEFAULT_CHUNKSIZE, map_chunks_in_pool
+from django_docutils.lib.publisher import (
+    publish_doctree,
+    publish_document_from_doctree,
+)
+from django_docutils.lib.views import RSTRawView
+from django_docutils.template import DocutilsTemplates, publish_template_html
+
+if t.TYPE_CHECKING:
+    from collections.abc import Iterable, Iterator
+
+    from django.core.management.base import CommandParser
+    from django.urls import URLPattern
+
+TEMPLATE: t.Final = "template"
+"""Target rendered the way ``DocutilsTemplates`` renders a template."""
+
+DOCUMENT: t.Final = "document"
+"""Target rendered the way ``RSTView`` renders its ``file_path``."""
+
+
+class PrerenderTarget(t.NamedTuple):
+    """A file to pre-render."""
+
+    kind: str
+    name: str
+    path: pathlib.Path
+
+
+class PrerenderResult(t.NamedTuple):
+    """Outcome of pre-rendering one :class:`PrerenderTarget`."""
+
+    target: PrerenderTarget
+    source: str | None
+    output: object
+    html: str | None
+    error: str | None
+    duration: float
+
+
+def iter_template_targets(extensions: Iterable[str]) -> Iterator[PrerenderTarget]:
+    """Yield templates every ``DocutilsTemplates`` engine can load.
+
+    Names resolving to several files yield only the one ``get_template``
+    would pick.
+    """
+    seen: set[str] = set()
+    for engine in engines.all():
+        if not isinstance(engine, DocutilsTemplates):
+            continue
+        for template_dir in engine.template_dirs:
+            root = pathlib.Path(template_dir)
+            if not root.is_dir():
+                continue
+            for path in sorted(root.rglob("*")):
+                if path.suffix not in extensions or not path.is_file():
+                    continue
+                name = path.relative_to(root).as_posix()
+                if name not in seen:
+                    seen.add(name)
+                    yield PrerenderTarget(TEMPLATE, name, path)
+
+
+def iter_view_targets(
+    patterns: Iterable[URLPattern | URLResolver] | None = None,
+) -> Iterator[PrerenderTarget]:
+    """Yield the ``file_path`` of each ``RSTRawView`` routed in the URLconf."""
+    if patterns is None:
+        if not getattr(settings, "ROOT_URLCONF", None):
+            return
+        patterns = get_resolver().url_patterns
+
+    for pattern in patterns:
+        if isinstance(pattern, URLResolver):
+            yield from iter_view_targets(pattern.url_patterns)
+            continue
+        view_class = getattr(pattern.callback, "view_class", None)
+        if view_class is None or not issubclass(view_class, RSTRawView):
+            continue
+        initkwargs = getattr(pattern.callback, "view_initkwargs", {})
+        file_path = initkwargs.get("file_path", view_class.file_path)
+        if file_path is not None:
+            yield PrerenderTarget(DOCUMENT, str(file_path), pathlib.Path(file_path))
+
+
+def _prerender_chunk(targets: list[PrerenderTarget]) -> list[PrerenderResult]:
+    """Render a chunk of targets in a worker, capturing each failure."""
+    results = []
+    for target in targets:
+        started = time.perf_counter()
+        source = None
+        try:
+            source = target.path.read_text(encoding="utf-8")
+            output: object
+            html: str
+            if target.kind == TEMPLATE:
+                output = html = publish_template_html(source)
+            else:
+                output = publish_document_from_doctree(publish_doctree(source))
+                html = output.html_body
+        except Exception:  # noqa: BLE001 - reported per document
+            results.append(
+                PrerenderResult(
+                    target=target,
+                    source=source,
+                    output=None,
+                    html=None,
+                    error=traceback.format_exc(),
+                    duration=time.perf_counter() - started,
+                ),
+            )
+        else:
+            results.append(
+                PrerenderResult(
+                    target=target,
+                    source=source,
+                    output=output,
+                    html=html,
+                    error=None,
+                    duration=time.perf_counter() - started,
+                ),
+            )
+    return results
+
+
+class Command(BaseCommand):
+    """Pre-render reStructuredText templates and RSTView files."""
+
+    help = (
+        "Render DocutilsTemplates templates and RSTView files ahead of time, "
+        "into the rendered-output cache or --output-dir."
+    )
+
+    def add_arguments(self, parser: CommandParser) -> None:
+        """Add command line options."""
+        parser.add_argument(
+            "--workers",
+            type=int,
+            default=None,
+            help="Worker processes (default: number of CPUs).",
+        )
+        parser.add_argument(
+            "--chunksize",
+            type=int,
+            default=DEFAULT_CHUNKSIZE,
+            help="Documents sent to a worker at a time.",
+        )
+        parser.add_argument(
+            "--output-dir",
+            type=pathlib.Path,
+            default=None,
+            help="Write HTML files here instead of the rendered-output cache.",
+        )
+        parser.add_argument(
+            "--extension",
+            dest="extensions",
+            action="append",
+            default=None,
+            help="Template file extension to render, repeatable (default: .rst).",
+        )
+        parser.add_argument(
+            "--slowest",
+            type=int,
+            default=10,
+            help="Number of slowest documents to report.",
+        )
+
+    def handle(self, *args: object, **options: t.Any) -> None:
+        """Render every target and store or write the output."""
+        output_dir: pathlib.Path | None = options["output_dir"]
+        if output_dir is None and get_render_cache() is None:
+            msg = (
+                "Rendered-output caching is not configured: set "
+                'DJANGO_DOCUTILS_LIB_RST["cache"] or pass --output-dir.'
+            )
+            raise CommandError(msg)
+
+        extensions = options["extensions"] or [".rst"]
+        targets = [
+            *iter_template_targets(extensions),
+            *iter_view_targets(),
+        ]
+        if not targets:
+            self.stdout.write("Nothing to pre-render.")
+            return
+
+        started = time.perf_counter()
+        results = []
+        for result in map_chunks_in_pool(
+            _prerender_chunk,
+            targets,
+            workers=options["workers"],
+            chunksize=options["chunksize"],
+        ):
+            results.append(result)
+            self._store(result, output_dir)
+            if result.error is not None:
+                self.stderr.write(f"{result.target.name} failed:\n{result.error}")
+            elif options["verbosity"] >= 2:
+                self.stdout.write(
+                    f"{result.duration * 1000:9.1f} ms  {result.target.name}",
+                )
+        elapsed = time.perf_counter() - started
+
+        failed = [result for result in results if result.error is not None]
+        self.stdout.write(
+            f"Pre-rendered {len(results) - len(failed)} of {len(results)} "
+            f"documents in {elapsed:.2f}s.",
+        )
+        if options["slowest"] > 0:
+            slowest = sorted(results, key=lambda result: result.duration, reverse=True)
+            self.stdout.write("Slowest documents:")
+            for result in slowest[: options["slowest"]]:
+                self.stdout.write(
+                    f"{result.duration * 1000:9.1f} ms  {result.target.name}",
+                )
+        if failed:
+            msg = f"{len(failed)} documents failed to render."
+            raise CommandError(msg)
+
+    def _store(self, result: PrerenderResult, output_dir: pathlib.Path | None) -> None:
+        """Cache a rendered result, or write its HTML under ``output_dir``."""
+        if result.error is not None or result.source is None:
+            return
+        if output_dir is None:
+            store_rendered(result.target.kind, result.source, result.output)
+            return
+
+        if result.target.kind == TEMPLATE:
+            relative = pathlib.Path(result.target.name)
+        else:
+            path = result.target.path.resolve()
+            relative = pathlib.Path("views", *path.parts[1:])
+        destination = output_dir / relative.with_name(f"{relative.name}.html")
+        destination.parent.mkdir(parents=True, exist_ok=True)
+        destination.write_text(result.html or "", encoding="utf-8")
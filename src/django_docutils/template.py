@@ -2,6 +2,8 @@
 
 from __future__ import annotations
 
+import functools
+import os
 import typing as t
 
 from django.conf import settings
@@ -13,8 +15,14 @@ from django.template.exceptions import TemplateDoesNotExist
 from django.utils.safestring import SafeString, mark_safe
 from docutils import writers
 
+from django_docutils.lib.cache import cached_render
 from django_docutils.lib.directives.code import register_pygments_directive
 from django_docutils.lib.publisher import publish_doctree, publish_parts_from_doctree
+from django_docutils.lib.settings import get_settings_generation
+from django_docutils.lib.writers import HTMLPartsWriterMixin
+
+if t.TYPE_CHECKING:
+    from collections.abc import Iterator
 
 
 class DocutilsTemplates(BaseEngine):
@@ -26,25 +34,68 @@ class DocutilsTemplates(BaseEngine):
         params = params.copy()
         self.options = params.pop("OPTIONS").copy()
         self.options.setdefault("debug", settings.DEBUG)
+        self.cached: bool = self.options.pop("cached", True)
         super().__init__(params)
         self.engine = Engine(self.dirs, self.app_dirs, **self.options)
+        self.template_cache: dict[str, CachedTemplate] = {}
 
     def from_string(self, template_code: str) -> DocutilsTemplate:
         """Return DocutilsTemplate from string."""
         return DocutilsTemplate(template_code, self.options)
 
     def get_template(self, template_name: str) -> DocutilsTemplate:
-        """Return template from template_name."""
+        """Return template from template_name.
+
+        With the ``cached`` option (the default), a template is read once and
+        reused, along with its rendered output, like Django's cached template
+        loader. In ``debug`` mode a cached template whose file's modification
+        time changed is read again.
+        """
+        if self.cached:
+            cached = self.template_cache.get(template_name)
+            if cached is not None and (
+                not self.options["debug"] or _get_mtime(cached.path) == cached.mtime
+            ):
+                return cached.template
+
         for template_file in self.iter_template_filenames(template_name):
             try:
                 with open(template_file, encoding="utf-8") as fp:
+                    mtime = os.fstat(fp.fileno()).st_mtime_ns
                     template_code = fp.read()
             except OSError:
                 continue
 
-            return DocutilsTemplate(template_code, self.options)
+            template = DocutilsTemplate(template_code, self.options)
+            if self.cached:
+                self.template_cache[template_name] = CachedTemplate(
+                    template_file,
+                    mtime,
+                    template,
+                )
+            return template
         raise TemplateDoesNotExist(template_name)
 
+    def reset(self) -> None:
+        """Forget cached templates, e.g. after template files change."""
+        self.template_cache.clear()
+
+
+class CachedTemplate(t.NamedTuple):
+    """Template kept by a :class:`DocutilsTemplates` engine in cached mode."""
+
+    path: str
+    mtime: int
+    template: DocutilsTemplate
+
+
+def _get_mtime(path: str) -> int | None:
+    """Return a file's modification time in nanoseconds, or None if missing."""
+    try:
+        return os.stat(path).st_mtime_ns
+    except OSError:
+        return None
+
 
 class DocutilsTemplate:
     """Docutils template object for Django. Used by Docutils template engine."""
@@ -52,6 +103,7 @@ class DocutilsTemplate:
     def __init__(self, source: str, options: dict[str, t.Any]) -> None:
         self.source = source
         self.options = options
+        self._rendered: tuple[int, SafeString] | None = None
 
     def render(
         self,
@@ -66,12 +118,72 @@ class DocutilsTemplate:
         >>> "world" in template.render()
         True
         """
-        writer = writers.get_writer_class("html")()
-        doctree = publish_doctree(self.source)
-        parts = publish_parts_from_doctree(doctree, writer=writer)["html_body"]
-        assert isinstance(parts, str)
+        # Output depends only on the source and settings, not the context.
+        generation = get_settings_generation()
+        if self._rendered is not None and self._rendered[0] == generation:
+            return self._rendered[1]
+
+        html = cached_render(
+            "template",
+            self.source,
+            lambda: publish_template_html(self.source),
+        )
+        self._rendered = (generation, html)
+        return html
+
+    def stream(
+        self,
+        context: Context | dict[str, t.Any] | None = None,
+        request: HttpRequest | None = None,
+    ) -> Iterator[str]:
+        """Return the HTML :meth:`render` returns, as chunks produced lazily.
+
+        The document is parsed and transformed up front; each chunk is
+        translated as it is consumed. Bypasses the rendered-output cache.
+
+        Examples
+        --------
+        >>> template = DocutilsTemplate("Hello **world**", {})
+        >>> "".join(template.stream()) == template.render()
+        True
+        """
+        writer = get_template_writer_class()(stream=True)
+        publish_parts_from_doctree(publish_doctree(self.source), writer=writer)
+        return writer.iter_html_body()
+
+
+def publish_template_html(source: str) -> SafeString:
+    """Return the HTML body a :class:`DocutilsTemplate` renders ``source`` to.
+
+    Unlike :meth:`DocutilsTemplate.render`, never consults the rendered-output
+    cache.
+
+    Examples
+    --------
+    >>> "<strong>world</strong>" in publish_template_html("Hello **world**")
+    True
+    """
+    writer = get_template_writer_class()(parts=["html_body"])
+    doctree = publish_doctree(source)
+    parts = publish_parts_from_doctree(doctree, writer=writer)["html_body"]
+    assert isinstance(parts, str)
+
+    return mark_safe(parts)
+
+
+@functools.cache
+def get_template_writer_class() -> type[HTMLPartsWriterMixin]:
+    """Return the ``html`` writer :class:`DocutilsTemplate` renders with.
+
+    Extended with :class:`~django_docutils.lib.writers.HTMLPartsWriterMixin`,
+    so only ``html_body`` is assembled, or the body is streamed.
+    """
+    html_writer_class: t.Any = writers.get_writer_class("html")
+
+    class DocutilsTemplateWriter(HTMLPartsWriterMixin, html_writer_class):  # type:ignore[misc]
+        pass
 
-        return mark_safe(parts)
+    return DocutilsTemplateWriter
 
 
 register_pygments_directive()
@@ -2,6 +2,8 @@
 
 from __future__ import annotations
 
+import typing as t
+
 from django import template
 from django.template.base import FilterExpression, Node, Parser, Token, kwarg_re
 from django.template.context import Context
@@ -9,10 +11,26 @@ from django.template.exceptions import TemplateSyntaxError
 from django.utils.encoding import force_str
 from django.utils.safestring import SafeString, mark_safe
 
-from django_docutils.lib.publisher import publish_html_from_source
+from django_docutils.lib.cache import cached_render
+from django_docutils.lib.publisher import (
+    publish_doctree,
+    publish_html_from_doctree,
+    publish_html_from_source,
+)
+
+if t.TYPE_CHECKING:
+    from docutils import nodes
 
 register = template.Library()
 
+#: :attr:`django.template.Context.render_context` key holding doctrees
+#: already parsed during the current template render.
+DOCTREES_KEY = "django_docutils_doctrees"
+
+#: :attr:`django.template.Context.render_context` key holding HTML already
+#: rendered during the current template render.
+RENDERED_HTML_KEY = "django_docutils_rendered_html"
+
 
 class ReStructuredTextNode(Node):
     """Implement the actions of the rst tag."""
@@ -42,11 +60,61 @@ class ReStructuredTextNode(Node):
         else:
             content = self.content
 
-        html = publish_html_from_source(content, *args, **kwargs)
+        if args or not set(kwargs) <= {"show_title", "toc_only"}:
+            html = publish_html_from_source(content, *args, **kwargs)
+        else:
+            html = self._render_shared(context, content, **kwargs)
+
         if html is None:
             return ""
         return html
 
+    @staticmethod
+    def _render_shared(
+        context: Context,
+        content: str,
+        show_title: bool = True,
+        toc_only: bool = False,
+    ) -> str | None:
+        """Render ``content``, reusing what earlier tags in the template built.
+
+        ``{% rst content %}`` and ``{% rst content toc_only=True %}`` in one
+        template share a single parse of the same source. The table of
+        contents is only built when ``toc_only`` is requested.
+        """
+        for memo in (DOCTREES_KEY, RENDERED_HTML_KEY):
+            if memo not in context.render_context:
+                context.render_context[memo] = {}
+        doctrees: dict[str, nodes.document] = context.render_context[DOCTREES_KEY]
+        rendered: dict[tuple[str, bool, bool], str | None] = context.render_context[
+            RENDERED_HTML_KEY
+        ]
+
+        # The table of contents ignores ``show_title``.
+        key = (content, bool(show_title or toc_only), bool(toc_only))
+        if key not in rendered:
+
+            def render() -> str | None:
+                if content not in doctrees:
+                    doctrees[content] = publish_doctree(content)
+                return publish_html_from_doctree(
+                    doctrees[content],
+                    show_title=show_title,
+                    toc_only=toc_only,
+                )
+
+            rendered[key] = cached_render(
+                "html",
+                content,
+                render,
+                show_title=show_title,
+                toc_only=toc_only,
+            )
+        html = rendered[key]
+        if html is None:
+            return None
+        return mark_safe(html)
+
 
 class MalformedArgumentsToRSTTag(TemplateSyntaxError):
     """Invalid arguments to rst django template tag."""
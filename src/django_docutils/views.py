@@ -4,16 +4,33 @@ from __future__ import annotations
 
 import typing as t
 
+from asgiref.sync import sync_to_async
 from django.core.exceptions import ImproperlyConfigured
 from django.http.request import HttpRequest
 from django.http.response import HttpResponse
 from django.template.loader import select_template
-from django.template.response import TemplateResponse
 from django.views.generic.base import TemplateView
 
+from django_docutils.lib.asynchronous import (
+    aiter_in_render_executor,
+    run_in_render_executor,
+)
+from django_docutils.lib.views import (
+    ServerTimingTemplateResponse,
+    stream_template_response,
+)
+from django_docutils.template import DocutilsTemplate
 
-class DocutilsResponse(TemplateResponse):
-    """Docutils TemplateResponse."""
+if t.TYPE_CHECKING:
+    from collections.abc import AsyncIterable, Iterable
+
+
+class DocutilsResponse(ServerTimingTemplateResponse):
+    """Docutils TemplateResponse.
+
+    ``rst_content``, when given, is used as the already rendered HTML of the
+    reStructuredText instead of rendering ``rst`` again.
+    """
 
     template_name = "base.html"
 
@@ -27,8 +44,10 @@ class DocutilsResponse(TemplateResponse):
         status: int | None = None,
         charset: str | None = None,
         using: str | None = None,
+        rst_content: str | None = None,
     ) -> None:
         self.rst_name = rst
+        self.rst_content = rst_content
         super().__init__(
             request,
             template,
@@ -47,9 +66,9 @@ class DocutilsResponse(TemplateResponse):
         # we should be able to use the engine to .Render this
         from django.utils.safestring import mark_safe
 
-        context["content"] = mark_safe(
-            select_template(self.rst_name, using="docutils").render(),
-        )
+        if self.rst_content is None:
+            self.rst_content = select_template(self.rst_name, using="docutils").render()
+        context["content"] = mark_safe(self.rst_content)
 
         template = self.resolve_template(self.template_name)
         return template.render(context)
@@ -68,10 +87,30 @@ class DocutilsViewRstNameImproperlyConfigured(ImproperlyConfigured):
 
 
 class DocutilsView(TemplateView):
-    """Django-docutils view, renders reStructuredText to HTML via rst_name."""
+    """Django-docutils view, renders reStructuredText to HTML via rst_name.
+
+    With ``stream = True``, the response is a
+    :class:`~django.http.StreamingHttpResponse` sending the document HTML as
+    it is translated, bypassing the rendered-output cache.
+    """
 
     response_class = DocutilsResponse
     rst_name: str | None = None
+    stream: bool = False
+
+    def get_rst_template(self) -> DocutilsTemplate:
+        """Return the reStructuredText template named by :meth:`get_rst_names`."""
+        rst_template = select_template(self.get_rst_names(), using="docutils")
+        assert isinstance(rst_template, DocutilsTemplate)
+        return rst_template
+
+    def get_rst_content(self) -> str | None:
+        """Return the rendered HTML, or ``None`` to render with the response."""
+        return None
+
+    def get_content_chunks(self) -> Iterable[str] | AsyncIterable[str]:
+        """Return the HTML chunks a streaming response sends."""
+        return self.get_rst_template().stream()
 
     def render_to_response(
         self,
@@ -83,6 +122,18 @@ class DocutilsView(TemplateView):
         **response_kwargs: object,
     ) -> HttpResponse:
         """Override to pay in rst content."""
+        content_type = content_type or self.content_type
+        if self.stream:
+            # StreamingHttpResponse serves wherever views return HttpResponse.
+            return stream_template_response(  # type:ignore[return-value]
+                self.request,
+                self.get_template_names(),
+                context or {},
+                self.get_content_chunks(),
+                content_type=content_type,
+                status=status,
+                using=using or self.template_engine,
+            )
         return self.response_class(
             request=self.request,
             template=self.get_template_names(),
@@ -90,7 +141,9 @@ class DocutilsView(TemplateView):
             context=context,
             content_type=content_type,
             status=status,
+            charset=charset,
             using=using or self.template_engine,
+            rst_content=self.get_rst_content(),
         )
 
     def get_rst_names(self) -> list[str]:
@@ -98,3 +151,42 @@ class DocutilsView(TemplateView):
         if self.rst_name is None:
             raise DocutilsViewRstNameImproperlyConfigured
         return [self.rst_name]
+
+
+class AsyncDocutilsView(DocutilsView):
+    """:class:`DocutilsView` for ASGI deployments, rendering off the event loop.
+
+    The reStructuredText renders on the bounded executor of
+    :mod:`django_docutils.lib.asynchronous`, so slow renders queue there
+    instead of blocking other requests. With ``stream = True``, each chunk of
+    HTML is translated on the executor as the client reads it. The response
+    is then built by :meth:`render_to_response`, as for :class:`DocutilsView`.
+    """
+
+    _rst_content: str | None = None
+    _content_chunks: AsyncIterable[str] | None = None
+
+    def get_rst_content(self) -> str | None:
+        """Return the HTML rendered on the executor."""
+        return self._rst_content
+
+    def get_content_chunks(self) -> Iterable[str] | AsyncIterable[str]:
+        """Return the HTML chunks, each translated on the executor."""
+        if self._content_chunks is None:
+            return super().get_content_chunks()
+        return self._content_chunks
+
+    async def get(  # type:ignore[override]
+        self,
+        request: HttpRequest,
+        *args: t.Any,
+        **kwargs: t.Any,
+    ) -> HttpResponse:
+        """Render the reStructuredText on the executor, then respond."""
+        rst_template = await run_in_render_executor(self.get_rst_template)
+        if self.stream:
+            chunks = await run_in_render_executor(rst_template.stream)
+            self._content_chunks = aiter_in_render_executor(chunks)
+        else:
+            self._rst_content = await run_in_render_executor(rst_template.render)
+        return await sync_to_async(super().get)(request, *args, **kwargs)
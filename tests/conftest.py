@@ -0,0 +1,23 @@
+"""Shared pytest fixtures for django-docutils tests."""
+
+from __future__ import annotations
+
+import typing as t
+
+import pytest
+from django.core.cache import caches
+
+
+@pytest.fixture
+def render_cache(settings: t.Any) -> t.Iterator[None]:
+    """Enable rendered-output caching in a locmem cache for one test."""
+    settings.CACHES = {
+        "default": {"BACKEND": "django.core.cache.backends.locmem.LocMemCache"},
+    }
+    settings.DJANGO_DOCUTILS_LIB_RST = {
+        **settings.DJANGO_DOCUTILS_LIB_RST,
+        "cache": {"alias": "default", "timeout": 60},
+    }
+    caches["default"].clear()
+    yield
+    caches["default"].clear()
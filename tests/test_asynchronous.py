@@ -0,0 +1,204 @@
+"""Tests for the async publish API and async views."""
+
+from __future__ import annotations
+
+import asyncio
+import threading
+import typing as t
+
+import pytest
+from django.http import HttpResponse, StreamingHttpResponse
+from django.template.response import TemplateResponse
+
+from django_docutils import template
+from django_docutils.lib import asynchronous, publisher
+from django_docutils.lib.asynchronous import get_render_executor, run_in_render_executor
+from django_docutils.lib.publisher import (
+    apublish_document_from_source,
+    apublish_html_from_source,
+    publish_document_from_source,
+    publish_html_from_source,
+)
+from django_docutils.lib.views import AsyncRSTView, RSTView
+from django_docutils.views import AsyncDocutilsView, DocutilsView
+
+from .test_publisher import STREAMED_RST
+
+if t.TYPE_CHECKING:
+    import pathlib
+
+    from django.http import HttpRequest, HttpResponseBase
+    from django.test import AsyncRequestFactory, RequestFactory
+    from pytest_mock import MockerFixture
+
+
+async def _content(response: HttpResponseBase) -> bytes:
+    """Return the body of a response, reading async streams as ASGI does."""
+    if isinstance(response, StreamingHttpResponse):
+        return b"".join([chunk async for chunk in response])
+    assert isinstance(response, TemplateResponse)
+    return t.cast("bytes", response.render().content)
+
+
+def _respond(view: t.Callable[..., t.Any], request: HttpRequest) -> bytes:
+    async def respond() -> bytes:
+        return await _content(await view(request))
+
+    return asyncio.run(respond())
+
+
+def test_apublish_matches_publish() -> None:
+    """The coroutines return what the synchronous publishers do."""
+    assert asyncio.run(apublish_html_from_source(STREAMED_RST)) == (
+        publish_html_from_source(STREAMED_RST)
+    )
+    assert asyncio.run(apublish_document_from_source(STREAMED_RST)) == (
+        publish_document_from_source(STREAMED_RST)
+    )
+
+
+def test_render_executor_follows_settings(settings: t.Any) -> None:
+    """``async_render.max_workers`` sizes the pool; changes rebuild it."""
+    executor = get_render_executor()
+
+    settings.DJANGO_DOCUTILS_LIB_RST = {
+        **settings.DJANGO_DOCUTILS_LIB_RST,
+        "async_render": {"max_workers": 2},
+    }
+
+    assert get_render_executor() is not executor
+    assert get_render_executor()._max_workers == 2
+
+
+@pytest.mark.parametrize("stream", [False, True])
+def test_async_docutils_view_matches_view(
+    rf: RequestFactory,
+    async_rf: AsyncRequestFactory,
+    stream: bool,
+) -> None:
+    """AsyncDocutilsView sends the HTML DocutilsView does."""
+    view = DocutilsView.as_view(template_name="base.html", rst_name="home.rst")
+    async_view = AsyncDocutilsView.as_view(
+        template_name="base.html",
+        rst_name="home.rst",
+        stream=stream,
+    )
+
+    response = view(rf.get("/"))
+    response.render()  # type:ignore[attr-defined]
+
+    assert _respond(async_view, async_rf.get("/")) == response.content
+
+
+def test_render_executor_closes_old_connections(mocker: MockerFixture) -> None:
+    """Stale database connections are closed around work on the executor."""
+    close = mocker.spy(asynchronous, "close_old_connections")
+
+    assert asyncio.run(run_in_render_executor(sum, [1, 2, 3])) == 6
+    assert close.call_count == 2
+
+
+def test_async_docutils_view_streams_parse_off_the_loop(
+    async_rf: AsyncRequestFactory,
+    mocker: MockerFixture,
+) -> None:
+    """A streaming response parses the document on the render executor."""
+    threads: list[str] = []
+    parse = publisher.publish_doctree
+
+    def record_thread(*args: t.Any, **kwargs: t.Any) -> t.Any:
+        threads.append(threading.current_thread().name)
+        return parse(*args, **kwargs)
+
+    mocker.patch.object(template, "publish_doctree", record_thread)
+    view = AsyncDocutilsView.as_view(
+        template_name="base.html",
+        rst_name="home.rst",
+        stream=True,
+    )
+
+    _respond(view, async_rf.get("/"))
+
+    assert threads
+    assert all(name.startswith("django-docutils-render") for name in threads)
+
+
+@pytest.mark.parametrize("stream", [False, True])
+def test_async_docutils_view_renders_to_response(
+    async_rf: AsyncRequestFactory,
+    stream: bool,
+) -> None:
+    """Responses go through render_to_response, with its overrides and kwargs."""
+
+    class TeapotView(AsyncDocutilsView):
+        content_type = "text/plain"
+
+        def render_to_response(
+            self,
+            context: dict[str, t.Any] | None = None,
+            content_type: str | None = None,
+            status: int | None = None,
+            *args: t.Any,
+            **kwargs: t.Any,
+        ) -> HttpResponse:
+            response = super().render_to_response(
+                context,
+                content_type,
+                418,
+                *args,
+                **kwargs,
+            )
+            response["X-Rendered-By"] = "TeapotView"
+            return response
+
+    view: t.Callable[..., t.Any] = TeapotView.as_view(
+        template_name="base.html",
+        rst_name="home.rst",
+        stream=stream,
+    )
+
+    response = asyncio.run(view(async_rf.get("/")))
+
+    assert response.status_code == 418
+    assert response["Content-Type"].startswith("text/plain")
+    assert response["X-Rendered-By"] == "TeapotView"
+    assert isinstance(response, StreamingHttpResponse) is stream
+
+
+@pytest.mark.parametrize("stream", [False, True])
+def test_async_rst_view_matches_view(
+    tmp_path: pathlib.Path,
+    rf: RequestFactory,
+    async_rf: AsyncRequestFactory,
+    stream: bool,
+) -> None:
+    """AsyncRSTView sends the HTML and sidebar RSTView does."""
+    rst_file = tmp_path / "page.rst"
+    rst_file.write_text(STREAMED_RST, encoding="utf-8")
+
+    response = RSTView.as_view(file_path=rst_file)(rf.get("/"))
+    async_view = AsyncRSTView.as_view(file_path=rst_file, stream=stream)
+
+    content = _respond(async_view, async_rf.get("/"))
+
+    assert content == response.render().content  # type:ignore[attr-defined]
+    assert b"menu-list" in content
+
+
+def test_async_rst_view_sets_server_timing(
+    settings: t.Any,
+    tmp_path: pathlib.Path,
+    async_rf: AsyncRequestFactory,
+) -> None:
+    """Stages run on the executor are reported for async views."""
+    settings.DJANGO_DOCUTILS_LIB_RST = {
+        **settings.DJANGO_DOCUTILS_LIB_RST,
+        "server_timing": True,
+    }
+    rst_file = tmp_path / "page.rst"
+    rst_file.write_text(STREAMED_RST, encoding="utf-8")
+    view: t.Callable[..., t.Any] = AsyncRSTView.as_view(file_path=rst_file)
+
+    response = asyncio.run(view(async_rf.get("/")))
+
+    assert "parse;dur=" in response["Server-Timing"]
@@ -0,0 +1,71 @@
+"""Tests for the rendered-output cache."""
+
+from __future__ import annotations
+
+import typing as t
+
+import pytest
+
+from django_docutils.lib import publisher
+from django_docutils.lib.cache import get_render_fingerprint, make_render_cache_key
+from django_docutils.lib.publisher import publish_html_from_source
+
+if t.TYPE_CHECKING:
+    from pytest_mock import MockerFixture
+
+
+@pytest.mark.usefixtures("render_cache")
+def test_cache_hit_skips_docutils(mocker: MockerFixture) -> None:
+    """A repeated render is served from the cache without parsing."""
+    source = "Hello **world**"
+    first = publish_html_from_source(source)
+
+    publish_doctree = mocker.spy(publisher, "publish_doctree")
+    second = publish_html_from_source(source)
+
+    assert second == first
+    assert publish_doctree.call_count == 0
+
+
+@pytest.mark.usefixtures("render_cache")
+def test_cache_keys_on_rendering_flags() -> None:
+    """Flags that change output render separately."""
+    source = "Title\n=====\n\nOne\n---\n\nBody\n\nTwo\n---\n\nBody\n"
+
+    with_title = publish_html_from_source(source)
+    without_title = publish_html_from_source(source, show_title=False)
+    toc = publish_html_from_source(source, toc_only=True)
+
+    assert with_title is not None
+    assert without_title is not None
+    assert "Title" in with_title
+    assert "Title" not in without_title
+    assert toc is not None
+    assert "menu-list" in toc
+
+
+@pytest.mark.usefixtures("render_cache")
+def test_cache_remembers_empty_toc(mocker: MockerFixture) -> None:
+    """An empty TOC (``None``) is cached rather than re-rendered."""
+    assert publish_html_from_source("No sections", toc_only=True) is None
+
+    publish_doctree = mocker.spy(publisher, "publish_doctree")
+    assert publish_html_from_source("No sections", toc_only=True) is None
+    assert publish_doctree.call_count == 0
+
+
+@pytest.mark.usefixtures("render_cache")
+def test_settings_change_invalidates_cache(settings: t.Any) -> None:
+    """``reload_settings`` moves the fingerprint, so old entries go unused."""
+    key = make_render_cache_key("html", "Hello", show_title=True, toc_only=False)
+    fingerprint = get_render_fingerprint()
+
+    settings.DJANGO_DOCUTILS_LIB_RST = {
+        **settings.DJANGO_DOCUTILS_LIB_RST,
+        "transforms": [],
+    }
+
+    assert get_render_fingerprint() != fingerprint
+    assert (
+        make_render_cache_key("html", "Hello", show_title=True, toc_only=False) != key
+    )
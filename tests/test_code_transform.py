@@ -0,0 +1,99 @@
+"""Tests for CodeTransform inline literal highlighting."""
+
+from __future__ import annotations
+
+import typing as t
+
+import pytest
+from pygments.util import ClassNotFound
+
+from django_docutils.lib.publisher import publish_html_from_source
+from django_docutils.lib.transforms import code
+from django_docutils.lib.transforms.code import (
+    get_lexer_guess_policy,
+    guess_inline_lexer,
+)
+
+if t.TYPE_CHECKING:
+    from pytest_mock import MockerFixture
+
+
+TRANSFORMS = ["django_docutils.lib.transforms.code.CodeTransform"]
+
+
+def test_literals_are_not_guessed_by_default(
+    settings: t.Any,
+    mocker: MockerFixture,
+) -> None:
+    """Without ``guess_lexers``, unprefixed literals skip guessing entirely."""
+    settings.DJANGO_DOCUTILS_LIB_RST = {"transforms": TRANSFORMS}
+    spy = mocker.spy(code, "guess_inline_lexer")
+
+    html = publish_html_from_source("Call ``print(value)`` and run ``$ ls``.")
+
+    assert html is not None
+    assert "print(value)" in html
+    assert html.count("inline-code") == 1
+    assert spy.call_count == 0
+
+
+def test_literals_are_guessed_among_allowed_lexers(settings: t.Any) -> None:
+    """Literals a configured lexer claims are highlighted."""
+    settings.DJANGO_DOCUTILS_LIB_RST = {
+        "transforms": TRANSFORMS,
+        "inline_code": {"guess_lexers": ["python"]},
+    }
+
+    html = publish_html_from_source("Start with ``#!/usr/bin/env python3`` here.")
+
+    assert html is not None
+    assert "inline-code" in html
+
+
+def test_guesses_respect_length_bounds(settings: t.Any) -> None:
+    """Literals outside the configured lengths are not guessed."""
+    settings.DJANGO_DOCUTILS_LIB_RST = {
+        "transforms": TRANSFORMS,
+        "inline_code": {"guess_lexers": ["python"], "guess_max_length": 10},
+    }
+
+    html = publish_html_from_source("Start with ``#!/usr/bin/env python3`` here.")
+
+    assert html is not None
+    assert "inline-code" not in html
+
+
+def test_guesses_are_memoized(settings: t.Any) -> None:
+    """Repeated literals are scored once per policy."""
+    settings.DJANGO_DOCUTILS_LIB_RST = {"inline_code": {"guess_lexers": ["python"]}}
+    policy = get_lexer_guess_policy()
+    guess_inline_lexer.cache_clear()
+
+    first = guess_inline_lexer("#!/usr/bin/env python3", policy)
+    second = guess_inline_lexer("#!/usr/bin/env python3", policy)
+
+    assert first is second
+    assert guess_inline_lexer.cache_info().hits == 1
+
+
+def test_guess_policy_rebuilt_on_settings_change(settings: t.Any) -> None:
+    """Changing ``inline_code`` settings replaces the memoized policy."""
+    settings.DJANGO_DOCUTILS_LIB_RST = {}
+    policy = get_lexer_guess_policy()
+    assert policy.lexer_classes == ()
+
+    settings.DJANGO_DOCUTILS_LIB_RST = {"inline_code": {"guess_lexers": ["bash"]}}
+
+    assert [cls.__name__ for cls in get_lexer_guess_policy().lexer_classes] == [
+        "BashLexer",
+    ]
+
+
+def test_unknown_guess_lexer_raises(settings: t.Any) -> None:
+    """A lexer alias Pygments does not know is a configuration error."""
+    settings.DJANGO_DOCUTILS_LIB_RST = {
+        "inline_code": {"guess_lexers": ["no-such-lexer"]},
+    }
+
+    with pytest.raises(ClassNotFound):
+        get_lexer_guess_policy()
@@ -0,0 +1,134 @@
+"""Tests for the persistent doctree store."""
+
+from __future__ import annotations
+
+import operator
+import pickle
+import typing as t
+
+import pytest
+
+from django_docutils.lib import publisher
+from django_docutils.lib.doctree_store import get_doctree_store
+from django_docutils.lib.publisher import publish_doctree, publish_html_from_doctree
+
+from .constants import DEFAULT_RST_WITH_SECTIONS
+
+if t.TYPE_CHECKING:
+    import pathlib
+
+    from pytest_mock import MockerFixture
+
+
+@pytest.fixture
+def store_path(settings: t.Any, tmp_path: pathlib.Path) -> pathlib.Path:
+    """Enable the doctree store in a temporary directory for one test."""
+    settings.DJANGO_DOCUTILS_LIB_RST = {
+        **settings.DJANGO_DOCUTILS_LIB_RST,
+        "doctree_store": {"path": tmp_path},
+    }
+    return tmp_path
+
+
+def test_stored_doctree_skips_parsing(
+    store_path: pathlib.Path,
+    mocker: MockerFixture,
+) -> None:
+    """A second publish loads the stored tree and renders identically."""
+    first = publish_html_from_doctree(publish_doctree(DEFAULT_RST_WITH_SECTIONS))
+
+    parse = mocker.spy(publisher, "docutils_publish_doctree")
+    second = publish_html_from_doctree(publish_doctree(DEFAULT_RST_WITH_SECTIONS))
+
+    assert parse.call_count == 0
+    assert second == first
+    stored = list(store_path.rglob("*"))
+    assert [path.suffix for path in stored if path.is_file()] == [".pickle"]
+
+
+@pytest.mark.usefixtures("store_path")
+def test_loaded_doctrees_are_independent() -> None:
+    """Mutating a loaded doctree never leaks into later loads."""
+    publish_doctree("Hello **world**")
+
+    first = publish_doctree("Hello **world**")
+    first.children.clear()
+
+    assert publish_doctree("Hello **world**").astext() == "Hello world"
+
+
+def _reduced(func: t.Callable[..., object], args: tuple[object, ...]) -> bytes:
+    """Return a pickle calling ``func(*args)`` when loaded."""
+
+    class Reduced:
+        def __reduce__(self) -> tuple[t.Callable[..., object], tuple[object, ...]]:
+            return func, args
+
+    return pickle.dumps(Reduced())
+
+
+@pytest.mark.usefixtures("store_path")
+@pytest.mark.parametrize(
+    "payload",
+    [
+        pytest.param(b"not a pickle", id="unpickling-error"),
+        pytest.param(pickle.dumps(ValueError)[:-3], id="truncated"),
+        pytest.param(_reduced(int, ("not a number",)), id="value-error"),
+        pytest.param(_reduced(operator.getitem, ({}, "missing")), id="key-error"),
+        pytest.param(_reduced(int, (None,)), id="type-error"),
+        pytest.param(pickle.dumps({"not": "a document"}), id="not-a-document"),
+    ],
+)
+def test_corrupt_files_are_reparsed(mocker: MockerFixture, payload: bytes) -> None:
+    """An unreadable stored file counts as a miss and is replaced."""
+    store = get_doctree_store()
+    assert store is not None
+    publish_doctree("Hello **world**")
+    store.get_file(store.make_key("Hello **world**")).write_bytes(payload)
+
+    parse = mocker.spy(publisher, "docutils_publish_doctree")
+
+    assert publish_doctree("Hello **world**").astext() == "Hello world"
+    assert parse.call_count == 1
+
+
+def test_settings_change_moves_keys(store_path: pathlib.Path, settings: t.Any) -> None:
+    """Docutils settings and overrides are part of the key."""
+    store = get_doctree_store()
+    assert store is not None
+    key = store.make_key("Hello")
+
+    assert store.make_key("Hello", {"strip_comments": False}) != key
+
+    settings.DJANGO_DOCUTILS_LIB_RST = {
+        **settings.DJANGO_DOCUTILS_LIB_RST,
+        "docutils": {"initial_header_level": 3},
+    }
+    store = get_doctree_store()
+    assert store is not None
+    assert store.make_key("Hello") != key
+
+
+def test_unwritable_store_is_a_miss(
+    store_path: pathlib.Path,
+    settings: t.Any,
+    mocker: MockerFixture,
+) -> None:
+    """Write failures leave no temporary files and never fail the publish."""
+    replace = mocker.patch(
+        "django_docutils.lib.doctree_store.os.replace",
+        side_effect=PermissionError,
+    )
+
+    assert publish_doctree("Hello **world**").astext() == "Hello world"
+    assert replace.call_count == 1
+    assert [path for path in store_path.rglob("*") if path.is_file()] == []
+
+    not_a_directory = store_path / "file"
+    not_a_directory.write_text("", encoding="utf-8")
+    settings.DJANGO_DOCUTILS_LIB_RST = {
+        **settings.DJANGO_DOCUTILS_LIB_RST,
+        "doctree_store": {"path": not_a_directory},
+    }
+
+    assert publish_doctree("Hello **world**").astext() == "Hello world"
@@ -3,21 +3,31 @@
 
 from __future__ import annotations
 
+import types
 import typing as t
 
 import pytest
 from django.template import Context, Template
+from docutils.parsers.rst import roles
 
+from django_docutils.lib.publisher import publish_html_from_source
+from django_docutils.lib.roles import registry as roles_registry, remote
+from django_docutils.lib.roles.common import generic_remote_url_role
 from django_docutils.lib.roles.registry import (
+    get_django_docutils_roles,
     register_django_docutils_roles,
     register_role_mapping,
 )
+from django_docutils.lib.roles.remote import RemoteUrlResolver
 
 if t.TYPE_CHECKING:
     from collections.abc import Sequence
 
     from docutils import nodes
     from docutils.parsers.rst.states import Inliner
+    from pytest_mock import MockerFixture
+
+    from django_docutils.lib.roles.types import RemoteUrlHandlerFn
 
 MAIN_TPL = """
 <main>
@@ -124,6 +134,13 @@ class SphinxLikeRole:
 MySphinxLikeRole = SphinxLikeRole()
 
 
+class KwargsRole(SphinxLikeRole):
+    """Class-based role configured with keyword arguments."""
+
+    def __init__(self, **kwargs: t.Any) -> None:
+        self.kwargs = kwargs
+
+
 def test_register_role_mapping() -> None:
     """Assertions for register_role_mapping()."""
     register_role_mapping({})
@@ -163,6 +180,42 @@ def test_register_role_mapping() -> None:
     )
 
 
+def test_roles_resolve_once_per_settings_generation(
+    settings: t.Any,
+    mocker: MockerFixture,
+) -> None:
+    """Publishing reuses registered roles until settings change."""
+    register_django_docutils_roles()
+    import_spy = mocker.spy(roles_registry, "import_string")
+    register_spy = mocker.spy(roles, "register_local_role")
+
+    publish_html_from_source(":gh:`org`")
+    publish_html_from_source(":gh:`org`")
+
+    assert import_spy.call_count == 0
+    assert register_spy.call_count == 0
+
+    settings.DJANGO_DOCUTILS_LIB_RST = {
+        **settings.DJANGO_DOCUTILS_LIB_RST,
+        "roles": {
+            "local": {
+                "ex": (
+                    "tests.test_docutils_roles.KwargsRole",
+                    {"innernodeclass": "docutils.nodes.inline"},
+                ),
+            },
+        },
+    }
+    role = get_django_docutils_roles()["ex"]
+
+    assert isinstance(role, KwargsRole)
+    assert role.kwargs["innernodeclass"].__name__ == "inline"
+    assert register_spy.call_count == 1
+    assert settings.DJANGO_DOCUTILS_LIB_RST["roles"]["local"]["ex"][1] == {
+        "innernodeclass": "docutils.nodes.inline",
+    }
+
+
 GH_ROLE_TESTS: list[RoleContentFixture] = [
     RoleContentFixture(
         test_id="gh-role-org",
@@ -205,3 +258,127 @@ def test_templatetag_gh_role(
 ) -> None:
     """Asserts gh docutils role."""
     assert render_rst_block(rst_content) == MAIN_TPL.format(content=expected_html)
+
+
+def test_document_role_override_does_not_leak() -> None:
+    """A ``.. role::`` in one document doesn't replace a configured role."""
+    expected = publish_html_from_source(":gh:`tony/django-docutils`")
+
+    publish_html_from_source(".. role:: gh(emphasis)\n\n:gh:`tony/django-docutils`")
+    html = publish_html_from_source(":gh:`tony/django-docutils` ")
+
+    assert html == expected
+    assert html is not None
+    assert 'href="https://github.com/tony/django-docutils"' in html
+
+
+REMOTE_RST = ":product:`vim`, :product:`tmux`, and :product:`an editor <vim>`\n"
+
+
+def _product(target: str) -> tuple[str, str]:
+    return target.title(), f"https://example.com/{target}/"
+
+
+RegisterProductRole: t.TypeAlias = (
+    "t.Callable[[RemoteUrlHandlerFn | RemoteUrlResolver], None]"
+)
+
+
+@pytest.fixture
+def register_product_role(monkeypatch: pytest.MonkeyPatch) -> RegisterProductRole:
+    """Return a function registering a ``product`` role, removed on teardown."""
+
+    def register(url_handler_fn: RemoteUrlHandlerFn | RemoteUrlResolver) -> None:
+        def product_role(
+            name: str,
+            rawtext: str,
+            text: str,
+            lineno: int,
+            inliner: Inliner,
+            options: dict[str, t.Any] | None = None,
+            content: str | None = None,
+        ) -> t.Any:
+            return generic_remote_url_role(name, text, url_handler_fn)
+
+        # docutils' role registry is process-wide: undo on teardown.
+        monkeypatch.setitem(
+            roles._roles,  # type:ignore[attr-defined]
+            "product",
+            product_role,
+        )
+
+    return register
+
+
+def test_remote_url_resolver_batches_lookups(
+    register_product_role: RegisterProductRole,
+) -> None:
+    """Deferred lookups make one call and render what direct lookups do."""
+    lookups: list[Sequence[str]] = []
+
+    def lookup_many(targets: Sequence[str]) -> dict[str, tuple[str, str]]:
+        lookups.append(targets)
+        return {target: _product(target) for target in targets}
+
+    register_product_role(_product)
+    expected = publish_html_from_source(REMOTE_RST)
+
+    register_product_role(RemoteUrlResolver(batch_url_handler_fn=lookup_many))
+    html = publish_html_from_source(REMOTE_RST)
+
+    assert html is not None
+    assert html == expected
+    assert ">an editor</a>" in html
+    assert lookups == [["vim", "tmux"]]
+
+
+def test_remote_url_resolver_looks_up_each_target_once(
+    register_product_role: RegisterProductRole,
+) -> None:
+    """Without a batch handler, unique targets are looked up concurrently."""
+    lookups: list[str] = []
+
+    def lookup(target: str) -> tuple[str, str]:
+        lookups.append(target)
+        return _product(target)
+
+    resolver = RemoteUrlResolver(lookup)
+    register_product_role(resolver)
+
+    publish_html_from_source(REMOTE_RST)
+    publish_html_from_source(REMOTE_RST)
+
+    assert sorted(lookups) == ["tmux", "vim"]
+    assert resolver("vim") == _product("vim")
+
+
+def test_remote_url_resolver_ttl(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Answers are looked up again once their ``ttl`` passes."""
+    lookups: list[str] = []
+    now = 1000.0
+    monkeypatch.setattr(remote, "time", types.SimpleNamespace(monotonic=lambda: now))
+
+    def lookup(target: str) -> tuple[str, str]:
+        lookups.append(target)
+        return _product(target)
+
+    resolver = RemoteUrlResolver(lookup, ttl=60)
+    resolver.resolve_many(["vim"])
+    now += 30
+    resolver.resolve_many(["vim"])
+    now += 60
+    resolver.resolve_many(["vim"])
+
+    assert lookups == ["vim", "vim"]
+
+
+def test_remote_url_resolver_missing_batch_answer() -> None:
+    """Targets a batch handler leaves out raise without a fallback handler."""
+    resolver = RemoteUrlResolver(batch_url_handler_fn=lambda targets: {})
+
+    with pytest.raises(KeyError):
+        resolver.resolve_many(["vim"])
+
+    resolver = RemoteUrlResolver(_product, batch_url_handler_fn=lambda targets: {})
+
+    assert resolver.resolve_many(["vim"]) == {"vim": _product("vim")}
@@ -0,0 +1,120 @@
+"""Tests for the shared highlight cache."""
+
+from __future__ import annotations
+
+import typing as t
+
+import pygments
+import pytest
+from django.core.cache import caches
+
+from django_docutils.lib import highlight
+from django_docutils.lib.highlight import (
+    clear_highlight_cache,
+    highlight_cache_info,
+    highlight_code,
+)
+from django_docutils.lib.publisher import publish_html_from_source
+
+if t.TYPE_CHECKING:
+    from pytest_mock import MockerFixture
+
+CODE_BLOCK_RST = """\
+.. code-block:: python
+
+   def add(a, b):
+       return a + b
+"""
+
+
+@pytest.fixture(autouse=True)
+def _clear_highlight_cache() -> t.Iterator[None]:
+    clear_highlight_cache()
+    yield
+    clear_highlight_cache()
+
+
+@pytest.fixture
+def highlight_cache(settings: t.Any) -> t.Iterator[None]:
+    """Enable the Django cache tier in a locmem cache for one test."""
+    settings.CACHES = {
+        "default": {"BACKEND": "django.core.cache.backends.locmem.LocMemCache"},
+    }
+    settings.DJANGO_DOCUTILS_LIB_RST = {
+        **settings.DJANGO_DOCUTILS_LIB_RST,
+        "highlight_cache": {"alias": "default", "timeout": 60},
+    }
+    caches["default"].clear()
+    yield
+    caches["default"].clear()
+
+
+def test_code_blocks_and_inline_code_share_the_cache(mocker: MockerFixture) -> None:
+    """Re-rendering highlights nothing twice, for blocks and inline literals."""
+    spy = mocker.spy(pygments, "highlight")
+    source = f"Run ``$ ls -la`` now.\n\n{CODE_BLOCK_RST}"
+
+    first = publish_html_from_source(source)
+    second = publish_html_from_source(source)
+
+    assert first == second
+    assert first is not None
+    assert "code-block" in first
+    assert "inline-code" in first
+    assert spy.call_count == 2
+    info = highlight_cache_info()
+    assert (info.hits, info.misses) == (2, 2)
+
+
+def test_formatter_options_are_part_of_the_key() -> None:
+    """The same code under different formatter options is highlighted apart."""
+    from pygments.formatters.html import HtmlFormatter
+    from pygments.lexers.python import PythonLexer
+
+    plain = highlight_code("pass", PythonLexer(), HtmlFormatter())
+    numbered = highlight_code("pass", PythonLexer(), HtmlFormatter(linenos=True))
+
+    assert plain != numbered
+    assert highlight_cache_info().misses == 2
+
+
+@pytest.mark.usefixtures("highlight_cache")
+def test_shared_tier_serves_other_processes(mocker: MockerFixture) -> None:
+    """With the in-process tier empty, the Django cache tier is consulted."""
+    html = publish_html_from_source(CODE_BLOCK_RST)
+    clear_highlight_cache()  # as if in a fresh worker process
+    spy = mocker.spy(pygments, "highlight")
+
+    assert publish_html_from_source(CODE_BLOCK_RST) == html
+    assert spy.call_count == 0
+    assert highlight_cache_info().shared_hits == 1
+
+
+def test_in_process_tier_is_bounded(monkeypatch: pytest.MonkeyPatch) -> None:
+    """The least recently used snippet is evicted past the size limit."""
+    from pygments.formatters.html import HtmlFormatter
+    from pygments.lexers.python import PythonLexer
+
+    monkeypatch.setattr(highlight, "HIGHLIGHT_CACHE_MAXSIZE", 2)
+    lexer, formatter = PythonLexer(), HtmlFormatter()
+    highlight_code("a", lexer, formatter)
+    highlight_code("b", lexer, formatter)
+    highlight_code("a", lexer, formatter)
+    highlight_code("c", lexer, formatter)  # evicts "b"
+
+    highlight_code("a", lexer, formatter)
+    highlight_code("b", lexer, formatter)
+
+    info = highlight_cache_info()
+    assert (info.hits, info.misses, info.currsize) == (2, 4, 2)
+
+
+def test_lexer_cache_is_bounded_and_case_insensitive() -> None:
+    """Case variants of a lexer name share one bounded cache entry."""
+    highlight._get_lexer.cache_clear()
+
+    lexers = {id(highlight.get_lexer(name)) for name in ("python", "PYTHON", "PyThOn")}
+
+    assert len(lexers) == 1
+    assert highlight._get_lexer.cache_info().currsize == 1
+    assert highlight._get_lexer.cache_info().maxsize == highlight.LEXER_CACHE_MAXSIZE
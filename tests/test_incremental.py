@@ -0,0 +1,179 @@
+"""Tests for incremental, section-at-a-time publishing."""
+
+from __future__ import annotations
+
+import typing as t
+
+import pytest
+
+from django_docutils.lib import incremental
+from django_docutils.lib.incremental import (
+    clear_chunk_cache,
+    publish_document_incremental,
+    split_source_sections,
+)
+from django_docutils.lib.publisher import publish_document_from_source
+
+from .constants import DEFAULT_RST, DEFAULT_RST_WITH_SECTIONS
+from .test_publisher import STREAMED_RST
+
+if t.TYPE_CHECKING:
+    from pytest_mock import MockerFixture
+
+LINKED_RST = """
+Title
+=====
+
+:Author: Someone
+
+See `Two`_ and the `alias`_.
+
+One
+---
+
+Text [#]_ and `example <https://example.com>`__.
+
+.. [#] A note
+
+Sub
+~~~
+
+Nested text
+
+Two
+---
+
+Back to One_, ``code``, and `the web <https://example.org>`_.
+
+.. _alias: Sub_
+"""
+
+TARGETED_RST = """
+Title
+=====
+
+Intro
+
+.. _first:
+
+One
+---
+
+See anchor_.
+
+.. _anchor:
+.. _`other anchor`:
+
+Two
+---
+
+Back to first_ and `other anchor`_.
+"""
+
+
+@pytest.fixture(autouse=True)
+def _empty_chunk_cache() -> t.Iterator[None]:
+    clear_chunk_cache()
+    yield
+    clear_chunk_cache()
+
+
+@pytest.mark.parametrize(
+    "source",
+    [
+        LINKED_RST,
+        TARGETED_RST,
+        STREAMED_RST,
+        DEFAULT_RST,
+        DEFAULT_RST_WITH_SECTIONS,
+        "Hello",
+        "",
+    ],
+)
+def test_incremental_matches_publish(mocker: MockerFixture, source: str) -> None:
+    """Stitched chunks equal the whole-document rendering."""
+    fallback = mocker.spy(incremental, "publish_document_from_source")
+
+    document = publish_document_incremental(source)
+
+    assert fallback.call_count == 0
+    assert document == publish_document_from_source(source)
+
+
+def test_incremental_rerenders_edited_chunk_only(mocker: MockerFixture) -> None:
+    """Only the edited section is parsed again; references still resolve."""
+    publish_document_incremental(LINKED_RST)
+    spy = mocker.spy(incremental, "publish_doctree")
+    toc_spy = mocker.spy(incremental, "publish_toc_from_doctree")
+    edited = LINKED_RST.replace("Nested text", "Edited text")
+
+    document = publish_document_incremental(edited)
+
+    assert spy.call_count == 1
+    assert toc_spy.call_count == 0
+    assert document == publish_document_from_source(edited)
+    assert '<a class="reference internal" href="#one">One</a>' in document.fragment
+
+
+def test_split_source_sections_keeps_document_title_in_head() -> None:
+    """Promoted titles stay in the head; sections keep their subsections."""
+    chunks = split_source_sections(LINKED_RST)
+
+    assert chunks is not None
+    assert chunks.head.lstrip().startswith("Title\n=====")
+    assert [section.split("\n", 1)[0] for section in chunks.sections] == [
+        "One",
+        "Two",
+    ]
+    assert "Sub\n~~~" in chunks.sections[0]
+    assert "".join([chunks.head, *chunks.sections]) == LINKED_RST
+
+
+def test_split_source_sections_keeps_targets_with_their_section() -> None:
+    """Targets right above a section title start that section's chunk."""
+    chunks = split_source_sections(TARGETED_RST)
+
+    assert chunks is not None
+    assert chunks.head.endswith("Intro\n\n")
+    assert chunks.sections[0].startswith(".. _first:\n\nOne\n")
+    assert chunks.sections[1].startswith(".. _anchor:\n.. _`other anchor`:\n\nTwo\n")
+    assert "".join([chunks.head, *chunks.sections]) == TARGETED_RST
+
+
+@pytest.mark.parametrize(
+    "source",
+    [
+        pytest.param(
+            "Title\n=====\n\n.. contents::\n\nOne\n---\n\nx\n\nTwo\n---\n\ny\n",
+            id="contents",
+        ),
+        pytest.param(
+            "A\n=\n\nEx\n--\n\nx\n\nB\n=\n\nEx\n--\n\ny\n",
+            id="duplicate-section-ids",
+        ),
+        pytest.param(
+            "A\n=\n\nx [#]_\n\n.. [#] n\n\nB\n=\n\ny [#]_\n\n.. [#] m\n",
+            id="footnotes-in-two-sections",
+        ),
+        pytest.param(
+            ".. role:: custom\n\nTitle\n=====\n\nOne\n---\n\nx\n",
+            id="directive-before-title",
+        ),
+        pytest.param(
+            "Title\n=====\n\n.. |x| replace:: XX\n\n"
+            "One\n---\n\n|x|\n\nTwo\n---\n\n|x|\n",
+            id="substitution-defined-in-another-chunk",
+        ),
+    ],
+)
+def test_incremental_falls_back_to_whole_publish(
+    mocker: MockerFixture,
+    source: str,
+) -> None:
+    """Documents whose chunks don't render alone are published whole."""
+    fallback = mocker.spy(incremental, "publish_document_from_source")
+
+    document = publish_document_incremental(source)
+
+    assert fallback.call_count == 1
+    assert document == publish_document_from_source(source)
@@ -0,0 +1,82 @@
+"""Tests for per-stage timing of the render pipeline."""
+
+from __future__ import annotations
+
+import typing as t
+
+import pytest
+
+from django_docutils.lib.instrumentation import (
+    collect_stage_timings,
+    stage_timed,
+)
+from django_docutils.lib.publisher import publish_html_from_source
+from django_docutils.views import DocutilsView
+
+from .constants import DEFAULT_RST_WITH_SECTIONS
+
+if t.TYPE_CHECKING:
+    from django.test import RequestFactory
+
+SOURCE = f"{DEFAULT_RST_WITH_SECTIONS}\n\nRun ``$ ls -la`` to list files.\n"
+
+
+def test_publish_reports_each_stage() -> None:
+    """Parse, sanitize, each writer transform and translate are timed."""
+    with collect_stage_timings() as timings:
+        html = publish_html_from_source(SOURCE)
+
+    assert html == publish_html_from_source(SOURCE)
+    assert {"parse", "sanitize", "translate", "transform.CodeTransform"} <= set(
+        timings.durations,
+    )
+    assert all(duration >= 0 for duration in timings.durations.values())
+    assert timings.counts["sanitize"] == 1
+
+
+def test_stage_timed_signal() -> None:
+    """Receivers of ``stage_timed`` see stages without a collector."""
+    stages: list[str] = []
+
+    def receiver(sender: object, stage: str, duration: float, **kwargs: t.Any) -> None:
+        stages.append(stage)
+
+    stage_timed.connect(receiver)
+    try:
+        publish_html_from_source("Hello **world**")
+    finally:
+        stage_timed.disconnect(receiver)
+
+    assert "parse" in stages
+    assert "translate" in stages
+
+
+@pytest.fixture
+def server_timing(settings: t.Any) -> None:
+    """Enable ``Server-Timing`` headers for one test."""
+    settings.DJANGO_DOCUTILS_LIB_RST = {
+        **settings.DJANGO_DOCUTILS_LIB_RST,
+        "server_timing": True,
+    }
+
+
+@pytest.mark.usefixtures("server_timing")
+def test_docutils_view_sets_server_timing(rf: RequestFactory) -> None:
+    """DocutilsView responses carry the stages of their render."""
+    view = DocutilsView.as_view(template_name="base.html", rst_name="home.rst")
+
+    response = view(rf.get("/"))
+    response.render()  # type:ignore[attr-defined]
+
+    assert "parse;dur=" in response["Server-Timing"]
+    assert "sanitize;dur=" in response["Server-Timing"]
+
+
+def test_server_timing_is_opt_in(rf: RequestFactory) -> None:
+    """Without the setting no header is added."""
+    view = DocutilsView.as_view(template_name="base.html", rst_name="home.rst")
+
+    response = view(rf.get("/"))
+    response.render()  # type:ignore[attr-defined]
+
+    assert "Server-Timing" not in response
@@ -0,0 +1,74 @@
+"""Tests for process-pool bulk rendering."""
+
+from __future__ import annotations
+
+import multiprocessing
+import typing as t
+
+import pytest
+
+from django_docutils.lib import parallel
+from django_docutils.lib.parallel import publish_html_parallel
+from django_docutils.lib.publisher import publish_html_from_source
+
+from .constants import DEFAULT_RST_WITH_SECTIONS
+
+requires_fork = pytest.mark.skipif(
+    "fork" not in multiprocessing.get_all_start_methods(),
+    reason="fork start method unavailable",
+)
+
+
+@pytest.mark.parametrize("start_method", ["fork", "spawn"])
+def test_parallel_matches_serial_in_order(start_method: str) -> None:
+    """Workers render what the serial API renders, in source order."""
+    if start_method not in multiprocessing.get_all_start_methods():
+        pytest.skip(f"{start_method} start method unavailable")
+    sources = [f"Doc {index}\n\nBody *{index}*" for index in range(7)]
+    sources.append(DEFAULT_RST_WITH_SECTIONS)
+
+    results = list(
+        publish_html_parallel(
+            sources,
+            workers=2,
+            chunksize=3,
+            mp_context=multiprocessing.get_context(start_method),
+            show_title=False,
+        ),
+    )
+
+    assert [result.html for result in results] == [
+        publish_html_from_source(source, show_title=False) for source in sources
+    ]
+    assert all(result.error is None for result in results)
+    assert all(result.duration >= 0 for result in results)
+
+
+@requires_fork
+def test_parallel_captures_per_document_errors(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """A failing document is reported without aborting the batch."""
+
+    def publish(source: str, **kwargs: t.Any) -> str | None:
+        if source == "boom":
+            msg = "cannot render"
+            raise ValueError(msg)
+        return publish_html_from_source(source, **kwargs)
+
+    monkeypatch.setattr(parallel, "publish_html_from_source", publish)
+
+    results = list(
+        publish_html_parallel(
+            ["before", "boom", "after"],
+            workers=1,
+            mp_context=multiprocessing.get_context("fork"),
+        ),
+    )
+
+    assert results[0].html is not None
+    assert results[1].html is None
+    assert results[1].error is not None
+    assert "ValueError: cannot render" in results[1].error
+    assert results[2].html is not None
+    assert "after" in results[2].html
@@ -0,0 +1,72 @@
+"""Tests for the docutils_prerender management command."""
+
+from __future__ import annotations
+
+import io
+import pathlib
+import typing as t
+
+import pytest
+from django.core.management import call_command
+from django.core.management.base import CommandError
+from django.template import engines
+from django.urls import path
+
+from django_docutils.lib import publisher
+from django_docutils.lib.publisher import publish_document_from_source
+from django_docutils.lib.views import RSTView
+
+if t.TYPE_CHECKING:
+    from pytest_mock import MockerFixture
+
+VIEW_FILE = pathlib.Path(__file__).parent / "rst_content" / "home.rst"
+
+urlpatterns = [
+    path("home/", RSTView.as_view(file_path=VIEW_FILE), name="home"),
+]
+
+
+@pytest.fixture
+def urlconf(settings: t.Any) -> None:
+    """Route an RSTView through this module's urlpatterns."""
+    settings.ROOT_URLCONF = __name__
+
+
+@pytest.mark.usefixtures("render_cache", "urlconf")
+def test_prerender_warms_cache(mocker: MockerFixture) -> None:
+    """Templates and RSTView files render from the cache afterwards."""
+    stdout = io.StringIO()
+    call_command("docutils_prerender", "--workers=1", stdout=stdout)
+
+    assert "Pre-rendered 2 of 2 documents" in stdout.getvalue()
+    assert "home.rst" in stdout.getvalue()
+
+    publish_doctree = mocker.spy(publisher, "publish_doctree")
+    html = engines["docutils"].get_template("home.rst").render()
+    document = publish_document_from_source(VIEW_FILE.read_text(encoding="utf-8"))
+
+    assert publish_doctree.call_count == 0
+    assert html
+    assert document.html_body
+
+
+@pytest.mark.usefixtures("urlconf")
+def test_prerender_writes_output_dir(tmp_path: pathlib.Path) -> None:
+    """``--output-dir`` writes one HTML file per target."""
+    call_command(
+        "docutils_prerender",
+        "--workers=1",
+        f"--output-dir={tmp_path}",
+        "--slowest=0",
+        stdout=io.StringIO(),
+    )
+
+    assert (tmp_path / "home.rst.html").read_text(encoding="utf-8")
+    view_html = list((tmp_path / "views").rglob("home.rst.html"))
+    assert len(view_html) == 1
+
+
+def test_prerender_requires_a_destination() -> None:
+    """Without a cache or ``--output-dir`` there is nowhere to put output."""
+    with pytest.raises(CommandError, match="--output-dir"):
+        call_command("docutils_prerender", stdout=io.StringIO())
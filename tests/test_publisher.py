@@ -0,0 +1,190 @@
+"""Tests for django-docutils publishing entry points."""
+
+from __future__ import annotations
+
+import typing as t
+
+import pytest
+from django.http import StreamingHttpResponse
+from django.template import Context, Template
+from django.template.response import TemplateResponse
+from django.utils.functional import cached_property
+from docutils import nodes
+
+from django_docutils.lib import publisher
+from django_docutils.lib.publisher import (
+    publish_doctree,
+    publish_document_from_source,
+    publish_html_from_doctree,
+    publish_html_from_source,
+    publish_many,
+    publish_toc_from_doctree,
+    stream_document_from_source,
+)
+from django_docutils.lib.views import RSTView
+from django_docutils.templatetags import django_docutils as tags
+
+from .constants import DEFAULT_RST_WITH_SECTIONS
+
+if t.TYPE_CHECKING:
+    import pathlib
+
+    from django.test import RequestFactory
+    from pytest_mock import MockerFixture
+
+
+def test_published_document_matches_separate_publishes() -> None:
+    """One combined publish renders what three separate publishes did."""
+    document = publish_document_from_source(DEFAULT_RST_WITH_SECTIONS)
+
+    assert document.html_body == publish_html_from_doctree(
+        publish_doctree(DEFAULT_RST_WITH_SECTIONS),
+    )
+    assert document.fragment == publish_html_from_doctree(
+        publish_doctree(DEFAULT_RST_WITH_SECTIONS),
+        show_title=False,
+    )
+    assert document.toc == publish_toc_from_doctree(
+        publish_doctree(DEFAULT_RST_WITH_SECTIONS),
+    )
+    assert document.title == "hey"
+
+
+def test_template_tags_share_one_publish(mocker: MockerFixture) -> None:
+    """Body and TOC tags on the same content parse it once per render."""
+    parse = mocker.spy(tags, "publish_doctree")
+    build_toc = mocker.spy(publisher, "publish_toc_from_doctree")
+    context = {"content": DEFAULT_RST_WITH_SECTIONS}
+
+    body = Template("{% load django_docutils %}{% rst content %}").render(
+        Context(context),
+    )
+
+    assert parse.call_count == 1
+    assert build_toc.call_count == 0  # the TOC is only built when requested
+    assert body == publish_html_from_source(DEFAULT_RST_WITH_SECTIONS)
+
+    parse.reset_mock()
+    template = Template(
+        "{% load django_docutils %}"
+        "{% rst content %}{% rst content toc_only=True %}{% rst content %}",
+    )
+
+    html = template.render(Context(context))
+
+    assert parse.call_count == 1
+    assert build_toc.call_count == 1
+    assert (
+        html
+        == body
+        + (publish_html_from_source(DEFAULT_RST_WITH_SECTIONS, toc_only=True) or "")
+        + body
+    )
+    assert "menu-list" in html
+
+
+def test_publish_many_matches_single_publishes() -> None:
+    """Batch output equals per-document output, in source order."""
+    sources = ["Hello **world**", DEFAULT_RST_WITH_SECTIONS, "Bye *now*"]
+
+    assert list(publish_many(sources, show_title=False)) == [
+        publish_html_from_source(source, show_title=False) for source in sources
+    ]
+
+
+def test_publish_many_is_lazy(mocker: MockerFixture) -> None:
+    """Sources are rendered as results are consumed."""
+    spy = mocker.spy(publisher, "_publish_doctree")
+    results = publish_many(iter(["One", "Two"]))
+
+    assert spy.call_count == 0
+    next(results)
+    assert spy.call_count == 1
+
+
+def test_publish_many_deduplicates(mocker: MockerFixture) -> None:
+    """Repeated sources are parsed once when ``deduplicate`` is set."""
+    spy = mocker.spy(publisher, "_publish_doctree")
+
+    html = list(publish_many(["Same", "Other", "Same"], deduplicate=True))
+
+    assert html[0] == html[2]
+    assert spy.call_count == 2
+
+
+STREAMED_RST = (
+    DEFAULT_RST_WITH_SECTIONS
+    + """
+Details
+-------
+
+:Note: field lists, too
+
+- a ``literal``
+- and a `link <https://example.com>`_
+
+.. code-block:: python
+
+   print("hi")
+
+>>> 1 + 1
+2
+"""
+)
+
+
+@pytest.mark.parametrize("show_title", [True, False])
+def test_streamed_document_matches_publish(show_title: bool) -> None:
+    """Joined chunks equal the whole-string rendering, TOC included."""
+    streamed = stream_document_from_source(STREAMED_RST, show_title=show_title)
+    chunks = list(streamed.chunks)
+
+    assert len(chunks) > 2
+    assert "".join(chunks) == publish_html_from_doctree(
+        publish_doctree(STREAMED_RST),
+        show_title=show_title,
+    )
+    assert streamed.toc == publish_toc_from_doctree(publish_doctree(STREAMED_RST))
+
+
+def test_streaming_rst_view_matches_rendered_view(
+    tmp_path: pathlib.Path,
+    rf: RequestFactory,
+) -> None:
+    """``RSTView.stream`` sends the HTML and sidebar the rendered view does."""
+    rst_file = tmp_path / "page.rst"
+    rst_file.write_text(STREAMED_RST, encoding="utf-8")
+
+    response = RSTView.as_view(file_path=rst_file)(rf.get("/"))
+    streaming_response = RSTView.as_view(file_path=rst_file, stream=True)(
+        rf.get("/"),
+    )
+
+    assert isinstance(response, TemplateResponse)
+    assert isinstance(streaming_response, StreamingHttpResponse)
+    content = b"".join(streaming_response.streaming_content)  # type:ignore[arg-type]
+    assert content == response.render().content
+    assert b"menu-list" in content
+
+
+def test_rst_view_publishes_overridden_doctree(
+    tmp_path: pathlib.Path,
+    rf: RequestFactory,
+) -> None:
+    """Subclasses post-processing ``doctree`` see it in the published HTML."""
+
+    class UppercaseView(RSTView):
+        @cached_property
+        def doctree(self) -> nodes.document | None:
+            doctree = super().doctree
+            assert doctree is not None
+            for text in list(doctree.findall(nodes.Text)):
+                text.parent.replace(text, nodes.Text(text.astext().upper()))
+            return doctree
+
+    rst_file = tmp_path / "page.rst"
+    rst_file.write_text("Hello **world**", encoding="utf-8")
+
+    response = UppercaseView.as_view(file_path=rst_file)(rf.get("/"))
+
+    assert b"HELLO <strong>WORLD</strong>" in response.render().content  # type:ignore[attr-defined]
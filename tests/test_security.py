@@ -9,13 +9,20 @@ from django.template import Context, Template
 from docutils import nodes
 from docutils.core import publish_doctree as docutils_publish_doctree
 
+from django_docutils.lib import sanitize
 from django_docutils.lib.publisher import (
     publish_doctree,
     publish_html_from_doctree,
     publish_html_from_source,
     publish_parts_from_doctree,
 )
-from django_docutils.lib.sanitize import _uri_is_allowed, sanitize_doctree
+from django_docutils.lib.sanitize import (
+    UriPolicy,
+    _uri_is_allowed,
+    get_uri_policy,
+    sanitize_doctree,
+    uri_is_allowed,
+)
 from django_docutils.lib.utils import append_html_to_node
 from django_docutils.lib.writers import DjangoDocutilsWriter
 from django_docutils.template import DocutilsTemplates
@@ -25,6 +32,7 @@ if t.TYPE_CHECKING:
     import pathlib
 
     from django.test import RequestFactory
+    from pytest_mock import MockerFixture
 
 
 class UnsafeRSTCase(t.NamedTuple):
@@ -577,6 +585,63 @@ def test_uri_is_allowed_rejects_obfuscated_schemes(
     assert _uri_is_allowed(uri, frozenset({"https"})) is allowed
 
 
+FAST_PATH_URI_CASES: list[UriAllowCase] = [
+    *URI_ALLOW_CASES,
+    UriAllowCase(
+        test_id="fast-path-https",
+        uri="https://example.com/path?q=1#frag",
+        allowed=True,
+    ),
+    UriAllowCase(
+        test_id="fast-path-control-char",
+        uri="https://example.com/\x0bpath",
+        allowed=False,
+    ),
+    UriAllowCase(
+        test_id="fast-path-invalid-ipv6",
+        uri="https://[::1/",
+        allowed=False,
+    ),
+    UriAllowCase(
+        test_id="fast-path-disallowed-http",
+        uri="http://example.com",
+        allowed=False,
+    ),
+]
+
+
+@pytest.mark.parametrize(
+    UriAllowCase._fields,
+    FAST_PATH_URI_CASES,
+    ids=[case.test_id for case in FAST_PATH_URI_CASES],
+)
+def test_uri_policy_matches_full_check(
+    test_id: str,
+    uri: str,
+    allowed: bool,
+) -> None:
+    """The cached, fast-pathed check agrees with the full ``urlsplit`` check."""
+    policy = UriPolicy.from_schemes(frozenset({"https"}))
+
+    assert uri_is_allowed(uri, policy) is allowed
+    assert uri_is_allowed(uri, policy) is allowed
+
+
+def test_uri_policy_rebuilt_on_settings_change(settings: t.Any) -> None:
+    """Changing the scheme allow-list replaces the compiled policy."""
+    policy = get_uri_policy()
+    assert get_uri_policy() is policy
+    assert uri_is_allowed("ftp://example.com", policy) is False
+
+    settings.DJANGO_DOCUTILS_LIB_RST = {"allowed_uri_schemes": ["https", "ftp"]}
+
+    assert get_uri_policy() is not policy
+    assert uri_is_allowed("ftp://example.com", get_uri_policy()) is True
+    html = publish_html_from_source("`x <ftp://example.com>`_")
+    assert html is not None
+    assert "ftp://example.com" in html
+
+
 class TrustedMarkupCase(t.NamedTuple):
     """Library-generated markup that must survive locked-down rendering."""
 
@@ -887,3 +952,63 @@ def test_append_html_to_node_survives_sanitization() -> None:
 
     raw_nodes = list(doctree.findall(nodes.raw))
     assert any("injected" in raw_node.astext() for raw_node in raw_nodes)
+
+
+def test_writer_skips_sanitize_after_safe_transforms(
+    settings: t.Any,
+    mocker: MockerFixture,
+) -> None:
+    """The writer's sanitize pass is skipped when only safe transforms ran."""
+    settings.DJANGO_DOCUTILS_LIB_RST = {
+        "transforms": ["django_docutils.lib.transforms.code.CodeTransform"],
+    }
+    spy = mocker.spy(sanitize, "_is_sanitized")
+
+    html = publish_html_from_source("Run ``$ ls -la`` now.")
+
+    assert html is not None
+    assert "inline-code" in html
+    assert spy.call_count == 1
+    assert spy.spy_return is True
+
+
+def test_writer_sanitizes_after_unsafe_transforms(
+    settings: t.Any,
+    mocker: MockerFixture,
+) -> None:
+    """A transform not declared sanitize-safe forces the writer pass."""
+    settings.DJANGO_DOCUTILS_LIB_RST = {
+        "transforms": ["sanitize_fixtures.InjectingTransform"],
+    }
+    spy = mocker.spy(sanitize, "_is_sanitized")
+
+    html = publish_html_from_source("Benign source")
+
+    assert html is not None
+    assert spy.spy_return is False
+    assert "<script>alert(2)</script>" not in html
+
+
+def test_sanitize_doctree_rechecks_without_skip() -> None:
+    """Callers not opting into the skip always get a full pass."""
+    doctree = publish_doctree("text")
+    sanitize_doctree(doctree)
+    doctree += nodes.raw("", "<b>NOPE</b>", format="html")
+
+    sanitize_doctree(doctree)
+
+    assert not list(doctree.findall(nodes.raw))
+
+
+def test_sanitize_doctree_does_not_skip_under_other_policy(settings: t.Any) -> None:
+    """A document sanitized under a looser policy is rechecked under a stricter."""
+    settings.DJANGO_DOCUTILS_LIB_RST = {"allow_unsafe_docutils_settings": True}
+    doctree = publish_doctree("text")
+    doctree += nodes.raw("", "<b>NOPE</b>", format="html")
+    sanitize_doctree(doctree, {"raw_enabled": True})
+    assert list(doctree.findall(nodes.raw))
+
+    settings.DJANGO_DOCUTILS_LIB_RST = {}
+    sanitize_doctree(doctree, skip_if_sanitized=True)
+
+    assert not list(doctree.findall(nodes.raw))
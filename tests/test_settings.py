@@ -6,8 +6,13 @@ import typing as t
 
 import pytest
 from django.test import override_settings
+from docutils.parsers.rst import Parser
 
-from django_docutils.lib.settings import DJANGO_DOCUTILS_LIB_RST, reload_settings
+from django_docutils.lib.settings import (
+    DJANGO_DOCUTILS_LIB_RST,
+    get_docutils_settings_values,
+    reload_settings,
+)
 
 
 class ReloadCase(t.NamedTuple):
@@ -71,3 +76,29 @@ def test_reload_settings_with_self_as_value_preserves_contents() -> None:
     )
 
     assert dict(DJANGO_DOCUTILS_LIB_RST) == before
+
+
+def test_docutils_settings_values_are_private_copies() -> None:
+    """Mutating one publish's settings object never leaks into the next."""
+    overrides = {"strip_classes": ["kept"]}
+    values = get_docutils_settings_values(overrides, components=(Parser,))
+    values.strip_classes.append("leaked")
+    values.tab_width = 99
+
+    fresh = get_docutils_settings_values(overrides, components=(Parser,))
+
+    assert fresh.strip_classes == ["kept"]
+    assert fresh.tab_width != 99
+    assert fresh.record_dependencies is not values.record_dependencies
+
+
+def test_docutils_settings_values_follow_settings_changes(settings: t.Any) -> None:
+    """``reload_settings`` drops memoized settings objects."""
+    assert get_docutils_settings_values(components=(Parser,)).tab_width == 8
+
+    settings.DJANGO_DOCUTILS_LIB_RST = {
+        **settings.DJANGO_DOCUTILS_LIB_RST,
+        "docutils": {"tab_width": 4},
+    }
+
+    assert get_docutils_settings_values(components=(Parser,)).tab_width == 4
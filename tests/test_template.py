@@ -2,9 +2,13 @@
 
 from __future__ import annotations
 
+import os
 import typing as t
 
-from django_docutils.template import DocutilsTemplates
+from django.http import StreamingHttpResponse
+
+import django_docutils.template
+from django_docutils.template import DocutilsTemplate, DocutilsTemplates
 from django_docutils.views import DocutilsView
 
 from .constants import DEFAULT_RST
@@ -13,6 +17,7 @@ if t.TYPE_CHECKING:
     import pathlib
 
     from django.test import RequestFactory
+    from pytest_mock import MockerFixture
 
 
 def test_view(settings: t.Any, tmp_path: pathlib.Path, rf: RequestFactory) -> None:
@@ -83,3 +88,82 @@ def test_render_does_not_mutate_shared_options(rf: RequestFactory) -> None:
 
     assert "world" in html
     assert engine.options == options_before
+
+
+def _make_engine(template_dir: pathlib.Path, **options: object) -> DocutilsTemplates:
+    return DocutilsTemplates(
+        {
+            "NAME": "docutils",
+            "DIRS": [str(template_dir)],
+            "APP_DIRS": False,
+            "OPTIONS": options,
+        },
+    )
+
+
+def test_cached_engine_renders_once(
+    tmp_path: pathlib.Path,
+    mocker: MockerFixture,
+) -> None:
+    """Cached mode reuses the template and its rendered output."""
+    (tmp_path / "home.rst").write_text("Hello **world**", encoding="utf-8")
+    engine = _make_engine(tmp_path, debug=False)
+    spy = mocker.spy(django_docutils.template, "publish_template_html")
+
+    first = engine.get_template("home.rst").render()
+    second = engine.get_template("home.rst").render()
+
+    assert first == second
+    assert "<strong>world</strong>" in first
+    assert spy.call_count == 1
+
+
+def test_cached_engine_rereads_changed_files_in_debug(tmp_path: pathlib.Path) -> None:
+    """In debug mode an edited template is picked up by its mtime."""
+    home_rst = tmp_path / "home.rst"
+    home_rst.write_text("Hello **world**", encoding="utf-8")
+    engine = _make_engine(tmp_path, debug=True)
+    assert "world" in engine.get_template("home.rst").render()
+
+    home_rst.write_text("Bye **world**", encoding="utf-8")
+    mtime_ns = home_rst.stat().st_mtime_ns + 1_000_000_000
+    os.utime(home_rst, ns=(mtime_ns, mtime_ns))
+
+    assert "Bye" in engine.get_template("home.rst").render()
+
+
+def test_uncached_engine_reads_every_time(tmp_path: pathlib.Path) -> None:
+    """``cached=False`` reads the file on every lookup."""
+    home_rst = tmp_path / "home.rst"
+    home_rst.write_text("Hello", encoding="utf-8")
+    engine = _make_engine(tmp_path, cached=False, debug=False)
+    assert "Hello" in engine.get_template("home.rst").render()
+
+    home_rst.write_text("Bye", encoding="utf-8")
+
+    assert "Bye" in engine.get_template("home.rst").render()
+    assert engine.template_cache == {}
+
+
+def test_streaming_view_matches_rendered_view(rf: RequestFactory) -> None:
+    """``stream = True`` sends the same HTML as a StreamingHttpResponse."""
+    view = DocutilsView.as_view(template_name="base.html", rst_name="home.rst")
+    streaming_view = DocutilsView.as_view(
+        template_name="base.html",
+        rst_name="home.rst",
+        stream=True,
+    )
+
+    response = view(rf.get("/"))
+    response.render()  # type:ignore[attr-defined]
+    streaming_response = streaming_view(rf.get("/"))
+
+    assert isinstance(streaming_response, StreamingHttpResponse)
+    assert b"".join(streaming_response.streaming_content) == response.content
+
+
+def test_template_stream_matches_render() -> None:
+    """Joined chunks of ``DocutilsTemplate.stream()`` equal ``render()``."""
+    template = DocutilsTemplate(DEFAULT_RST, {})
+
+    assert "".join(template.stream()) == template.render()
@@ -0,0 +1,44 @@
+"""Tests for django-docutils text helpers."""
+
+from __future__ import annotations
+
+import typing as t
+
+from django_docutils.lib import text
+from django_docutils.lib.text import (
+    is_uncapitalized_word,
+    smart_title,
+    smart_title_many,
+)
+
+if t.TYPE_CHECKING:
+    from pytest_mock import MockerFixture
+
+
+def test_uncapitalized_word_filters_follow_settings(
+    settings: t.Any,
+    mocker: MockerFixture,
+) -> None:
+    """Filters are imported once, and again after settings change."""
+    settings.DJANGO_DOCUTILS_LIB_TEXT = {
+        "uncapitalized_word_filters": ["keyword.iskeyword"],
+    }
+    import_spy = mocker.spy(text, "import_string")
+
+    assert is_uncapitalized_word("if")
+    assert not is_uncapitalized_word("django")
+    assert import_spy.call_count == 1
+
+    settings.DJANGO_DOCUTILS_LIB_TEXT = {"uncapitalized_word_filters": []}
+
+    assert not is_uncapitalized_word("if")
+
+
+def test_smart_title_many() -> None:
+    """Menus title in one call; repeated labels come from the memo."""
+    smart_title.cache_clear()
+
+    titles = smart_title_many(["getting started", "(api) reference"] * 3)
+
+    assert titles == ["Getting Started", "(Api) Reference"] * 3
+    assert smart_title.cache_info().misses == 2